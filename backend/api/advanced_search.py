@@ -4,6 +4,7 @@ from typing import List, Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_
+from sqlalchemy.orm import undefer
 
 from backend.database import get_db
 from backend.models.user import User
@@ -87,6 +88,7 @@ async def generate_query_expansions(
     # Fetch generated candidates
     candidates_result = await db.execute(
         select(QueryExpansionCandidate)
+        .options(undefer(QueryExpansionCandidate.extra_metadata))
         .where(QueryExpansionCandidate.session_id == request.session_id)
         .order_by(QueryExpansionCandidate.score.desc())
         .limit(request.max_candidates)
@@ -3,9 +3,9 @@ import logging
 from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from backend.database import get_db
+from backend.database import get_db, get_read_session_factory
 from backend.schemas.analysis import (
     AnalyzeContentRequest,
     AnalyzeBatchRequest,
@@ -474,6 +474,9 @@ async def get_entities(
 async def get_job_aggregate(
     job_id: int,
     db: Annotated[AsyncSession, Depends(get_db)],
+    read_session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_read_session_factory)
+    ],
     current_user: CurrentUser,
     top_n: int = Query(50, ge=1, le=500, description="Top N items"),
 ) -> JobAggregateResponse:
@@ -486,13 +489,14 @@ async def get_job_aggregate(
     Args:
         job_id: Scraping job ID
         db: Database session
+        read_session_factory: Session factory for the aggregate reads
         current_user: Current authenticated user
         top_n: Number of top items to return
 
     Returns:
         JobAggregateResponse: Aggregated analysis results
     """
-    service = AnalysisService(db)
+    service = AnalysisService(db, session_factory=read_session_factory)
 
     # Verify job exists and belongs to user
     stmt = select(ScrapingJob).where(
@@ -1,12 +1,15 @@
 """Bulk search API endpoints for CSV uploads."""
 import io
+import json
 import logging
 import pandas as pd
+from psycopg.types.json import Jsonb
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 
+from backend.config import settings
 from backend.database import get_db
 from backend.models.user import User
 from backend.models.bulk_search import BulkSearchUpload, BulkSearchRow
@@ -23,6 +26,90 @@ router = APIRouter(prefix="/bulk-search", tags=["bulk-search"])
 logger = logging.getLogger(__name__)
 
 
+def _parse_query_data(row: pd.Series) -> dict:
+    """
+    Build the stored query data for one validated CSV row.
+
+    Args:
+        row: CSV row
+
+    Returns:
+        Query parameters for the row
+    """
+    query_data = {
+        "query": str(row["query"]).strip(),
+        "framing": str(row.get("framing", "neutral")).strip() if "framing" in row else "neutral",
+        "language": str(row.get("language", "en")).strip() if "language" in row else "en",
+        "max_results": int(row.get("max_results", 10)) if "max_results" in row and not pd.isna(row["max_results"]) else 10,
+        "search_engine": str(row.get("search_engine", "google_custom")).strip().lower() if "search_engine" in row else "google_custom",
+    }
+
+    # Parse date fields
+    if "date_from" in row and not pd.isna(row["date_from"]):
+        query_data["date_from"] = str(row["date_from"])
+    if "date_to" in row and not pd.isna(row["date_to"]):
+        query_data["date_to"] = str(row["date_to"])
+
+    # Parse TLD filter
+    if "tld_filter" in row and not pd.isna(row["tld_filter"]):
+        query_data["tld_filter"] = str(row["tld_filter"]).split("|")
+
+    return query_data
+
+
+async def _store_rows(
+    db: AsyncSession, upload_id: int, query_data_rows: List[dict]
+) -> None:
+    """
+    Insert the pending rows of an upload without going through the ORM.
+
+    Row numbers are 1-based positions in ``query_data_rows``. Up to
+    ``bulk_copy_threshold`` rows are sent as one JSON array parameter and
+    expanded server-side, so the statement has two bind parameters no
+    matter how many rows there are (batched VALUES lists run into the
+    65535 bind parameter limit). Larger uploads are streamed with a
+    binary COPY on the session's connection.
+
+    Args:
+        db: Database session
+        upload_id: Upload ID
+        query_data_rows: Parsed query data, in CSV order
+    """
+    if not query_data_rows:
+        return
+
+    # Ingest-only transaction: losing the last few ms of commits on a
+    # server crash just means the user re-uploads the CSV
+    await db.execute(text("SET LOCAL synchronous_commit = off"))
+
+    if len(query_data_rows) <= settings.bulk_copy_threshold:
+        await db.execute(
+            text(
+                "INSERT INTO bulk_search_rows (upload_id, row_number, query_data, status) "
+                "SELECT :upload_id, t.ord, t.value, 'pending' "
+                "FROM jsonb_array_elements(CAST(:rows AS jsonb)) "
+                "WITH ORDINALITY AS t(value, ord)"
+            ),
+            {"upload_id": upload_id, "rows": json.dumps(query_data_rows)},
+        )
+        return
+
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    async with driver_connection.cursor() as cursor:
+        async with cursor.copy(
+            "COPY bulk_search_rows (upload_id, row_number, query_data, status) "
+            "FROM STDIN WITH (FORMAT BINARY)"
+        ) as copy:
+            copy.set_types(["int4", "int4", "jsonb", "text"])
+            for row_number, query_data in enumerate(query_data_rows, start=1):
+                await copy.write_row(
+                    (upload_id, row_number, Jsonb(query_data), "pending")
+                )
+
+
 @router.post("/upload", response_model=BulkSearchValidationResponse)
 async def upload_bulk_search_csv(
     current_user: CurrentUser,
@@ -137,33 +224,8 @@ async def upload_bulk_search_csv(
 
         # Store rows if valid and not validate_only
         if validation_status == "valid" and not validate_only:
-            for idx, row in df.iterrows():
-                # Parse row data
-                query_data = {
-                    "query": str(row["query"]).strip(),
-                    "framing": str(row.get("framing", "neutral")).strip() if "framing" in row else "neutral",
-                    "language": str(row.get("language", "en")).strip() if "language" in row else "en",
-                    "max_results": int(row.get("max_results", 10)) if "max_results" in row and not pd.isna(row["max_results"]) else 10,
-                    "search_engine": str(row.get("search_engine", "google_custom")).strip().lower() if "search_engine" in row else "google_custom",
-                }
-
-                # Parse date fields
-                if "date_from" in row and not pd.isna(row["date_from"]):
-                    query_data["date_from"] = str(row["date_from"])
-                if "date_to" in row and not pd.isna(row["date_to"]):
-                    query_data["date_to"] = str(row["date_to"])
-
-                # Parse TLD filter
-                if "tld_filter" in row and not pd.isna(row["tld_filter"]):
-                    query_data["tld_filter"] = str(row["tld_filter"]).split("|")
-
-                bulk_row = BulkSearchRow(
-                    upload_id=upload.id,
-                    row_number=idx + 1,
-                    query_data=query_data,
-                    status="pending",
-                )
-                db.add(bulk_row)
+            query_data_rows = [_parse_query_data(row) for _, row in df.iterrows()]
+            await _store_rows(db, upload.id, query_data_rows)
 
         await db.commit()
         await db.refresh(upload)
@@ -11,6 +11,7 @@ from backend.database import get_db
 from backend.utils.dependencies import CurrentUser
 from backend.models.user import User
 from backend.services.network_service import NetworkService
+from backend.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
 from backend.schemas.network import (
     NetworkGenerateRequest,
     NetworkResponse,
@@ -146,14 +147,42 @@ async def list_networks(
     per_page: int = Query(20, ge=1, le=100, description="Results per page"),
     type: Optional[str] = Query(None, description="Filter by network type"),
     session_id: Optional[int] = Query(None, description="Filter by session ID"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor of the previous page (replaces page)"
+    ),
 ):
     """
     List networks for the current user.
 
     Supports pagination and filtering by network type or session ID.
+    Following next_cursor pages by keyset, so deep pages cost the same
+    as the first; cursor pages carry no page number or total.
     """
     service = NetworkService(db)
 
+    if cursor is not None:
+        try:
+            position = decode_keyset_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+
+        networks, next_position = await service.list_user_networks_after(
+            user_id=current_user.id,
+            cursor=position,
+            per_page=per_page,
+            network_type=type,
+            session_id=session_id,
+        )
+
+        return NetworkListResponse(
+            per_page=per_page,
+            networks=[NetworkResponse.model_validate(n) for n in networks],
+            next_cursor=encode_keyset_cursor(*next_position) if next_position else None,
+        )
+
     networks, total = await service.list_user_networks(
         user_id=current_user.id,
         page=page,
@@ -162,11 +191,16 @@ async def list_networks(
         session_id=session_id,
     )
 
+    next_cursor = None
+    if networks and page * per_page < total:
+        next_cursor = encode_keyset_cursor(networks[-1].created_at, networks[-1].id)
+
     return NetworkListResponse(
         total=total,
         page=page,
         per_page=per_page,
         networks=[NetworkResponse.model_validate(n) for n in networks],
+        next_cursor=next_cursor,
     )
 
 
@@ -10,6 +10,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.database import get_db
 from backend.models import User, SearchSession, SearchQuery, SearchResult, ScrapingJob
 from backend.models.website import WebsiteContent
+from backend.models.enums import PROCESSING_STATUSES
 from backend.utils.dependencies import CurrentUser
 from urllib.parse import urlparse
 from backend.api.frontend import format_datetime, format_number
@@ -158,7 +159,9 @@ async def get_jobs_partial(
     request: Request,
     current_user: CurrentUser,
     db: AsyncSession = Depends(get_db),
-    status_filter: Optional[str] = Query(None, alias="status"),
+    status_filter: Optional[str] = Query(
+        None, alias="status", pattern="^(" + "|".join(PROCESSING_STATUSES) + ")?$"
+    ),
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
 ):
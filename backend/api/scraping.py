@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.database import get_db
 from backend.models.user import User
+from backend.models.enums import PROCESSING_STATUSES
 from backend.services.scraping_service import ScrapingService
 from backend.schemas.scraping import (
     ScrapingJobCreate,
@@ -180,7 +181,9 @@ async def list_scraping_jobs(
     current_user: CurrentUser,
     db: AsyncSession = Depends(get_db),
     session_id: Optional[int] = Query(None, description="Filter by session ID"),
-    status: Optional[str] = Query(None, description="Filter by status"),
+    status: Optional[str] = Query(
+        None, description="Filter by status", pattern="^(" + "|".join(PROCESSING_STATUSES) + ")?$"
+    ),
     limit: int = Query(50, ge=1, le=100, description="Maximum number of results"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
 ) -> ScrapingJobList:
@@ -3,12 +3,15 @@ import math
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy import select, func
+from sqlalchemy import bindparam, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from backend.database import get_db
+from backend.models.analysis import ExtractedNoun
+from backend.models.scraping import ScrapingJob
 from backend.models.search import SearchSession, SearchQuery
+from backend.models.website import WebsiteContent
 from backend.schemas.search import (
     SearchExecuteRequest,
     SearchExecuteResponse,
@@ -23,6 +26,28 @@ from backend.utils.dependencies import CurrentUser
 
 router = APIRouter(prefix="/search", tags=["search"])
 
+# Per-session counts for the session list, built once at import and
+# executed with a session_id parameter for every listed session
+_count_session_queries = (
+    select(func.count())
+    .select_from(SearchQuery)
+    .where(SearchQuery.session_id == bindparam("session_id"))
+)
+_count_session_scraped = (
+    select(func.count(WebsiteContent.id))
+    .join(ScrapingJob, WebsiteContent.scraping_job_id == ScrapingJob.id)
+    .where(
+        ScrapingJob.session_id == bindparam("session_id"),
+        WebsiteContent.status == 'success'
+    )
+)
+_count_session_analyzed = (
+    select(func.count(func.distinct(ExtractedNoun.website_content_id)))
+    .join(WebsiteContent, ExtractedNoun.website_content_id == WebsiteContent.id)
+    .join(ScrapingJob, WebsiteContent.scraping_job_id == ScrapingJob.id)
+    .where(ScrapingJob.session_id == bindparam("session_id"))
+)
+
 
 @router.post("/execute", response_model=SearchExecuteResponse, status_code=status.HTTP_202_ACCEPTED)
 async def execute_search(
@@ -127,37 +152,18 @@ async def list_sessions(
     # Get query and website counts for each session
     session_responses = []
     for session in sessions:
+        params = {"session_id": session.id}
+
         # Count queries
-        query_count_result = await db.execute(
-            select(func.count())
-            .select_from(SearchQuery)
-            .where(SearchQuery.session_id == session.id)
-        )
+        query_count_result = await db.execute(_count_session_queries, params)
         query_count = query_count_result.scalar() or 0
 
         # Count scraped content from scraping jobs
-        from backend.models.scraping import ScrapingJob
-        from backend.models.website import WebsiteContent
-
-        scraped_count_result = await db.execute(
-            select(func.count(WebsiteContent.id))
-            .join(ScrapingJob, WebsiteContent.scraping_job_id == ScrapingJob.id)
-            .where(
-                ScrapingJob.session_id == session.id,
-                WebsiteContent.status == 'success'
-            )
-        )
+        scraped_count_result = await db.execute(_count_session_scraped, params)
         scraped_count = scraped_count_result.scalar() or 0
 
         # Count analyzed content
-        from backend.models.analysis import ExtractedNoun
-
-        analyzed_count_result = await db.execute(
-            select(func.count(func.distinct(ExtractedNoun.website_content_id)))
-            .join(WebsiteContent, ExtractedNoun.website_content_id == WebsiteContent.id)
-            .join(ScrapingJob, WebsiteContent.scraping_job_id == ScrapingJob.id)
-            .where(ScrapingJob.session_id == session.id)
-        )
+        analyzed_count_result = await db.execute(_count_session_analyzed, params)
         analyzed_count = analyzed_count_result.scalar() or 0
 
         # TODO: Count unique websites (Phase 3)
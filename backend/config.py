@@ -25,11 +25,17 @@ class Settings(BaseSettings):
 
     # Database
     database_url: PostgresDsn
+    database_read_replica_url: Optional[PostgresDsn] = None  # Dashboard aggregates; falls back to database_url
     database_echo: bool = False
     database_pool_size: int = 20  # Increased for better concurrency
-    database_max_overflow: int = 10
-    database_pool_recycle: int = 3600  # Recycle connections after 1 hour
+    database_max_overflow: int = 30  # Burst capacity for API + in-process task sessions
+    database_query_cache_size: int = 1200  # Compiled SQL cache entries per engine
+    database_insertmanyvalues_page_size: int = 1000  # Rows per batched multi-row INSERT
+    database_pool_recycle: int = 1800  # Recycle connections after 30 minutes
     database_pool_pre_ping: bool = True  # Verify connections before use
+    database_jit: bool = False  # PostgreSQL JIT; compile cost outweighs gains on short OLTP queries
+    database_statement_timeout: int = 0  # Milliseconds, 0 = no limit (network builds run long queries)
+    database_prepare_threshold: int = 2  # Executions before psycopg prepares a statement server-side, 0 = never (PgBouncer transaction pooling)
 
     # Redis
     redis_url: RedisDsn
@@ -100,10 +106,14 @@ class Settings(BaseSettings):
     cache_user_preferences_ttl: int = 43200  # 12 hours
     cache_session_list_ttl: int = 300  # 5 minutes
     cache_statistics_ttl: int = 900  # 15 minutes
+    cache_job_aggregates_ttl: int = 300  # 5 minutes, also invalidated on writes
 
     # Performance Settings - Bulk Operations
     bulk_insert_chunk_size: int = 1000  # Records per bulk insert
     bulk_update_chunk_size: int = 1000  # Records per bulk update
+    bulk_copy_threshold: int = 100000  # Rows above which CSV uploads use COPY
+    scraping_progress_flush_pages: int = 25  # Scraped pages per job progress update
+    scraping_progress_flush_interval: float = 5.0  # Max seconds between job progress updates
 
     # Performance Settings - Pagination
     pagination_default_per_page: int = 50
@@ -111,7 +121,24 @@ class Settings(BaseSettings):
 
     # Performance Settings - Query Optimization
     query_slow_threshold: float = 0.1  # Log queries slower than 100ms
+    query_slow_log_flush_interval: float = 10.0  # Seconds per slow query aggregation window
     query_eager_loading: bool = True  # Enable eager loading by default
+    orm_raise_on_lazy_load: bool = False  # Raise on unplanned relationship lazy loads (dev/tests)
+
+    # Health Checks - per-check time limits in seconds
+    health_check_timeout_database: float = 5.0
+    health_check_timeout_redis: float = 2.0
+    health_check_timeout_celery: float = 3.0
+    health_check_timeout_celery_full: float = 5.0  # active/stats inspection; above the broadcast timeout
+    health_check_celery_inspect_timeout: float = 2.0  # Seconds inspect() broadcasts wait for worker replies
+    health_check_timeout_disk: float = 1.0
+    health_check_total_timeout: float = 6.0  # Deadline for a full check_all()
+    health_check_disk_interval: float = 30.0  # Seconds between background disk usage samples
+    # Seconds a check result is reused by concurrent and repeated probes
+    health_check_cache_ttl_database: float = 2.0
+    health_check_cache_ttl_redis: float = 2.0
+    health_check_cache_ttl_celery: float = 10.0
+    health_check_cache_ttl_celery_full: float = 60.0  # active/stats inspection (startup only)
 
     # Performance Settings - Celery Worker
     celery_worker_prefetch_multiplier: int = 4
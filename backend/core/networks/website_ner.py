@@ -20,7 +20,11 @@ from collections import defaultdict
 
 from backend.core.networks.base import NetworkBuilder
 from backend.models.website import WebsiteContent
-from backend.models.analysis import ExtractedEntity
+from backend.models.analysis import (
+    ExtractedEntity,
+    CONFIDENCE_SCALE,
+    scale_confidence,
+)
 from backend.models.scraping import ScrapingJob
 from backend.schemas.analysis import NERExtractionConfig
 
@@ -317,9 +321,12 @@ class WebsiteNERNetworkBuilder(NetworkBuilder):
             )
             .where(ExtractedEntity.label.in_(self.ner_config.entity_types))
             .where(
-                ExtractedEntity.confidence >= self.ner_config.confidence_threshold
+                ExtractedEntity.confidence_x10000
+                >= scale_confidence(self.ner_config.confidence_threshold)
+            )
+            .order_by(
+                (ExtractedEntity.confidence_x10000 * ExtractedEntity.frequency).desc()
             )
-            .order_by((ExtractedEntity.confidence * ExtractedEntity.frequency).desc())
         )
 
         result = await self.session.execute(stmt)
@@ -354,8 +361,17 @@ class WebsiteNERNetworkBuilder(NetworkBuilder):
 
         for domain, content_ids in domain_content_ids.items():
             # Load all entities for this domain's contents with filtering
+            # Column tuples instead of ORM instances: only the aggregated
+            # fields are needed, so skip identity map and object overhead
             stmt = (
-                select(ExtractedEntity)
+                select(
+                    ExtractedEntity.text,
+                    ExtractedEntity.label,
+                    ExtractedEntity.frequency,
+                    ExtractedEntity.confidence_x10000,
+                    ExtractedEntity.language,
+                    ExtractedEntity.extraction_method,
+                )
                 .where(ExtractedEntity.website_content_id.in_(content_ids))
                 .where(
                     ExtractedEntity.extraction_method
@@ -363,12 +379,13 @@ class WebsiteNERNetworkBuilder(NetworkBuilder):
                 )
                 .where(ExtractedEntity.label.in_(self.ner_config.entity_types))
                 .where(
-                    ExtractedEntity.confidence >= self.ner_config.confidence_threshold
+                    ExtractedEntity.confidence_x10000
+                    >= scale_confidence(self.ner_config.confidence_threshold)
                 )
             )
 
             result = await self.session.execute(stmt)
-            entities = list(result.scalars().all())
+            entities = result.tuples().all()
 
             # Aggregate by entity text and label
             entity_stats = defaultdict(
@@ -386,7 +403,9 @@ class WebsiteNERNetworkBuilder(NetworkBuilder):
                 key = (entity.text, entity.label)
                 stats = entity_stats[key]
                 stats["total_frequency"] += entity.frequency
-                stats["total_confidence"] += entity.confidence
+                stats["total_confidence"] += (
+                    entity.confidence_x10000 / CONFIDENCE_SCALE
+                )
                 stats["count"] += 1
                 if stats["language"] is None:
                     stats["language"] = entity.language
@@ -342,14 +342,24 @@ class WebsiteNounNetworkBuilder(NetworkBuilder):
 
         for domain, content_ids in domain_content_ids.items():
             # Load all keywords for this domain's contents with filtering
+            # Column tuples instead of ORM instances: only the aggregated
+            # fields are needed, so skip identity map and object overhead
             stmt = (
-                select(ExtractedKeyword)
+                select(
+                    ExtractedKeyword.lemma,
+                    ExtractedKeyword.frequency,
+                    ExtractedKeyword.tfidf_score,
+                    ExtractedKeyword.language,
+                    ExtractedKeyword.extraction_method,
+                    ExtractedKeyword.phrase_length,
+                    ExtractedKeyword.pos_tag,
+                )
                 .where(ExtractedKeyword.website_content_id.in_(content_ids))
                 .where(ExtractedKeyword.extraction_method == self.keyword_config.method)
             )
 
             result = await self.session.execute(stmt)
-            keywords = list(result.scalars().all())
+            keywords = result.tuples().all()
 
             # Aggregate by lemma
             lemma_stats = defaultdict(
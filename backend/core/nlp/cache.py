@@ -2,7 +2,7 @@
 import asyncio
 import json
 import logging
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable
 import redis.asyncio as redis
 
 from backend.config import settings
@@ -225,6 +225,106 @@ class AnalysisCache:
             logger.error(f"Error caching entities: {e}")
             return False
 
+    def _job_key(self, job_id: int) -> str:
+        """
+        Create the cache key holding a scraping job's aggregates.
+
+        All aggregates of a job live in one hash (fields like
+        "nouns:50"), so invalidating a job is a single DEL.
+
+        Args:
+            job_id: Scraping job ID
+
+        Returns:
+            Cache key string
+        """
+        return f"analysis:job:{job_id}"
+
+    async def get_cached_job_aggregate(
+        self, job_id: int, kind: str, top_n: int
+    ) -> Optional[list]:
+        """
+        Get cached aggregated rows for a scraping job.
+
+        Args:
+            job_id: Scraping job ID
+            kind: Aggregate kind ("nouns" or "entities")
+            top_n: Number of top items the rows were computed for
+
+        Returns:
+            List of aggregate dictionaries or None if not cached
+        """
+        try:
+            redis_client = await self._get_redis()
+
+            cached_data = await redis_client.hget(
+                self._job_key(job_id), f"{kind}:{top_n}"
+            )
+            if cached_data:
+                logger.debug(f"Cache hit for job {kind}: job_id={job_id}")
+                return json.loads(cached_data)
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Error getting cached job aggregate: {e}")
+            return None
+
+    async def cache_job_aggregate(
+        self, job_id: int, kind: str, top_n: int, rows: list
+    ) -> bool:
+        """
+        Cache aggregated rows for a scraping job.
+
+        Args:
+            job_id: Scraping job ID
+            kind: Aggregate kind ("nouns" or "entities")
+            top_n: Number of top items the rows were computed for
+            rows: List of aggregate dictionaries
+
+        Returns:
+            True if cached successfully, False otherwise
+        """
+        try:
+            redis_client = await self._get_redis()
+            key = self._job_key(job_id)
+
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hset(key, f"{kind}:{top_n}", json.dumps(rows, default=str))
+                pipe.expire(key, settings.cache_job_aggregates_ttl)
+                await pipe.execute()
+
+            logger.debug(f"Cached {len(rows)} {kind} for job_id={job_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error caching job aggregate: {e}")
+            return False
+
+    async def invalidate_job_aggregates(self, job_ids: Iterable[Optional[int]]) -> int:
+        """
+        Invalidate cached aggregates for scraping jobs.
+
+        Args:
+            job_ids: Scraping job IDs (None entries are ignored)
+
+        Returns:
+            Number of cache entries deleted
+        """
+        keys_to_delete = {
+            self._job_key(job_id) for job_id in job_ids if job_id is not None
+        }
+        if not keys_to_delete:
+            return 0
+
+        try:
+            redis_client = await self._get_redis()
+            return await redis_client.delete(*keys_to_delete)
+
+        except Exception as e:
+            logger.error(f"Error invalidating job aggregates: {e}")
+            return 0
+
     async def invalidate_analysis(self, content_id: int) -> bool:
         """
         Invalidate all cached data for a content.
@@ -1,6 +1,9 @@
 """Database connection and session management."""
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
+import orjson
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
@@ -8,28 +11,131 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import declarative_base
 from backend.config import settings
 
+
+def server_options() -> str:
+    """
+    Build the libpq ``options`` string sent on every new connection.
+
+    Setting these at connect time costs nothing per query, unlike a
+    ``SET`` at the start of each session.
+
+    Returns:
+        Space-separated ``-c name=value`` server settings
+    """
+    options = [
+        "-c application_name=issue_observatory",
+        f"-c jit={'on' if settings.database_jit else 'off'}",
+    ]
+    if settings.database_statement_timeout:
+        options.append(f"-c statement_timeout={settings.database_statement_timeout}")
+    return " ".join(options)
+
+
+def prepare_threshold() -> Optional[int]:
+    """
+    psycopg ``prepare_threshold`` connect argument.
+
+    Statements executed this many times on a connection are prepared
+    server-side, so hot statement shapes skip parsing and planning.
+
+    Returns:
+        Threshold, or None to never prepare (DATABASE_PREPARE_THRESHOLD=0)
+    """
+    return settings.database_prepare_threshold or None
+
+
+def json_serializer(value: Any) -> str:
+    """
+    Serialize a JSON/JSONB column value with orjson.
+
+    Faster than the stdlib json default and handles datetimes and numpy
+    values (common in network metadata and backboning statistics)
+    natively. Non-string dict keys are stringified as json.dumps does.
+
+    Args:
+        value: Column value
+
+    Returns:
+        JSON text
+    """
+    return orjson.dumps(
+        value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
+
+def _psycopg_url(url: Any) -> str:
+    """
+    Normalize a PostgreSQL URL to the psycopg (v3) driver.
+
+    Args:
+        url: Database URL
+
+    Returns:
+        URL using the postgresql+psycopg:// scheme
+    """
+    url = str(url)
+    if "postgresql://" in url and "+psycopg" not in url:
+        url = url.replace("postgresql://", "postgresql+psycopg://")
+    return url
+
+
+def _create_engine(url: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    """
+    Create an async engine with the application's pool and driver settings.
+
+    Args:
+        url: psycopg database URL
+        pool_size: Persistent connections in the pool
+        max_overflow: Extra connections allowed under burst load
+
+    Returns:
+        Async engine
+    """
+    return create_async_engine(
+        url,
+        echo=settings.database_echo,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        pool_recycle=settings.database_pool_recycle,
+        query_cache_size=settings.database_query_cache_size,
+        insertmanyvalues_page_size=settings.database_insertmanyvalues_page_size,
+        json_serializer=json_serializer,
+        json_deserializer=orjson.loads,
+        # Performance optimizations
+        pool_use_lifo=True,  # Use LIFO for better connection reuse
+        connect_args={
+            # psycopg3 uses 'options' for server settings, not 'server_settings'
+            "options": server_options(),
+            "connect_timeout": 60,
+            "prepare_threshold": prepare_threshold(),
+        },
+    )
+
+
 # Create async engine with psycopg
 # Note: psycopg URL should use postgresql+psycopg:// scheme
-database_url = str(settings.database_url)
-if "postgresql://" in database_url and "+psycopg" not in database_url:
-    database_url = database_url.replace("postgresql://", "postgresql+psycopg://")
+database_url = _psycopg_url(settings.database_url)
 
-engine = create_async_engine(
+engine = _create_engine(
     database_url,
-    echo=settings.database_echo,
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
-    pool_pre_ping=settings.database_pool_pre_ping,
-    pool_recycle=settings.database_pool_recycle,
-    # Performance optimizations
-    pool_use_lifo=True,  # Use LIFO for better connection reuse
-    connect_args={
-        # psycopg3 uses 'options' for server settings, not 'server_settings'
-        "options": "-c application_name=issue_observatory",
-        "connect_timeout": 60,
-    },
 )
 
+# Engine for heavy read-only queries (job aggregate dashboards). With a
+# replica configured these get their own pool on the replica and can't
+# hold connections the analysis pipeline needs for writes; otherwise
+# they share the primary engine. Replica lag is fine for dashboards.
+if settings.database_read_replica_url:
+    read_replica_engine = _create_engine(
+        _psycopg_url(settings.database_read_replica_url),
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+    )
+else:
+    read_replica_engine = engine
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -39,9 +145,40 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
+# Session factory for read-only queries routed to the replica
+ReadSessionLocal = async_sessionmaker(
+    read_replica_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autocommit=False,
+    autoflush=False,
+)
+
 # Create declarative base
 Base = declarative_base()
 
+# Loader strategy for relationships that are only loaded on request via
+# selectinload()/joinedload() at the query site. With
+# ORM_RAISE_ON_LAZY_LOAD enabled (dev/tests) an unplanned lazy load
+# raises instead of silently emitting one SELECT per parent row.
+LAZY_LOAD = "raise_on_sql" if settings.orm_raise_on_lazy_load else "select"
+
+
+def utcnow():
+    """
+    SQL expression for the current UTC time as a naive timestamp.
+
+    Used as ``server_default``/``onupdate`` for timestamp columns so the
+    database fills them in instead of a Python ``datetime.utcnow`` call
+    per row. Models using it set ``eager_defaults`` so the generated
+    values come back via RETURNING (async sessions cannot lazy-load
+    expired attributes).
+
+    Returns:
+        SQL function expression
+    """
+    return func.timezone("UTC", func.now())
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -61,6 +198,35 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_read_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    Dependency that provides the session factory for read-only queries.
+
+    Tests overriding get_db should override this as well, otherwise
+    aggregate reads go through a separate real engine.
+
+    Returns:
+        async_sessionmaker: Factory bound to the read replica, if configured
+    """
+    return ReadSessionLocal
+
+
+def reads_from_replica(session_factory: async_sessionmaker[AsyncSession]) -> bool:
+    """
+    Whether sessions from a factory read from the (lagging) read replica.
+
+    Args:
+        session_factory: Session factory to check
+
+    Returns:
+        True if the factory is bound to a separate read replica engine
+    """
+    return (
+        read_replica_engine is not engine
+        and session_factory.kw.get("bind") is read_replica_engine
+    )
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
@@ -70,3 +236,5 @@ async def init_db() -> None:
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
+    if read_replica_engine is not engine:
+        await read_replica_engine.dispose()
@@ -5,16 +5,29 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from backend.config import settings
 from backend.database import init_db, close_db, engine
 from backend.core.cache.redis_cache import close_redis
-from backend.middleware import setup_rate_limiting, setup_db_profiler
+from backend.middleware import (
+    setup_rate_limiting,
+    setup_db_profiler,
+    shutdown_db_profiler,
+    init_rate_limit_headers,
+    close_rate_limit_headers,
+)
 from backend.middleware.error_handler import setup_exception_handlers
 from backend.monitoring.metrics import setup_metrics, get_metrics, get_metrics_content_type
-from backend.monitoring.health import HealthCheck, liveness_check, readiness_check, startup_check
+from backend.monitoring.health import (
+    HealthCheck,
+    liveness_check,
+    readiness_check,
+    startup_check,
+    start_disk_sampler,
+    stop_disk_sampler,
+)
 from backend.api import auth, admin, search, scraping, analysis, networks, frontend, partials
 
 
@@ -32,9 +45,24 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     if settings.query_slow_threshold > 0:
         setup_db_profiler(engine)
 
+    # Register rate limit headers script (one Redis RTT per request)
+    if settings.rate_limit_enabled:
+        await init_rate_limit_headers(app)
+
+    # Sample disk usage in the background for the health checks
+    start_disk_sampler()
+
     yield
 
+    await stop_disk_sampler()
+
     # Shutdown
+    if settings.rate_limit_enabled:
+        await close_rate_limit_headers(app)
+
+    if settings.query_slow_threshold > 0:
+        await shutdown_db_profiler()
+
     await close_db()
     await close_redis()
 
@@ -48,6 +76,8 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    # Render JSON bodies with orjson instead of json.dumps
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -161,10 +191,14 @@ async def health_detail() -> dict:
 
 
 @app.get("/metrics")
-async def metrics() -> Response:
+def metrics() -> Response:
     """
     Prometheus metrics endpoint.
 
+    A plain def so FastAPI runs it in the threadpool: collectors do
+    blocking I/O at scrape time (Redis INFO) and must not stall the
+    event loop.
+
     Returns:
         Metrics in Prometheus text format
     """
@@ -1,9 +1,17 @@
 """Middleware components for performance and monitoring."""
-from backend.middleware.rate_limit import limiter, setup_rate_limiting
-from backend.middleware.db_profiler import setup_db_profiler
+from backend.middleware.rate_limit import (
+    limiter,
+    setup_rate_limiting,
+    init_rate_limit_headers,
+    close_rate_limit_headers,
+)
+from backend.middleware.db_profiler import setup_db_profiler, shutdown_db_profiler
 
 __all__ = [
     "limiter",
     "setup_rate_limiting",
+    "init_rate_limit_headers",
+    "close_rate_limit_headers",
     "setup_db_profiler",
+    "shutdown_db_profiler",
 ]
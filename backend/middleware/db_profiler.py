@@ -1,6 +1,9 @@
 """Database query profiler for slow query logging."""
+import asyncio
 import time
 import logging
+import zlib
+from typing import Any, Dict, List, Optional
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.asyncio import AsyncEngine
@@ -8,6 +11,135 @@ from backend.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct statement templates tracked per flush window
+MAX_SLOW_QUERY_TEMPLATES = 1024
+
+# Maximum number of durations kept per template for percentiles
+MAX_SLOW_QUERY_SAMPLES = 1000
+
+
+class _SlowQueryStats:
+    """Aggregated timings for one statement template within a flush window."""
+
+    __slots__ = ("count", "total_ns", "max_ns", "samples", "parameters")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples: List[int] = []
+        self.parameters: Any = None
+
+    def add(self, duration_ns: int, parameters: Any) -> None:
+        """Record one execution."""
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        if len(self.samples) < MAX_SLOW_QUERY_SAMPLES:
+            self.samples.append(duration_ns)
+        self.parameters = parameters
+
+
+# Slow query stats keyed by statement template. SQLAlchemy emits
+# parametrized SQL, so the statement text is already the template and
+# repeated executions share the same (cached-hash) string.
+_slow_queries: Dict[str, _SlowQueryStats] = {}
+
+# Executions not tracked because MAX_SLOW_QUERY_TEMPLATES was reached
+_dropped_slow_queries = 0
+
+# Background task flushing _slow_queries
+_flush_task: Optional[asyncio.Task] = None
+
+
+def _percentile(sorted_samples: List[int], percent: float) -> int:
+    """
+    Nearest-rank percentile of pre-sorted samples.
+
+    Args:
+        sorted_samples: Durations sorted ascending
+        percent: Percentile (0-100)
+
+    Returns:
+        Duration at the percentile
+    """
+    index = max(0, int(round(percent / 100 * len(sorted_samples))) - 1)
+    return sorted_samples[index]
+
+
+def _template_id(statement: str) -> str:
+    """
+    Stable short id for a statement template.
+
+    Args:
+        statement: SQL statement
+
+    Returns:
+        8-character hex id
+    """
+    return f"{zlib.crc32(statement.encode()):08x}"
+
+
+def _flush_slow_queries() -> None:
+    """
+    Log aggregated slow query stats for the current window and reset.
+
+    Emits one line per statement template with count, avg, p50, p95 and
+    max, so repeated slow executions of the same SQL cost one log line
+    per window and each statement is cleaned up once.
+    """
+    global _slow_queries, _dropped_slow_queries
+
+    if not _slow_queries:
+        return
+
+    window, _slow_queries = _slow_queries, {}
+    dropped, _dropped_slow_queries = _dropped_slow_queries, 0
+
+    lines = []
+    for statement, stats in sorted(
+        window.items(), key=lambda item: item[1].total_ns, reverse=True
+    ):
+        template_id = _template_id(statement)
+
+        # Clean up statement for logging
+        clean_statement = " ".join(statement.split())
+        if len(clean_statement) > 200:
+            clean_statement = clean_statement[:200] + "..."
+
+        samples = sorted(stats.samples)
+        lines.append(
+            f"SLOW QUERY template={template_id} count={stats.count} "
+            f"total={stats.total_ns / 1e9:.3f}s "
+            f"avg={stats.total_ns / stats.count / 1e9:.3f}s "
+            f"p50={_percentile(samples, 50) / 1e9:.3f}s "
+            f"p95={_percentile(samples, 95) / 1e9:.3f}s "
+            f"max={stats.max_ns / 1e9:.3f}s: {clean_statement}"
+        )
+
+        # In debug mode, log full query and last parameters
+        if settings.debug:
+            logger.debug(
+                f"Full query (template={template_id}): {statement}\n"
+                f"Parameters: {stats.parameters}"
+            )
+
+    if dropped:
+        lines.append(
+            f"SLOW QUERY {dropped} executions not tracked "
+            f"(more than {MAX_SLOW_QUERY_TEMPLATES} templates)"
+        )
+
+    logger.warning("\n".join(lines))
+
+
+async def _flush_slow_queries_periodically() -> None:
+    """Flush slow query stats every flush interval."""
+    while True:
+        await asyncio.sleep(settings.query_slow_log_flush_interval)
+        _flush_slow_queries()
+
 
 def setup_db_profiler(engine: AsyncEngine) -> None:
     """
@@ -16,47 +148,71 @@ def setup_db_profiler(engine: AsyncEngine) -> None:
     Logs slow queries (> threshold) with timing information.
     Helps identify performance bottlenecks.
 
+    Slow queries are aggregated per statement template by the cursor
+    callback and logged by a background task once per flush window, so
+    a burst of slow queries doesn't turn into one log write per query.
+
+    Must be called from a running event loop (application lifespan).
+
     Args:
         engine: SQLAlchemy async engine
     """
+    global _flush_task
+
+    threshold_ns = int(settings.query_slow_threshold * 1e9)
 
     @event.listens_for(engine.sync_engine, "before_cursor_execute")
     def before_cursor_execute(
         conn, cursor, statement, parameters, context, executemany
     ):
         """Record query start time."""
-        conn.info.setdefault("query_start_time", []).append(time.time())
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter_ns())
 
     @event.listens_for(engine.sync_engine, "after_cursor_execute")
     def after_cursor_execute(
         conn, cursor, statement, parameters, context, executemany
     ):
         """
-        Log slow queries.
+        Aggregate slow queries.
 
-        Calculates query execution time and logs queries that exceed
-        the slow threshold.
+        Calculates query execution time and adds queries that exceed
+        the slow threshold to their template's stats. Formatting is
+        left to the flush task.
         """
-        total = time.time() - conn.info["query_start_time"].pop()
+        global _dropped_slow_queries
 
-        if total > settings.query_slow_threshold:
-            # Clean up statement for logging
-            clean_statement = " ".join(statement.split())
-            if len(clean_statement) > 200:
-                clean_statement = clean_statement[:200] + "..."
+        total = time.perf_counter_ns() - conn.info["query_start_time"].pop()
 
-            logger.warning(
-                f"SLOW QUERY ({total:.3f}s): {clean_statement}"
-            )
+        if total > threshold_ns:
+            stats = _slow_queries.get(statement)
+            if stats is None:
+                if len(_slow_queries) >= MAX_SLOW_QUERY_TEMPLATES:
+                    _dropped_slow_queries += 1
+                    return
+                stats = _slow_queries[statement] = _SlowQueryStats()
+            stats.add(total, parameters if settings.debug else None)
 
-            # In debug mode, log full query and parameters
-            if settings.debug:
-                logger.debug(
-                    f"Full query: {statement}\n"
-                    f"Parameters: {parameters}"
-                )
+    if _flush_task is None:
+        _flush_task = asyncio.get_running_loop().create_task(
+            _flush_slow_queries_periodically()
+        )
 
     logger.info(
         f"Database profiler enabled "
         f"(slow query threshold: {settings.query_slow_threshold}s)"
     )
+
+
+async def shutdown_db_profiler() -> None:
+    """Stop the flush task and log any remaining slow query stats."""
+    global _flush_task
+
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+
+    _flush_slow_queries()
@@ -1,14 +1,37 @@
 """Rate limiting middleware using slowapi."""
 import logging
-from typing import Callable
+import time
+from typing import Callable, Optional
+import redis.asyncio as redis
+from redis.exceptions import NoScriptError
 from fastapi import FastAPI, Request, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
+from starlette.concurrency import run_in_threadpool
 from backend.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Fixed-window counter for the rate limit headers.
+# Increments the window counter, starts the window on the first hit and
+# returns [limit, remaining, reset_ms] so the headers cost a single RTT.
+RATE_LIMIT_HEADERS_SCRIPT = """
+local current = redis.call('INCR', KEYS[1])
+if current == 1 then
+    redis.call('PEXPIRE', KEYS[1], ARGV[2])
+end
+local ttl = redis.call('PTTL', KEYS[1])
+local limit = tonumber(ARGV[1])
+local remaining = limit - current
+if remaining < 0 then
+    remaining = 0
+end
+return {limit, remaining, ttl}
+"""
+
+RATE_LIMIT_WINDOW_MS = 60 * 1000
+
 
 def get_identifier(request: Request) -> str:
     """
@@ -43,6 +66,91 @@ limiter = Limiter(
 )
 
 
+async def init_rate_limit_headers(app: FastAPI) -> None:
+    """
+    Register the rate limit headers script with Redis.
+
+    Creates an async Redis client and loads the Lua script once,
+    storing the client and script SHA on ``app.state``. If Redis is
+    unavailable, the header middleware falls back to slowapi.
+
+    Args:
+        app: FastAPI application instance
+    """
+    app.state.rate_limit_redis = None
+    app.state.rate_limit_script_sha = None
+
+    try:
+        client = redis.from_url(str(settings.redis_url))
+        app.state.rate_limit_script_sha = await client.script_load(
+            RATE_LIMIT_HEADERS_SCRIPT
+        )
+        app.state.rate_limit_redis = client
+    except Exception as e:
+        logger.warning(f"Failed to register rate limit headers script: {e}")
+
+
+async def close_rate_limit_headers(app: FastAPI) -> None:
+    """
+    Close the Redis client used for rate limit headers.
+
+    Args:
+        app: FastAPI application instance
+    """
+    client: Optional[redis.Redis] = getattr(app.state, "rate_limit_redis", None)
+    if client is not None:
+        await client.close()
+        app.state.rate_limit_redis = None
+
+
+async def _get_window_stats(request: Request) -> Optional[tuple[int, int, int]]:
+    """
+    Count the request and read its window stats in one Redis round-trip.
+
+    Args:
+        request: FastAPI request
+
+    Returns:
+        Tuple of (limit, remaining, reset timestamp) or None
+    """
+    app_state = request.app.state
+    limit_key = limiter.key_func(request)
+    client: Optional[redis.Redis] = getattr(app_state, "rate_limit_redis", None)
+    sha: Optional[str] = getattr(app_state, "rate_limit_script_sha", None)
+
+    if client is not None and sha is not None:
+        try:
+            limit, remaining, reset_ms = await client.evalsha(
+                sha,
+                1,
+                f"LIMITER/headers/{limit_key}",
+                settings.rate_limit_per_minute,
+                RATE_LIMIT_WINDOW_MS,
+            )
+            return limit, remaining, int(time.time() + reset_ms / 1000)
+        except NoScriptError:
+            # Script cache was flushed (e.g. Redis restart); reload it for
+            # the next request and answer this one through slowapi.
+            app_state.rate_limit_script_sha = await client.script_load(
+                RATE_LIMIT_HEADERS_SCRIPT
+            )
+
+    # Fallback: slowapi's storage uses a synchronous Redis client
+    limit_info = await run_in_threadpool(
+        limiter.limiter.get_window_stats,
+        limit_key,
+        f"{settings.rate_limit_per_minute}/minute",
+    )
+    if not limit_info:
+        return None
+
+    return (
+        settings.rate_limit_per_minute,
+        limit_info.remaining,
+        int(limit_info.reset_time),
+    )
+
+
 def setup_rate_limiting(app: FastAPI) -> None:
     """
     Configure rate limiting for FastAPI app.
@@ -77,24 +185,15 @@ def setup_rate_limiting(app: FastAPI) -> None:
         """
         response = await call_next(request)
 
-        # Get rate limit info from limiter
+        # Get rate limit info (single pipelined Redis call)
         try:
-            limit_key = limiter.key_func(request)
-            limit_info = limiter.limiter.get_window_stats(
-                limit_key,
-                f"{settings.rate_limit_per_minute}/minute"
-            )
+            window_stats = await _get_window_stats(request)
 
-            if limit_info:
-                response.headers["X-RateLimit-Limit"] = str(
-                    settings.rate_limit_per_minute
-                )
-                response.headers["X-RateLimit-Remaining"] = str(
-                    limit_info.remaining
-                )
-                response.headers["X-RateLimit-Reset"] = str(
-                    limit_info.reset_time
-                )
+            if window_stats:
+                limit, remaining, reset_time = window_stats
+                response.headers["X-RateLimit-Limit"] = str(limit)
+                response.headers["X-RateLimit-Remaining"] = str(remaining)
+                response.headers["X-RateLimit-Reset"] = str(reset_time)
         except Exception as e:
             logger.debug(f"Failed to add rate limit headers: {e}")
 
@@ -1,10 +1,15 @@
 """Database models."""
 from backend.models.user import User
 from backend.models.search import SearchSession, SearchQuery, SearchResult
-from backend.models.website import Website, WebsiteContent
-from backend.models.network import NetworkExport
+from backend.models.website import Website, WebsiteContent, WebsiteOutboundLink
+from backend.models.network import NetworkExport, NetworkExportSession
 from backend.models.scraping import ScrapingJob
-from backend.models.analysis import ExtractedNoun, ExtractedEntity, ContentAnalysis
+from backend.models.analysis import (
+    ExtractedNoun,
+    ExtractedEntity,
+    ContentAnalysis,
+    NounJobAggregate,
+)
 
 __all__ = [
     "User",
@@ -13,9 +18,12 @@ __all__ = [
     "SearchResult",
     "Website",
     "WebsiteContent",
+    "WebsiteOutboundLink",
     "NetworkExport",
+    "NetworkExportSession",
     "ScrapingJob",
     "ExtractedNoun",
     "ExtractedEntity",
     "ContentAnalysis",
+    "NounJobAggregate",
 ]
@@ -1,14 +1,86 @@
 """Analysis models for storing NLP processing results."""
+import sys
+from array import array
 from datetime import datetime
-from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, Float, Boolean
+from typing import TYPE_CHECKING, Iterable
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    Float,
+    Boolean,
+    Identity,
+    Index,
+    LargeBinary,
+    text,
+)
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
 
 if TYPE_CHECKING:
     from backend.models.website import WebsiteContent
 
 
+def pack_positions(positions: Iterable[int]) -> bytes:
+    """
+    Pack character positions into big-endian uint32 bytes.
+
+    Big-endian matches PostgreSQL's int4send(), so existing rows can be
+    converted server-side.
+
+    Args:
+        positions: Character offsets
+
+    Returns:
+        Packed positions
+    """
+    packed = array("I", positions)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed.tobytes()
+
+
+def unpack_positions(blob: bytes | None) -> list[int]:
+    """
+    Unpack positions packed by pack_positions().
+
+    Args:
+        blob: Packed positions
+
+    Returns:
+        List of character offsets
+    """
+    if not blob:
+        return []
+    unpacked = array("I")
+    unpacked.frombytes(blob)
+    if sys.byteorder == "little":
+        unpacked.byteswap()
+    return unpacked.tolist()
+
+
+# Entity confidence is stored as a SMALLINT scaled by this factor
+CONFIDENCE_SCALE = 10_000
+
+
+def scale_confidence(confidence: float) -> int:
+    """
+    Convert a 0.0-1.0 confidence to its stored SMALLINT value.
+
+    Args:
+        confidence: Confidence score
+
+    Returns:
+        Scaled confidence
+    """
+    return round(confidence * CONFIDENCE_SCALE)
+
+
 class ExtractedNoun(Base):
     """
     Extracted keywords from website content (formerly nouns-only).
@@ -24,10 +96,34 @@ class ExtractedNoun(Base):
     """
 
     __tablename__ = "extracted_nouns"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Keywords for a content filtered by method
+        Index(
+            "ix_extracted_nouns_content_method",
+            "website_content_id",
+            "extraction_method",
+        ),
+        # Top-N keywords for a content (btree scanned backwards for DESC)
+        Index(
+            "ix_extracted_nouns_content_tfidf",
+            "website_content_id",
+            "tfidf_score",
+        ),
+        # Top-N keywords per language and method
+        Index(
+            "ix_extracted_nouns_lang_method_score",
+            "language",
+            "extraction_method",
+            "tfidf_score",
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False), primary_key=True, index=True
+    )
     website_content_id: Mapped[int] = mapped_column(
-        Integer,
+        BigInteger,
         ForeignKey("website_content.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -35,7 +131,7 @@ class ExtractedNoun(Base):
 
     # Keyword information
     word: Mapped[str] = mapped_column(
-        String(255), nullable=False, index=True
+        String(255), nullable=False
     )  # Original word or phrase
     lemma: Mapped[str] = mapped_column(
         String(255), nullable=False, index=True
@@ -45,12 +141,14 @@ class ExtractedNoun(Base):
         Float, nullable=False, index=True
     )  # TF-IDF or other importance score
 
-    # Position data (stored as JSON array of integers)
-    positions: Mapped[list] = mapped_column(JSON, nullable=False)
+    # Position data (packed big-endian uint32, see pack_positions)
+    positions_blob: Mapped[bytes] = mapped_column(
+        LargeBinary, nullable=False, default=b""
+    )
 
     # Language of the analysis
     language: Mapped[str] = mapped_column(
-        String(10), nullable=False, index=True
+        String(10), nullable=False
     )  # ISO 639-1 code
 
     # v6.0.0: New fields for enhanced extraction methods
@@ -77,16 +175,30 @@ class ExtractedNoun(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False, index=True
     )
 
     # Relationships
     website_content: Mapped["WebsiteContent"] = relationship(
-        "WebsiteContent", back_populates="extracted_nouns"
+        "WebsiteContent", back_populates="extracted_nouns", lazy=LAZY_LOAD
     )
 
+    @property
+    def positions(self) -> list[int]:
+        """Character positions of the keyword in the text."""
+        return unpack_positions(self.positions_blob)
+
+    @positions.setter
+    def positions(self, value: Iterable[int]) -> None:
+        """Pack character positions into positions_blob."""
+        self.positions_blob = pack_positions(value)
+
     def __repr__(self) -> str:
-        """String representation of ExtractedNoun (Keyword)."""
+        """Short string representation of ExtractedNoun (Keyword)."""
+        return f"<ExtractedNoun(id={self.id})>"
+
+    def long_repr(self) -> str:
+        """Detailed string representation, for explicit debugging."""
         return (
             f"<ExtractedNoun(id={self.id}, lemma='{self.lemma}', "
             f"method='{self.extraction_method}', "
@@ -111,10 +223,29 @@ class ExtractedEntity(Base):
     """
 
     __tablename__ = "extracted_entities"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Entities for a content filtered by type; text is included so
+        # the per-job entity aggregates run as index-only scans
+        Index(
+            "ix_extracted_entities_content_label_text",
+            "website_content_id",
+            "label",
+            postgresql_include=["text"],
+        ),
+        # Entities for a content above a confidence threshold
+        Index(
+            "ix_extracted_entities_content_confidence",
+            "website_content_id",
+            "confidence_x10000",
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False), primary_key=True, index=True
+    )
     website_content_id: Mapped[int] = mapped_column(
-        Integer,
+        BigInteger,
         ForeignKey("website_content.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -133,9 +264,9 @@ class ExtractedEntity(Base):
     end_pos: Mapped[int] = mapped_column(Integer, nullable=False)  # Character end
 
     # Confidence score (now required for v6.0.0)
-    confidence: Mapped[float] = mapped_column(
-        Float, nullable=False, default=1.0, index=True
-    )  # 0.0-1.0
+    confidence_x10000: Mapped[int] = mapped_column(
+        SmallInteger, nullable=False, default=CONFIDENCE_SCALE, index=True
+    )  # 0-10000, see confidence
 
     # v6.0.0: Frequency tracking for aggregated entities
     frequency: Mapped[int] = mapped_column(
@@ -159,16 +290,34 @@ class ExtractedEntity(Base):
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False, index=True
     )
 
     # Relationships
     website_content: Mapped["WebsiteContent"] = relationship(
-        "WebsiteContent", back_populates="extracted_entities"
+        "WebsiteContent", back_populates="extracted_entities", lazy=LAZY_LOAD
     )
 
+    @hybrid_property
+    def confidence(self) -> float:
+        """Confidence score (0.0-1.0)."""
+        return self.confidence_x10000 / CONFIDENCE_SCALE
+
+    @confidence.inplace.setter
+    def _confidence_setter(self, value: float) -> None:
+        self.confidence_x10000 = scale_confidence(value)
+
+    @confidence.inplace.expression
+    @classmethod
+    def _confidence_expression(cls):
+        return cls.confidence_x10000 / float(CONFIDENCE_SCALE)
+
     def __repr__(self) -> str:
-        """String representation of ExtractedEntity."""
+        """Short string representation of ExtractedEntity."""
+        return f"<ExtractedEntity(id={self.id})>"
+
+    def long_repr(self) -> str:
+        """Detailed string representation, for explicit debugging."""
         return (
             f"<ExtractedEntity(id={self.id}, text='{self.text}', "
             f"label='{self.label}', method='{self.extraction_method}', "
@@ -185,10 +334,13 @@ class ContentAnalysis(Base):
     """
 
     __tablename__ = "content_analysis"
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(
+        Integer, Identity(always=False), primary_key=True, index=True
+    )
     website_content_id: Mapped[int] = mapped_column(
-        Integer,
+        BigInteger,
         ForeignKey("website_content.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
@@ -222,18 +374,18 @@ class ContentAnalysis(Base):
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False, index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
     # Relationships
     website_content: Mapped["WebsiteContent"] = relationship(
-        "WebsiteContent", back_populates="analysis"
+        "WebsiteContent", back_populates="analysis", lazy=LAZY_LOAD
     )
 
     def __repr__(self) -> str:
@@ -242,3 +394,42 @@ class ContentAnalysis(Base):
             f"<ContentAnalysis(id={self.id}, content_id={self.website_content_id}, "
             f"status='{self.status}')>"
         )
+
+
+class NounJobAggregate(Base):
+    """
+    Per-job noun rollup (top lemmas of a scraping job).
+
+    Recomputed for a job by AnalysisRepository.refresh_noun_job_aggregates
+    in the same transaction as every write to that job's nouns, so reads
+    are an index scan on (scraping_job_id, total_frequency DESC) and never
+    lag behind the committed nouns.
+    """
+
+    __tablename__ = "noun_job_agg"
+    __table_args__ = (
+        # Top nouns of a job
+        Index(
+            "ix_noun_job_agg_job_frequency",
+            "scraping_job_id",
+            text("total_frequency DESC"),
+        ),
+    )
+
+    scraping_job_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("scraping_jobs.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    lemma: Mapped[str] = mapped_column(String(255), primary_key=True)
+    total_frequency: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    avg_tfidf_score: Mapped[float] = mapped_column(Float, nullable=False)
+    content_count: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    example_word: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of NounJobAggregate."""
+        return (
+            f"<NounJobAggregate(job_id={self.scraping_job_id}, "
+            f"lemma='{self.lemma}', total_frequency={self.total_frequency})>"
+        )
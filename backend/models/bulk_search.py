@@ -1,9 +1,11 @@
 """Bulk search models for CSV upload."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
+from backend.models.enums import ProcessingStatus
 
 if TYPE_CHECKING:
     from backend.models.user import User
@@ -19,6 +21,7 @@ class BulkSearchUpload(Base):
     """
 
     __tablename__ = "bulk_search_uploads"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
@@ -29,22 +32,27 @@ class BulkSearchUpload(Base):
     validation_status: Mapped[str] = mapped_column(
         String(20), nullable=False, default="pending", index=True
     )
-    validation_errors: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    validation_errors: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
     session_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("search_sessions.id", ondelete="SET NULL"), nullable=True, index=True
     )
     task_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
     executed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # Relationships
-    user: Mapped["User"] = relationship("User")
-    session: Mapped["SearchSession"] = relationship("SearchSession")
+    user: Mapped["User"] = relationship("User", lazy=LAZY_LOAD)
+    session: Mapped["SearchSession"] = relationship("SearchSession", lazy=LAZY_LOAD)
+    # One row per CSV line: load with selectinload(BulkSearchUpload.rows)
     rows: Mapped[list["BulkSearchRow"]] = relationship(
-        "BulkSearchRow", back_populates="upload", cascade="all, delete-orphan"
+        "BulkSearchRow",
+        back_populates="upload",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
 
     def __repr__(self) -> str:
@@ -61,15 +69,31 @@ class BulkSearchRow(Base):
     """
 
     __tablename__ = "bulk_search_rows"
+    __table_args__ = (
+        Index(
+            "ix_bulk_search_rows_query_data",
+            "query_data",
+            postgresql_using="gin",
+            postgresql_ops={"query_data": "jsonb_path_ops"},
+        ),
+        # Pending rows of an upload in CSV order
+        Index("ix_bulk_search_rows_upload_status", "upload_id", "status", "row_number"),
+        # ON DELETE SET NULL lookup when a search query is deleted
+        Index(
+            "ix_bulk_search_rows_search_query_id",
+            "search_query_id",
+            postgresql_where=text("search_query_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     upload_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("bulk_search_uploads.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("bulk_search_uploads.id", ondelete="CASCADE"), nullable=False
     )
     row_number: Mapped[int] = mapped_column(Integer, nullable=False)
-    query_data: Mapped[dict] = mapped_column(JSON, nullable=False)
+    query_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
     status: Mapped[str] = mapped_column(
-        String(20), nullable=False, default="pending", index=True
+        ProcessingStatus, nullable=False, default="pending"
     )
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     search_query_id: Mapped[int | None] = mapped_column(
@@ -77,8 +101,10 @@ class BulkSearchRow(Base):
     )
 
     # Relationships
-    upload: Mapped["BulkSearchUpload"] = relationship("BulkSearchUpload", back_populates="rows")
-    search_query: Mapped["SearchQuery"] = relationship("SearchQuery")
+    upload: Mapped["BulkSearchUpload"] = relationship(
+        "BulkSearchUpload", back_populates="rows", lazy=LAZY_LOAD
+    )
+    search_query: Mapped["SearchQuery"] = relationship("SearchQuery", lazy=LAZY_LOAD)
 
     def __repr__(self) -> str:
         """String representation of BulkSearchRow."""
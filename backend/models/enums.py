@@ -0,0 +1,14 @@
+"""PostgreSQL enum types for low-cardinality status columns."""
+from sqlalchemy import Enum
+
+# Lifecycle of search sessions, search queries, bulk search rows and
+# scraping jobs. Native enums are 4 bytes per row (vs. a varchar plus
+# length header) and compare as integers, while Python code keeps using
+# the string values.
+PROCESSING_STATUSES = ("pending", "processing", "completed", "failed", "cancelled")
+
+# Outcome of scraping a single page
+SCRAPE_STATUSES = ("success", "failed", "skipped")
+
+ProcessingStatus = Enum(*PROCESSING_STATUSES, name="processing_status")
+ScrapeStatus = Enum(*SCRAPE_STATUSES, name="scrape_status")
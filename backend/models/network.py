@@ -1,9 +1,10 @@
 """Network export models for Phase 6."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, Float, ARRAY, Boolean
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Float, ARRAY, Boolean, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
 
 if TYPE_CHECKING:
     from backend.models.user import User
@@ -18,10 +19,26 @@ class NetworkExport(Base):
     """
 
     __tablename__ = "network_exports"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_network_exports_network_metadata",
+            "network_metadata",
+            postgresql_using="gin",
+            postgresql_ops={"network_metadata": "jsonb_path_ops"},
+        ),
+        # Keyset pages of a user's networks, newest first
+        Index(
+            "ix_network_exports_user_created_id",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
 
     # Basic info
@@ -30,9 +47,10 @@ class NetworkExport(Base):
         String(50), nullable=False, index=True
     )  # search_website, website_noun, website_concept
 
-    # Source sessions
+    # Source sessions, as returned by the API. Lookups by session go
+    # through NetworkExportSession.
     session_ids: Mapped[list] = mapped_column(
-        ARRAY(Integer), nullable=False, index=True
+        ARRAY(Integer), nullable=False
     )  # Array of session IDs
 
     # File storage
@@ -55,27 +73,29 @@ class NetworkExport(Base):
         Integer, nullable=True
     )  # Before backboning
     backboning_statistics: Mapped[dict | None] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Additional stats
 
     # Network-specific metadata
     network_metadata: Mapped[dict] = mapped_column(
-        JSON, nullable=False
+        JSONB, nullable=False
     )  # Languages, top_n, etc.
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False, index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=utcnow(),
+        onupdate=utcnow(),
         nullable=False,
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="network_exports")
+    user: Mapped["User"] = relationship(
+        "User", back_populates="network_exports", lazy=LAZY_LOAD
+    )
 
     def __repr__(self) -> str:
         """String representation of NetworkExport."""
@@ -83,3 +103,37 @@ class NetworkExport(Base):
             f"<NetworkExport(id={self.id}, name='{self.name}', "
             f"type='{self.type}', nodes={self.node_count}, edges={self.edge_count})>"
         )
+
+
+class NetworkExportSession(Base):
+    """
+    Search session a network export was built from.
+
+    Normalized copy of ``NetworkExport.session_ids`` (one row per
+    session) so exports are found by session with a B-tree lookup and
+    can be joined to search_sessions.
+    """
+
+    __tablename__ = "network_export_sessions"
+    __table_args__ = (
+        # Exports built from a session
+        Index(
+            "ix_network_export_sessions_session_network",
+            "session_id",
+            "network_id",
+        ),
+    )
+
+    network_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("network_exports.id", ondelete="CASCADE"), primary_key=True
+    )
+    session_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("search_sessions.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    def __repr__(self) -> str:
+        """String representation of NetworkExportSession."""
+        return (
+            f"<NetworkExportSession(network_id={self.network_id}, "
+            f"session_id={self.session_id})>"
+        )
@@ -1,9 +1,10 @@
 """Query expansion models for snowballing."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Float
+from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, Boolean, Float, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
 
 if TYPE_CHECKING:
     from backend.models.user import User
@@ -20,22 +21,43 @@ class QueryExpansionCandidate(Base):
     """
 
     __tablename__ = "query_expansion_candidates"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_query_expansion_candidates_metadata",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
+        # Top-scored candidates of a session
+        Index("ix_query_expansion_candidates_session_score", "session_id", "score"),
+        # ON DELETE SET NULL lookup when a user is deleted
+        Index(
+            "ix_query_expansion_candidates_approved_by_user_id",
+            "approved_by_user_id",
+            postgresql_where=text("approved_by_user_id IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     session_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("search_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("search_sessions.id", ondelete="CASCADE"), nullable=False
     )
     parent_query_id: Mapped[int | None] = mapped_column(
         Integer, ForeignKey("search_queries.id", ondelete="SET NULL"), nullable=True, index=True
     )
-    candidate_term: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    candidate_term: Mapped[str] = mapped_column(String(500), nullable=False)
     score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    source: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
-    metadata: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False)
+    # "metadata" is reserved on declarative classes; the column keeps its
+    # name. Deferred: only the candidate list endpoint returns it.
+    extra_metadata: Mapped[dict | None] = mapped_column(
+        "metadata", JSONB, nullable=True, deferred=True
+    )
     approved: Mapped[bool | None] = mapped_column(Boolean, nullable=True, default=None, index=True)
-    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0, index=True)
+    generation: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False
     )
     approved_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     approved_by_user_id: Mapped[int | None] = mapped_column(
@@ -43,9 +65,15 @@ class QueryExpansionCandidate(Base):
     )
 
     # Relationships
-    session: Mapped["SearchSession"] = relationship("SearchSession", foreign_keys=[session_id])
-    parent_query: Mapped["SearchQuery"] = relationship("SearchQuery", foreign_keys=[parent_query_id])
-    approved_by: Mapped["User"] = relationship("User", foreign_keys=[approved_by_user_id])
+    session: Mapped["SearchSession"] = relationship(
+        "SearchSession", foreign_keys=[session_id], lazy=LAZY_LOAD
+    )
+    parent_query: Mapped["SearchQuery"] = relationship(
+        "SearchQuery", foreign_keys=[parent_query_id], lazy=LAZY_LOAD
+    )
+    approved_by: Mapped["User"] = relationship(
+        "User", foreign_keys=[approved_by_user_id], lazy=LAZY_LOAD
+    )
 
     def __repr__(self) -> str:
         """String representation of QueryExpansionCandidate."""
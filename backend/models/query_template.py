@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
 
 if TYPE_CHECKING:
     from backend.models.user import User
@@ -20,6 +20,7 @@ class QueryTemplate(Base):
     """
 
     __tablename__ = "query_templates"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int | None] = mapped_column(
@@ -33,16 +34,20 @@ class QueryTemplate(Base):
     is_public: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, index=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", foreign_keys=[user_id])
+    user: Mapped["User"] = relationship("User", foreign_keys=[user_id], lazy=LAZY_LOAD)
     generated_queries: Mapped[list["QueryFromTemplate"]] = relationship(
-        "QueryFromTemplate", back_populates="template", cascade="all, delete-orphan"
+        "QueryFromTemplate",
+        back_populates="template",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
 
     def __repr__(self) -> str:
@@ -59,6 +64,7 @@ class QueryFromTemplate(Base):
     """
 
     __tablename__ = "queries_from_templates"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     template_id: Mapped[int] = mapped_column(
@@ -69,12 +75,14 @@ class QueryFromTemplate(Base):
     )
     substitutions: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
 
     # Relationships
-    template: Mapped["QueryTemplate"] = relationship("QueryTemplate", back_populates="generated_queries")
-    search_query: Mapped["SearchQuery"] = relationship("SearchQuery")
+    template: Mapped["QueryTemplate"] = relationship(
+        "QueryTemplate", back_populates="generated_queries", lazy=LAZY_LOAD
+    )
+    search_query: Mapped["SearchQuery"] = relationship("SearchQuery", lazy=LAZY_LOAD)
 
     def __repr__(self) -> str:
         """String representation of QueryFromTemplate."""
@@ -1,9 +1,13 @@
 """Scraping job models for tracking web scraping operations."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Float
+from sqlalchemy import (
+    Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Float, Index,
+    CheckConstraint, Computed,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
+from backend.models.enums import ProcessingStatus
 
 if TYPE_CHECKING:
     from backend.models.user import User
@@ -15,17 +19,26 @@ class ScrapingJob(Base):
     """Scraping job model - tracks web scraping operations for search sessions."""
 
     __tablename__ = "scraping_jobs"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Jobs of a session by status, most recently updated first
+        Index("ix_scraping_jobs_session_status_updated", "session_id", "status", "updated_at"),
+        CheckConstraint(
+            "total_urls >= 0 AND urls_scraped >= 0 AND urls_failed >= 0 AND urls_skipped >= 0",
+            name="ck_scraping_jobs_counters_non_negative",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     session_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("search_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("search_sessions.id", ondelete="CASCADE"), nullable=False
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     status: Mapped[str] = mapped_column(
-        String(20), default="pending", nullable=False, index=True
+        ProcessingStatus, default="pending", nullable=False
     )  # pending, processing, completed, failed, cancelled
 
     # Scraping configuration
@@ -42,16 +55,27 @@ class ScrapingJob(Base):
     respect_robots_txt: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
 
     # Progress tracking
-    total_urls: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    urls_scraped: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    urls_failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
-    urls_skipped: Mapped[int] = mapped_column(Integer, default=0, nullable=False)  # robots.txt blocked, etc.
+    total_urls: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    urls_scraped: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    urls_failed: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
+    urls_skipped: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )  # robots.txt blocked, etc.
+    # Computed by PostgreSQL on write; refreshed on flush via eager_defaults
+    progress_percentage: Mapped[float] = mapped_column(
+        Float,
+        Computed(
+            "CASE WHEN total_urls = 0 THEN 0 "
+            "ELSE urls_scraped::float / total_urls * 100 END",
+            persisted=True,
+        ),
+    )
 
     # Current depth being processed
     current_depth: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
     # Celery task information
-    celery_task_id: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    celery_task_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Error tracking
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -61,30 +85,28 @@ class ScrapingJob(Base):
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False, index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="scraping_jobs")
-    session: Mapped["SearchSession"] = relationship("SearchSession", back_populates="scraping_jobs")
+    user: Mapped["User"] = relationship(
+        "User", back_populates="scraping_jobs", lazy=LAZY_LOAD
+    )
+    session: Mapped["SearchSession"] = relationship(
+        "SearchSession", back_populates="scraping_jobs", lazy=LAZY_LOAD
+    )
+    # Large (carries html_content): load with selectinload() where needed
     website_contents: Mapped[list["WebsiteContent"]] = relationship(
-        "WebsiteContent", back_populates="scraping_job"
+        "WebsiteContent", back_populates="scraping_job", lazy=LAZY_LOAD
     )
 
     def __repr__(self) -> str:
         """String representation of ScrapingJob."""
         return f"<ScrapingJob(id={self.id}, name='{self.name}', status='{self.status}', depth={self.depth})>"
 
-    @property
-    def progress_percentage(self) -> float:
-        """Calculate progress percentage."""
-        if self.total_urls == 0:
-            return 0.0
-        return (self.urls_scraped / self.total_urls) * 100.0
-
     @property
     def is_active(self) -> bool:
         """Check if job is currently active."""
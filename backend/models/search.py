@@ -1,9 +1,14 @@
 """Search session, query, and result models."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import (
+    BigInteger, Integer, String, Text, DateTime, ForeignKey, JSON, Boolean, Identity, Index,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
+from backend.models.enums import ProcessingStatus
 
 if TYPE_CHECKING:
     from backend.models.user import User
@@ -14,6 +19,16 @@ class SearchSession(Base):
     """Search session model - groups related searches."""
 
     __tablename__ = "search_sessions"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # A user's sessions, newest first (created by
+        # phase9_performance_indexes; LIMIT queries are a bounded scan)
+        Index(
+            "idx_search_sessions_user_created",
+            "user_id",
+            text("created_at DESC"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
@@ -21,24 +36,35 @@ class SearchSession(Base):
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False, index=True)
+    status: Mapped[str] = mapped_column(ProcessingStatus, default="pending", nullable=False, index=True)
     config: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     started_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False, index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="search_sessions")
+    user: Mapped["User"] = relationship(
+        "User", back_populates="search_sessions", lazy=LAZY_LOAD
+    )
+    # Small and read with almost every session: batch-load in one IN query
     queries: Mapped[list["SearchQuery"]] = relationship(
-        "SearchQuery", back_populates="session", cascade="all, delete-orphan"
+        "SearchQuery",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
     )
     scraping_jobs: Mapped[list["ScrapingJob"]] = relationship(
-        "ScrapingJob", back_populates="session", cascade="all, delete-orphan"
+        "ScrapingJob",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
 
     def __repr__(self) -> str:
@@ -50,42 +76,78 @@ class SearchQuery(Base):
     """Search query model - individual search within a session."""
 
     __tablename__ = "search_queries"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index(
+            "ix_search_queries_domain_whitelist",
+            "domain_whitelist",
+            postgresql_using="gin",
+            postgresql_ops={"domain_whitelist": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_search_queries_domain_blacklist",
+            "domain_blacklist",
+            postgresql_using="gin",
+            postgresql_ops={"domain_blacklist": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_search_queries_tld_filter",
+            "tld_filter",
+            postgresql_using="gin",
+            postgresql_ops={"tld_filter": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_search_queries_sphere_filter",
+            "sphere_filter",
+            postgresql_using="gin",
+            postgresql_ops={"sphere_filter": "jsonb_path_ops"},
+        ),
+        # Queries of a session by status
+        Index("ix_search_queries_session_status", "session_id", "status"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     session_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("search_sessions.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("search_sessions.id", ondelete="CASCADE"), nullable=False
     )
     query_text: Mapped[str] = mapped_column(String(500), nullable=False)
     search_engine: Mapped[str] = mapped_column(String(50), nullable=False)
     max_results: Mapped[int] = mapped_column(Integer, nullable=False)
-    allowed_domains: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    allowed_domains: Mapped[list | None] = mapped_column(JSONB, nullable=True)
 
     # Phase 7: Advanced search features
-    date_from: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
-    date_to: Mapped[datetime | None] = mapped_column(DateTime, nullable=True, index=True)
+    date_from: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    date_to: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     temporal_snapshot: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
-    domain_whitelist: Mapped[list | None] = mapped_column(JSON, nullable=True)
-    domain_blacklist: Mapped[list | None] = mapped_column(JSON, nullable=True)
-    tld_filter: Mapped[list | None] = mapped_column(JSON, nullable=True)
-    sphere_filter: Mapped[list | None] = mapped_column(JSON, nullable=True)
-    framing_type: Mapped[str | None] = mapped_column(String(50), nullable=True, index=True)
-    language: Mapped[str | None] = mapped_column(String(10), nullable=True, index=True)
-
-    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False, index=True)
+    domain_whitelist: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    domain_blacklist: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    tld_filter: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    sphere_filter: Mapped[list | None] = mapped_column(JSONB, nullable=True)
+    framing_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    language: Mapped[str | None] = mapped_column(String(10), nullable=True)
+
+    status: Mapped[str] = mapped_column(ProcessingStatus, default="pending", nullable=False)
     result_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
     executed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     # Relationships
-    session: Mapped["SearchSession"] = relationship("SearchSession", back_populates="queries")
+    session: Mapped["SearchSession"] = relationship(
+        "SearchSession", back_populates="queries", lazy=LAZY_LOAD
+    )
+    # Large: load with selectinload(SearchQuery.results) where needed
     results: Mapped[list["SearchResult"]] = relationship(
-        "SearchResult", back_populates="query", cascade="all, delete-orphan"
+        "SearchResult",
+        back_populates="query",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
 
     def __repr__(self) -> str:
@@ -97,8 +159,15 @@ class SearchResult(Base):
     """Search result model - individual result from a search query."""
 
     __tablename__ = "search_results"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # Scraper snippet fallback looks results up by URL
+        Index("ix_search_results_url", "url", postgresql_using="hash"),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False), primary_key=True, index=True
+    )
     query_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("search_queries.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -106,14 +175,16 @@ class SearchResult(Base):
     title: Mapped[str | None] = mapped_column(String(500), nullable=True)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
     rank: Mapped[int] = mapped_column(Integer, nullable=False)
-    domain: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    domain: Mapped[str] = mapped_column(String(255), nullable=False)
     scraped: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
 
     # Relationships
-    query: Mapped["SearchQuery"] = relationship("SearchQuery", back_populates="results")
+    query: Mapped["SearchQuery"] = relationship(
+        "SearchQuery", back_populates="results", lazy=LAZY_LOAD
+    )
 
     def __repr__(self) -> str:
         """String representation of SearchResult."""
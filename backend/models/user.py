@@ -1,9 +1,10 @@
 """User model for authentication and authorization."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Boolean, String, DateTime, Integer
+from sqlalchemy import DDL, Boolean, CheckConstraint, String, DateTime, Integer, event
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
 
 if TYPE_CHECKING:
     from backend.models.search import SearchSession
@@ -16,35 +17,64 @@ class User(Base):
     """User account model."""
 
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # CITEXT has no length modifier; keep the old VARCHAR limits
+        CheckConstraint("char_length(username) <= 50", name="ck_users_username_length"),
+        CheckConstraint("char_length(email) <= 255", name="ck_users_email_length"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    username: Mapped[str] = mapped_column(String(50), unique=True, nullable=False, index=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
+    # Case-insensitive: plain equality lookups use the unique indexes
+    username: Mapped[str] = mapped_column(CITEXT, unique=True, nullable=False, index=True)
+    email: Mapped[str] = mapped_column(CITEXT, unique=True, nullable=False, index=True)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     last_login: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     # Relationships
     search_sessions: Mapped[list["SearchSession"]] = relationship(
-        "SearchSession", back_populates="user", cascade="all, delete-orphan"
+        "SearchSession",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
     website_contents: Mapped[list["WebsiteContent"]] = relationship(
-        "WebsiteContent", back_populates="user", cascade="all, delete-orphan"
+        "WebsiteContent",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
     network_exports: Mapped[list["NetworkExport"]] = relationship(
-        "NetworkExport", back_populates="user", cascade="all, delete-orphan"
+        "NetworkExport",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
     scraping_jobs: Mapped[list["ScrapingJob"]] = relationship(
-        "ScrapingJob", back_populates="user", cascade="all, delete-orphan"
+        "ScrapingJob",
+        back_populates="user",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
 
     def __repr__(self) -> str:
         """String representation of User."""
         return f"<User(id={self.id}, username='{self.username}', email='{self.email}')>"
+
+
+# Make create_all() install citext before building the users table
+event.listen(
+    User.__table__, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS citext")
+)
@@ -1,9 +1,13 @@
 """Website and content models for scraping operations."""
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey, JSON, Boolean
+from sqlalchemy import (
+    BigInteger, Integer, String, Text, DateTime, ForeignKey, Boolean, Float, Identity, Index,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from backend.database import Base
+from backend.database import Base, LAZY_LOAD, utcnow
+from backend.models.enums import ScrapeStatus
 
 if TYPE_CHECKING:
     from backend.models.user import User
@@ -15,24 +19,34 @@ class Website(Base):
     """Website model - unique websites discovered."""
 
     __tablename__ = "websites"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        # URLs are only looked up by equality; a hash index stores a
+        # 4-byte hash per entry instead of the full (often 100+ byte) key
+        Index("ix_websites_url", "url", postgresql_using="hash"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    url: Mapped[str] = mapped_column(Text, unique=True, nullable=False, index=True)
-    domain: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    domain: Mapped[str] = mapped_column(String(255), nullable=False)
     title: Mapped[str | None] = mapped_column(String(500), nullable=True)
     meta_description: Mapped[str | None] = mapped_column(Text, nullable=True)
     last_scraped_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     scrape_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), onupdate=utcnow(), nullable=False
     )
 
     # Relationships
     contents: Mapped[list["WebsiteContent"]] = relationship(
-        "WebsiteContent", back_populates="website", cascade="all, delete-orphan"
+        "WebsiteContent",
+        back_populates="website",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
 
     def __repr__(self) -> str:
@@ -44,8 +58,20 @@ class WebsiteContent(Base):
     """Scraped content from websites."""
 
     __tablename__ = "website_content"
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_website_content_url", "url", postgresql_using="hash"),
+        # Job filter of the aggregate joins; covers the joined id
+        Index(
+            "ix_website_content_job_id",
+            "scraping_job_id",
+            postgresql_include=["id"],
+        ),
+    )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    id: Mapped[int] = mapped_column(
+        BigInteger, Identity(always=False), primary_key=True, index=True
+    )
     website_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("websites.id", ondelete="CASCADE"), nullable=False, index=True
     )
@@ -53,13 +79,20 @@ class WebsiteContent(Base):
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
     )
     scraping_job_id: Mapped[int | None] = mapped_column(
-        Integer, ForeignKey("scraping_jobs.id", ondelete="SET NULL"), nullable=True, index=True
+        Integer, ForeignKey("scraping_jobs.id", ondelete="SET NULL"), nullable=True
+    )
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+
+    # Content fields. The page bodies are deferred (group "body") so list
+    # queries don't fetch and detoast them; load them with
+    # undefer(...)/undefer_group("body") where they are read. Stored with
+    # LZ4 TOAST compression (migration website_content_lz4_compression).
+    html_content: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body"
+    )
+    extracted_text: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body"
     )
-    url: Mapped[str] = mapped_column(Text, nullable=False, index=True)
-
-    # Content fields
-    html_content: Mapped[str | None] = mapped_column(Text, nullable=True)
-    extracted_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     title: Mapped[str | None] = mapped_column(String(500), nullable=True)
     meta_description: Mapped[str | None] = mapped_column(Text, nullable=True)
 
@@ -70,39 +103,86 @@ class WebsiteContent(Base):
     # Scraping metadata
     scrape_depth: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     parent_url: Mapped[str | None] = mapped_column(Text, nullable=True)  # URL that linked to this page
-    status: Mapped[str] = mapped_column(String(20), nullable=False, index=True)  # success, failed, skipped
+    status: Mapped[str] = mapped_column(ScrapeStatus, nullable=False, index=True)  # success, failed, skipped
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Outbound links discovered on this page
-    outbound_links: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    outbound_links: Mapped[list | None] = mapped_column(
+        JSONB, nullable=True, deferred=True, deferred_group="body"
+    )
 
     # HTTP response information
     http_status_code: Mapped[int | None] = mapped_column(Integer, nullable=True)
     final_url: Mapped[str | None] = mapped_column(Text, nullable=True)  # After redirects
 
     # Timing
-    scrape_duration: Mapped[float | None] = mapped_column(Integer, nullable=True)  # milliseconds
+    scrape_duration: Mapped[float | None] = mapped_column(Float, nullable=True)  # milliseconds
     scraped_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False, index=True
+        DateTime, server_default=utcnow(), nullable=False, index=True
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, server_default=utcnow(), nullable=False
     )
 
     # Relationships
-    website: Mapped["Website"] = relationship("Website", back_populates="contents")
-    user: Mapped["User"] = relationship("User", back_populates="website_contents")
-    scraping_job: Mapped["ScrapingJob"] = relationship("ScrapingJob", back_populates="website_contents")
+    website: Mapped["Website"] = relationship(
+        "Website", back_populates="contents", lazy=LAZY_LOAD
+    )
+    user: Mapped["User"] = relationship(
+        "User", back_populates="website_contents", lazy=LAZY_LOAD
+    )
+    scraping_job: Mapped["ScrapingJob"] = relationship(
+        "ScrapingJob", back_populates="website_contents", lazy=LAZY_LOAD
+    )
     extracted_nouns: Mapped[list["ExtractedNoun"]] = relationship(
-        "ExtractedNoun", back_populates="website_content", cascade="all, delete-orphan"
+        "ExtractedNoun",
+        back_populates="website_content",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
     extracted_entities: Mapped[list["ExtractedEntity"]] = relationship(
-        "ExtractedEntity", back_populates="website_content", cascade="all, delete-orphan"
+        "ExtractedEntity",
+        back_populates="website_content",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
     analysis: Mapped["ContentAnalysis"] = relationship(
-        "ContentAnalysis", back_populates="website_content", uselist=False, cascade="all, delete-orphan"
+        "ContentAnalysis",
+        back_populates="website_content",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY_LOAD,
     )
 
     def __repr__(self) -> str:
         """String representation of WebsiteContent."""
         return f"<WebsiteContent(id={self.id}, website_id={self.website_id}, status='{self.status}')>"
+
+
+class WebsiteOutboundLink(Base):
+    """
+    Outbound link found on a scraped page.
+
+    Normalized copy of ``WebsiteContent.outbound_links`` (one row per
+    link, in page order) so link-domain aggregates are plain indexed SQL
+    instead of unnesting JSON per page.
+    """
+
+    __tablename__ = "website_outbound_links"
+    __table_args__ = (
+        Index("ix_website_outbound_links_target_domain", "target_domain"),
+    )
+
+    content_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("website_content.id", ondelete="CASCADE"), primary_key=True
+    )
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)  # Position on the page
+    target_url: Mapped[str] = mapped_column(Text, nullable=False)
+    target_domain: Mapped[str] = mapped_column(String(255), nullable=False)
+
+    def __repr__(self) -> str:
+        """String representation of WebsiteOutboundLink."""
+        return f"<WebsiteOutboundLink(content_id={self.content_id}, rank={self.rank})>"
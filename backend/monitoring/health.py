@@ -8,7 +8,9 @@ Provides detailed health checks for:
 - External services (optional)
 """
 import logging
-from typing import Dict, Any, Optional
+import shutil
+import time
+from typing import Awaitable, Callable, Dict, Any, Optional, Tuple
 from datetime import datetime
 import asyncio
 
@@ -21,6 +23,114 @@ from backend.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Maximum subchecks running at once across all concurrent check_all() calls
+MAX_CONCURRENT_HEALTH_CHECKS = 10
+
+_health_semaphore = asyncio.Semaphore(MAX_CONCURRENT_HEALTH_CHECKS)
+
+
+class _TTLCache:
+    """
+    Per-key result cache with single-flight recomputation.
+
+    While a key is being recomputed, every caller awaits the same task
+    instead of starting its own check. The task is shielded, so a caller
+    cancelled by its own deadline doesn't abort the check for the others.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def get_or_compute(
+        self,
+        key: str,
+        ttl: float,
+        factory: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Return the cached result for key, computing it if stale.
+
+        Args:
+            key: Cache key
+            ttl: Seconds a result stays fresh
+            factory: Coroutine function computing the result
+
+        Returns:
+            Cached or freshly computed result
+        """
+        cached = self._cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._store(key, done))
+
+        return await asyncio.shield(task)
+
+    def clear(self) -> None:
+        """Drop all cached results (in-flight checks still complete)."""
+        self._cache.clear()
+
+    def _store(self, key: str, task: asyncio.Task) -> None:
+        """Cache a finished computation and clear its in-flight entry."""
+        self._inflight.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self._cache[key] = (time.monotonic(), task.result())
+
+
+_health_cache = _TTLCache()
+
+# Latest (monotonic time, disk usage) sample from the background sampler
+_disk_sample: Optional[Tuple[float, Any]] = None
+
+# Background task sampling disk usage
+_disk_task: Optional[asyncio.Task] = None
+
+# Maximum age of a reused response timestamp
+TIMESTAMP_MAX_AGE_NS = 100_000_000  # 100ms
+
+# (monotonic ns, ISO timestamp) last produced by _now_iso()
+_timestamp: Tuple[int, str] = (0, "")
+
+
+def _now_iso() -> str:
+    """
+    Current local time as ISO 8601, reused for up to 100ms.
+
+    Probe and scrape bursts share one formatted timestamp instead of
+    each calling datetime.now().
+
+    Returns:
+        ISO 8601 timestamp
+    """
+    global _timestamp
+
+    now_ns = time.monotonic_ns()
+    if not _timestamp[1] or now_ns - _timestamp[0] > TIMESTAMP_MAX_AGE_NS:
+        _timestamp = (now_ns, datetime.now().isoformat())
+    return _timestamp[1]
+
+
+def _total_tasks_processed(stats: Dict[str, Any]) -> int:
+    """
+    Sum per-task counters across Celery workers.
+
+    Args:
+        stats: Payload of inspect().stats(), keyed by worker name
+
+    Returns:
+        Total tasks processed by all workers
+    """
+    total_tasks = 0
+    for worker_stats in stats.values():
+        for count in worker_stats.get("total", {}).values():
+            total_tasks += count
+    return total_tasks
+
 
 class HealthStatus:
     """Health status constants."""
@@ -30,6 +140,48 @@ class HealthStatus:
     DEGRADED = "degraded"
 
 
+async def _run_limited(
+    name: str, check: Callable[[], Awaitable[Dict[str, Any]]]
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Run a health check under the shared concurrency limit.
+
+    Args:
+        name: Component name
+        check: Health check coroutine function
+
+    Returns:
+        Tuple of component name and check result
+    """
+    async with _health_semaphore:
+        return name, await check()
+
+
+async def _with_timeout(
+    check: Awaitable[Dict[str, Any]], seconds: float, name: str
+) -> Dict[str, Any]:
+    """
+    Run a health check with an upper bound on its duration.
+
+    Args:
+        check: Health check coroutine
+        seconds: Time limit
+        name: Component name for the error message
+
+    Returns:
+        The check's result, or an unhealthy result if it timed out
+    """
+    try:
+        async with asyncio.timeout(seconds):
+            return await check
+    except TimeoutError:
+        logger.error(f"{name} health check timed out after {seconds}s")
+        return {
+            "status": HealthStatus.UNHEALTHY,
+            "details": {"error": f"{name} timed out after {seconds}s"},
+        }
+
+
 class HealthCheck:
     """
     Health check utility class.
@@ -45,27 +197,46 @@ class HealthCheck:
         Returns:
             Dictionary with database health status
         """
-        start_time = datetime.now()
+        return await _health_cache.get_or_compute(
+            "database",
+            settings.health_check_cache_ttl_database,
+            lambda: _with_timeout(
+                HealthCheck._check_database(),
+                settings.health_check_timeout_database,
+                "Database",
+            ),
+        )
+
+    @staticmethod
+    async def _check_database() -> Dict[str, Any]:
+        """Database check body, bounded by check_database()."""
+        pool = engine.pool
+
+        # Don't take one of the last connections for a probe; a saturated
+        # pool is reported as such without queueing behind the requests
+        capacity = pool.size() + settings.database_max_overflow
+        if pool.checkedout() >= capacity - 1:
+            return {
+                "status": HealthStatus.DEGRADED,
+                "details": {"warning": "pool_saturated"},
+            }
+
+        start_time = time.perf_counter()
         status = HealthStatus.HEALTHY
         details = {}
 
         try:
-            # Test database connection with a simple query
+            # Test database connection with a simple query. Connections
+            # are pre-pinged on checkout (DATABASE_POOL_PRE_PING), and the
+            # result is cached by check_database() between probes.
             async with engine.connect() as conn:
                 result = await conn.execute(text("SELECT 1"))
-                await result.fetchone()
+                result.fetchone()
 
             # Calculate response time
-            response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            response_time_ms = (time.perf_counter() - start_time) * 1000
             details["response_time_ms"] = round(response_time_ms, 2)
 
-            # Check connection pool stats
-            pool = engine.pool
-            details["pool_size"] = pool.size()
-            details["checked_in_connections"] = pool.checkedin()
-            details["checked_out_connections"] = pool.checkedout()
-            details["overflow_connections"] = pool.overflow()
-
             # Mark as degraded if response time is high
             if response_time_ms > 1000:
                 status = HealthStatus.DEGRADED
@@ -94,7 +265,20 @@ class HealthCheck:
         Returns:
             Dictionary with Redis health status
         """
-        start_time = datetime.now()
+        return await _health_cache.get_or_compute(
+            "redis",
+            settings.health_check_cache_ttl_redis,
+            lambda: _with_timeout(
+                HealthCheck._check_redis(),
+                settings.health_check_timeout_redis,
+                "Redis",
+            ),
+        )
+
+    @staticmethod
+    async def _check_redis() -> Dict[str, Any]:
+        """Redis check body, bounded by check_redis()."""
+        start_time = time.perf_counter()
         status = HealthStatus.HEALTHY
         details = {}
 
@@ -106,22 +290,17 @@ class HealthCheck:
             if not cache.redis:
                 await cache.connect()
 
-            # Test Redis connection with ping
+            # Test Redis connection with ping. Server stats are exported
+            # by the Redis metrics collector at scrape time.
             pong = await cache.redis.ping()
 
             if not pong:
                 raise Exception("Redis ping failed")
 
             # Calculate response time
-            response_time_ms = (datetime.now() - start_time).total_seconds() * 1000
+            response_time_ms = (time.perf_counter() - start_time) * 1000
             details["response_time_ms"] = round(response_time_ms, 2)
 
-            # Get Redis info
-            info = await redis.info()
-            details["connected_clients"] = info.get("connected_clients", 0)
-            details["used_memory_human"] = info.get("used_memory_human", "unknown")
-            details["redis_version"] = info.get("redis_version", "unknown")
-
             # Mark as degraded if response time is high
             if response_time_ms > 500:
                 status = HealthStatus.DEGRADED
@@ -140,23 +319,94 @@ class HealthCheck:
     @staticmethod
     async def check_celery() -> Dict[str, Any]:
         """
-        Check Celery worker availability.
+        Check that Celery workers respond to a ping.
 
         Returns:
             Dictionary with Celery health status
         """
+        return await _health_cache.get_or_compute(
+            "celery",
+            settings.health_check_cache_ttl_celery,
+            lambda: _with_timeout(
+                HealthCheck._check_celery(),
+                settings.health_check_timeout_celery,
+                "Celery",
+            ),
+        )
+
+    @staticmethod
+    async def _check_celery() -> Dict[str, Any]:
+        """Celery ping body, bounded by check_celery()."""
         status = HealthStatus.HEALTHY
         details = {}
 
         try:
             from backend.celery_app import celery_app
 
-            # Inspect active workers
-            inspect = celery_app.control.inspect()
+            # Broadcast RPC blocks; keep it off the event loop
+            replies = await asyncio.to_thread(celery_app.control.ping, timeout=0.5)
 
-            # Get active workers with timeout
-            active = inspect.active(timeout=2.0)
-            stats = inspect.stats(timeout=2.0)
+            if not replies:
+                status = HealthStatus.UNHEALTHY
+                details["error"] = "No Celery workers replied to ping"
+            else:
+                details["active_workers"] = len(replies)
+                details["workers"] = [name for reply in replies for name in reply]
+
+        except ImportError:
+            status = HealthStatus.DEGRADED
+            details["warning"] = "Celery not configured"
+        except Exception as e:
+            status = HealthStatus.DEGRADED
+            details["error"] = str(e)
+            details["warning"] = "Could not connect to Celery workers"
+            logger.warning(f"Celery health check failed: {e}")
+
+        return {
+            "status": status,
+            "details": details,
+        }
+
+    @staticmethod
+    async def check_celery_full() -> Dict[str, Any]:
+        """
+        Check Celery worker availability and task statistics.
+
+        Waits for every worker's active/stats replies, so it is only
+        used by the startup check.
+
+        Returns:
+            Dictionary with Celery health status
+        """
+        return await _health_cache.get_or_compute(
+            "celery_full",
+            settings.health_check_cache_ttl_celery_full,
+            lambda: _with_timeout(
+                HealthCheck._check_celery_full(),
+                settings.health_check_timeout_celery_full,
+                "Celery",
+            ),
+        )
+
+    @staticmethod
+    async def _check_celery_full() -> Dict[str, Any]:
+        """Celery inspection body, bounded by check_celery_full()."""
+        status = HealthStatus.HEALTHY
+        details = {}
+
+        try:
+            from backend.celery_app import celery_app
+
+            # The reply timeout is set on the inspector; active() and
+            # stats() take no arguments. One inspector per broadcast so
+            # both can wait for replies at the same time.
+            timeout = settings.health_check_celery_inspect_timeout
+
+            # Broadcast RPCs block; keep them off the event loop
+            active, stats = await asyncio.gather(
+                asyncio.to_thread(celery_app.control.inspect(timeout=timeout).active),
+                asyncio.to_thread(celery_app.control.inspect(timeout=timeout).stats),
+            )
 
             if not active:
                 status = HealthStatus.UNHEALTHY
@@ -167,11 +417,7 @@ class HealthCheck:
 
                 # Get worker statistics
                 if stats:
-                    total_tasks = sum(
-                        worker_stats.get("total", {}).values()
-                        for worker_stats in stats.values()
-                    )
-                    details["total_tasks_processed"] = total_tasks
+                    details["total_tasks_processed"] = _total_tasks_processed(stats)
 
         except ImportError:
             status = HealthStatus.DEGRADED
@@ -192,18 +438,26 @@ class HealthCheck:
         """
         Check available disk space.
 
+        Reads the latest sample from the background disk sampler (see
+        start_disk_sampler()) instead of calling statvfs per probe.
+
         Returns:
             Dictionary with disk space health status
         """
         status = HealthStatus.HEALTHY
         details = {}
 
-        try:
-            import shutil
+        if _disk_sample is None:
+            return {
+                "status": HealthStatus.DEGRADED,
+                "details": {"warning": "Disk usage not sampled yet"},
+            }
 
-            # Check disk usage
-            usage = shutil.disk_usage("/")
+        sampled_at, usage = _disk_sample
+        age = time.monotonic() - sampled_at
+        details["sample_age_seconds"] = round(age, 1)
 
+        try:
             total_gb = usage.total / (1024 ** 3)
             used_gb = usage.used / (1024 ** 3)
             free_gb = usage.free / (1024 ** 3)
@@ -224,6 +478,11 @@ class HealthCheck:
                 status = HealthStatus.UNHEALTHY
                 details["error"] = "Disk space critically low"
 
+            # The sampler has stopped or its statvfs calls are hanging
+            if age > 2 * settings.health_check_disk_interval and status == HealthStatus.HEALTHY:
+                status = HealthStatus.DEGRADED
+                details["warning"] = "Disk usage sample is stale"
+
         except Exception as e:
             status = HealthStatus.DEGRADED
             details["error"] = str(e)
@@ -235,42 +494,56 @@ class HealthCheck:
         }
 
     @staticmethod
-    async def check_all() -> Dict[str, Any]:
+    async def check_all(celery_full: bool = False) -> Dict[str, Any]:
         """
         Run all health checks.
 
+        Args:
+            celery_full: Inspect worker activity and stats instead of
+                only pinging the workers
+
         Returns:
             Dictionary with overall health status and individual component statuses
         """
-        # Run all health checks concurrently
-        results = await asyncio.gather(
-            HealthCheck.check_database(),
-            HealthCheck.check_redis(),
-            HealthCheck.check_celery(),
-            HealthCheck.check_disk_space(),
-            return_exceptions=True,
-        )
-
-        # Parse results
-        database_health = results[0] if not isinstance(results[0], Exception) else {
-            "status": HealthStatus.UNHEALTHY,
-            "details": {"error": str(results[0])},
+        checks = {
+            "database": HealthCheck.check_database,
+            "redis": HealthCheck.check_redis,
+            "celery": (
+                HealthCheck.check_celery_full if celery_full else HealthCheck.check_celery
+            ),
+            "disk": HealthCheck.check_disk_space,
         }
-
-        redis_health = results[1] if not isinstance(results[1], Exception) else {
-            "status": HealthStatus.UNHEALTHY,
-            "details": {"error": str(results[1])},
+        tasks = {
+            asyncio.create_task(_run_limited(name, check)): name
+            for name, check in checks.items()
         }
 
-        celery_health = results[2] if not isinstance(results[2], Exception) else {
-            "status": HealthStatus.UNHEALTHY,
-            "details": {"error": str(results[2])},
-        }
+        # Report checks still running at the deadline instead of waiting
+        _, pending = await asyncio.wait(
+            tasks, timeout=settings.health_check_total_timeout
+        )
+        for task in pending:
+            task.cancel()
+
+        component_health = {}
+        for task, name in tasks.items():
+            if task in pending:
+                component_health[name] = {
+                    "status": HealthStatus.DEGRADED,
+                    "details": {"error": "timeout"},
+                }
+            elif task.exception() is not None:
+                component_health[name] = {
+                    "status": HealthStatus.UNHEALTHY,
+                    "details": {"error": str(task.exception())},
+                }
+            else:
+                component_health[name] = task.result()[1]
 
-        disk_health = results[3] if not isinstance(results[3], Exception) else {
-            "status": HealthStatus.UNHEALTHY,
-            "details": {"error": str(results[3])},
-        }
+        database_health = component_health["database"]
+        redis_health = component_health["redis"]
+        celery_health = component_health["celery"]
+        disk_health = component_health["disk"]
 
         # Determine overall status
         all_statuses = [
@@ -289,7 +562,7 @@ class HealthCheck:
 
         return {
             "status": overall_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "environment": settings.environment,
             "version": settings.app_version,
             "checks": {
@@ -301,6 +574,49 @@ class HealthCheck:
         }
 
 
+async def _sample_disk_usage_periodically() -> None:
+    """Sample disk usage every disk interval."""
+    global _disk_sample
+
+    while True:
+        try:
+            # statvfs can hang on network mounts; keep it off the event loop
+            async with asyncio.timeout(settings.health_check_timeout_disk):
+                usage = await asyncio.to_thread(shutil.disk_usage, "/")
+            _disk_sample = (time.monotonic(), usage)
+        except Exception as e:
+            logger.warning(f"Disk usage sample failed: {e}")
+
+        await asyncio.sleep(settings.health_check_disk_interval)
+
+
+def start_disk_sampler() -> None:
+    """
+    Start the background disk usage sampler.
+
+    Must be called from a running event loop (application lifespan).
+    """
+    global _disk_task
+
+    if _disk_task is None:
+        _disk_task = asyncio.get_running_loop().create_task(
+            _sample_disk_usage_periodically()
+        )
+
+
+async def stop_disk_sampler() -> None:
+    """Stop the background disk usage sampler."""
+    global _disk_task
+
+    if _disk_task is not None:
+        _disk_task.cancel()
+        try:
+            await _disk_task
+        except asyncio.CancelledError:
+            pass
+        _disk_task = None
+
+
 async def liveness_check() -> Dict[str, Any]:
     """
     Liveness check - indicates if the application is running.
@@ -313,7 +629,7 @@ async def liveness_check() -> Dict[str, Any]:
     """
     return {
         "status": "alive",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
     }
 
 
@@ -327,9 +643,21 @@ async def readiness_check() -> Dict[str, Any]:
     Returns:
         Dictionary with readiness status
     """
-    # Check critical dependencies
-    database_health = await HealthCheck.check_database()
-    redis_health = await HealthCheck.check_redis()
+    # Check critical dependencies concurrently
+    results = await asyncio.gather(
+        HealthCheck.check_database(),
+        HealthCheck.check_redis(),
+        return_exceptions=True,
+    )
+    database_health, redis_health = (
+        {
+            "status": HealthStatus.UNHEALTHY,
+            "details": {"error": str(result)},
+        }
+        if isinstance(result, BaseException)
+        else result
+        for result in results
+    )
 
     # Application is ready only if database and redis are healthy
     is_ready = (
@@ -341,7 +669,7 @@ async def readiness_check() -> Dict[str, Any]:
 
     return {
         "status": status,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "checks": {
             "database": database_health,
             "redis": redis_health,
@@ -360,12 +688,12 @@ async def startup_check() -> Dict[str, Any]:
         Dictionary with startup status
     """
     # Run full health check
-    health = await HealthCheck.check_all()
+    health = await HealthCheck.check_all(celery_full=True)
 
     is_started = health["status"] != HealthStatus.UNHEALTHY
 
     return {
         "status": "started" if is_started else "not_started",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "health": health,
     }
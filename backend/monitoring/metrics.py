@@ -8,12 +8,12 @@ This module defines custom metrics for tracking:
 - Analysis operations
 - Network generation
 - Cache performance
-- Database connection pool stats
+- Database operations (pool metrics: backend.monitoring.pool_metrics)
 """
 import time
 import logging
 from typing import Callable, Optional
-from functools import wraps
+from functools import lru_cache, wraps
 from contextlib import contextmanager
 
 from prometheus_client import (
@@ -24,8 +24,8 @@ from prometheus_client import (
     generate_latest,
     CONTENT_TYPE_LATEST,
 )
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +133,16 @@ scraping_errors_total = Counter(
     ["error_type"],
 )
 
+# Fixed error_type vocabulary, checked in order; anything else is "other".
+# Exception class names would give one series per (third-party) class.
+ERROR_TYPES = (
+    (TimeoutError, "timeout"),
+    (ConnectionError, "connection"),
+    (UnicodeError, "parse"),
+    (ValueError, "parse"),
+    (KeyError, "parse"),
+)
+
 
 # ============================================================================
 # Analysis Metrics
@@ -216,15 +226,7 @@ cache_duration_seconds = Histogram(
 # Database Metrics
 # ============================================================================
 
-db_connections_active = Gauge(
-    "db_connections_active",
-    "Number of active database connections",
-)
-
-db_connections_pool_size = Gauge(
-    "db_connections_pool_size",
-    "Database connection pool size",
-)
+# Pool gauges and counters live in backend.monitoring.pool_metrics
 
 db_query_duration_seconds = Histogram(
     "db_query_duration_seconds",
@@ -289,22 +291,88 @@ sessions_total = Counter(
 # Helper Functions and Decorators
 # ============================================================================
 
-@contextmanager
+@lru_cache(maxsize=4096)
+def _child(metric, *labels):
+    """
+    Cached ``metric.labels(*labels)``.
+
+    ``labels()`` takes the metric's lock and builds the label key on every
+    call; the label sets used here (method x route template, task and
+    engine names) are small and fixed, so children are looked up once.
+
+    Args:
+        metric: Labelled Prometheus metric
+        *labels: Label values in declaration order
+
+    Returns:
+        Metric child for the label values
+    """
+    return metric.labels(*labels)
+
+
+def bind_histogram(histogram: Histogram, *labels) -> Callable:
+    """
+    Build a duration timer bound to one histogram child.
+
+    The child is resolved once, so timing a hot operation costs only the
+    two clock reads and the observation.
+
+    Usage:
+        CACHE_GET_TIMER = bind_histogram(cache_duration_seconds, "get")
+
+        with CACHE_GET_TIMER():
+            # perform cache get
+            pass
+
+    Args:
+        histogram: Histogram to observe into
+        *labels: Label values in declaration order
+
+    Returns:
+        Context manager factory timing its body
+    """
+    child = histogram.labels(*labels) if labels else histogram
+
+    @contextmanager
+    def timer():
+        start_ns = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            child.observe((time.perf_counter_ns() - start_ns) / 1e9)
+
+    return timer
+
+
+def classify_error(exc: BaseException) -> str:
+    """
+    Map an exception to a bounded error_type label value.
+
+    Args:
+        exc: Raised exception
+
+    Returns:
+        One of the ERROR_TYPES names, or "other"
+    """
+    for exc_type, name in ERROR_TYPES:
+        if isinstance(exc, exc_type):
+            return name
+    return "other"
+
+
 def track_duration(histogram: Histogram, *labels):
     """
     Context manager to track operation duration.
 
+    For repeated timing of the same labels, bind a timer once with
+    bind_histogram() instead.
+
     Usage:
         with track_duration(search_duration_seconds, "google"):
             # perform search operation
             pass
     """
-    start_time = time.time()
-    try:
-        yield
-    finally:
-        duration = time.time() - start_time
-        histogram.labels(*labels).observe(duration)
+    return bind_histogram(histogram, *labels)()
 
 
 def track_search_operation(engine: str):
@@ -320,22 +388,22 @@ def track_search_operation(engine: str):
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             status = "success"
 
             try:
                 result = await func(*args, **kwargs)
                 # Track result count if result is a list
                 if isinstance(result, list):
-                    search_results_count.labels(engine=engine).observe(len(result))
+                    _child(search_results_count, engine).observe(len(result))
                 return result
             except Exception as e:
                 status = "error"
                 raise
             finally:
-                duration = time.time() - start_time
-                search_duration_seconds.labels(engine=engine).observe(duration)
-                search_operations_total.labels(engine=engine, status=status).inc()
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                _child(search_duration_seconds, engine).observe(duration)
+                _child(search_operations_total, engine, status).inc()
 
         return wrapper
     return decorator
@@ -353,7 +421,7 @@ def track_scraping_operation(func: Callable):
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         status = "success"
 
         try:
@@ -361,13 +429,12 @@ def track_scraping_operation(func: Callable):
             return result
         except Exception as e:
             status = "error"
-            error_type = type(e).__name__
-            scraping_errors_total.labels(error_type=error_type).inc()
+            _child(scraping_errors_total, classify_error(e)).inc()
             raise
         finally:
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             scraping_duration_seconds.observe(duration)
-            scraping_operations_total.labels(status=status).inc()
+            _child(scraping_operations_total, status).inc()
 
     return wrapper
 
@@ -385,7 +452,7 @@ def track_analysis_operation(analysis_type: str):
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             status = "success"
 
             try:
@@ -395,9 +462,9 @@ def track_analysis_operation(analysis_type: str):
                 status = "error"
                 raise
             finally:
-                duration = time.time() - start_time
-                analysis_duration_seconds.labels(analysis_type=analysis_type).observe(duration)
-                analysis_operations_total.labels(analysis_type=analysis_type, status=status).inc()
+                duration = (time.perf_counter_ns() - start_ns) / 1e9
+                _child(analysis_duration_seconds, analysis_type).observe(duration)
+                _child(analysis_operations_total, analysis_type, status).inc()
 
         return wrapper
     return decorator
@@ -415,7 +482,7 @@ def track_network_generation(func: Callable):
     """
     @wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         status = "success"
 
         try:
@@ -432,9 +499,9 @@ def track_network_generation(func: Callable):
             status = "error"
             raise
         finally:
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             network_generation_duration_seconds.observe(duration)
-            network_generation_total.labels(status=status).inc()
+            _child(network_generation_total, status).inc()
 
     return wrapper
 
@@ -443,97 +510,154 @@ def track_network_generation(func: Callable):
 # Middleware for HTTP Metrics
 # ============================================================================
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+# Endpoint label for requests that match no route (404s, scanners)
+UNMATCHED_ENDPOINT = "_unmatched"
+
+
+@lru_cache(maxsize=4096)
+def _route_template(router, method: str, path: str) -> str:
+    """
+    Resolve a request path to its route template.
+
+    Middleware runs before the router has put the matched route in the
+    scope, so the route is matched here. Results are cached per
+    (method, path); the returned labels are bounded by the route table.
+
+    Args:
+        router: Application router
+        method: HTTP method
+        path: Request path
+
+    Returns:
+        Route path template (e.g. /api/search/session/{session_id}), or
+        UNMATCHED_ENDPOINT
     """
-    Middleware to automatically track HTTP request metrics.
+    scope = {"type": "http", "method": method, "path": path, "root_path": ""}
+    partial = None
+
+    for route in router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", UNMATCHED_ENDPOINT)
+        if match == Match.PARTIAL and partial is None:
+            # Path matches but the method doesn't (405)
+            partial = route
+
+    return getattr(partial, "path", UNMATCHED_ENDPOINT)
+
+
+class MetricsMiddleware:
     """
+    ASGI middleware to automatically track HTTP request metrics.
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    Implemented directly on ASGI rather than BaseHTTPMiddleware so
+    responses pass through unwrapped (streaming keeps working) and probe
+    requests skip the middleware entirely.
+    """
+
+    # Metrics and health probe endpoints, not observed
+    SKIP_PATHS = frozenset((
+        "/metrics",
+        "/health",
+        "/health/live",
+        "/health/ready",
+        "/health/startup",
+        "/health/detail",
+    ))
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Route templates allowed as endpoint labels, built on first request
+        # (routers are included after the middleware is added)
+        self._known_paths: Optional[frozenset] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and track metrics.
 
         Args:
-            request: FastAPI request
-            call_next: Next middleware/handler
-
-        Returns:
-            Response from handler
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
-        # Skip metrics endpoint itself
-        if request.url.path == "/metrics":
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in self.SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
 
         # Get method and path
-        method = request.method
-        path = self._get_path_template(request)
-
-        # Track active requests
-        http_requests_active.labels(method=method, endpoint=path).inc()
-
-        # Track request size
-        content_length = request.headers.get("content-length")
-        if content_length:
-            http_request_size_bytes.labels(method=method, endpoint=path).observe(int(content_length))
+        method = scope["method"]
+        path = self._get_path_template(scope)
+        if self._known_paths is None:
+            self._known_paths = frozenset(
+                route.path for route in scope["app"].routes if hasattr(route, "path")
+            )
+        if path not in self._known_paths:
+            path = UNMATCHED_ENDPOINT
+
+        # Track request size (client-supplied header, may be malformed)
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit():
+                    _child(http_request_size_bytes, method, path).observe(int(value))
+                break
+
+        # Stays 500 if the app raises (or is cancelled) before responding
+        status_code = 500
+        response_length = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, response_length
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                for name, value in message.get("headers", ()):
+                    if name == b"content-length":
+                        response_length = int(value)
+                        break
+
+            await send(message)
+
+        # Track active requests; every exit path below decrements
+        active = _child(http_requests_active, method, path)
+        active.inc()
 
         # Track request duration
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-
-            # Track response size
-            if hasattr(response, "body") and response.body:
-                http_response_size_bytes.labels(
-                    method=method,
-                    endpoint=path,
-                    status_code=status_code,
-                ).observe(len(response.body))
-
-            return response
-
-        except Exception as e:
-            status_code = 500
-            raise
-
+            await self.app(scope, receive, send_wrapper)
         finally:
+            # Streamed responses without a Content-Length aren't observed
+            if response_length is not None:
+                _child(http_response_size_bytes, method, path, status_code).observe(
+                    response_length
+                )
+
             # Track duration
-            duration = time.time() - start_time
-            http_request_duration_seconds.labels(
-                method=method,
-                endpoint=path,
-                status_code=status_code,
-            ).observe(duration)
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
+            _child(http_request_duration_seconds, method, path, status_code).observe(duration)
 
             # Track request count
-            http_requests_total.labels(
-                method=method,
-                endpoint=path,
-                status_code=status_code,
-            ).inc()
+            _child(http_requests_total, method, path, status_code).inc()
 
             # Decrement active requests
-            http_requests_active.labels(method=method, endpoint=path).dec()
+            active.dec()
 
     @staticmethod
-    def _get_path_template(request: Request) -> str:
+    def _get_path_template(scope: Scope) -> str:
         """
         Get the path template for the request (e.g., /api/users/{user_id}).
 
+        Never returns the raw URL path: unmatched requests share the
+        UNMATCHED_ENDPOINT label so they can't grow label cardinality.
+
         Args:
-            request: FastAPI request
+            scope: ASGI connection scope
 
         Returns:
-            Path template or actual path
+            Path template or UNMATCHED_ENDPOINT
         """
-        # Try to get the route path template
-        if hasattr(request, "scope") and "route" in request.scope:
-            route = request.scope["route"]
-            if hasattr(route, "path"):
-                return route.path
-
-        # Fallback to actual path
-        return request.url.path
+        return _route_template(scope["app"].router, scope["method"], scope["path"])
 
 
 def setup_metrics(app) -> None:
@@ -543,9 +667,19 @@ def setup_metrics(app) -> None:
     Args:
         app: FastAPI application instance
     """
+    from backend.database import engine
+    from backend.monitoring.pool_metrics import setup_pool_metrics
+    from backend.monitoring.redis_metrics import setup_redis_metrics
+
     # Add metrics middleware
     app.add_middleware(MetricsMiddleware)
 
+    # Pool event counters and scrape-time pool gauges
+    setup_pool_metrics(engine)
+
+    # Scrape-time Redis server gauges
+    setup_redis_metrics()
+
     # Set application info
     app_info.info({
         "version": "0.1.0",
@@ -0,0 +1,117 @@
+"""
+Prometheus metrics for the SQLAlchemy connection pool.
+
+Pool activity is counted by pool event listeners, and pool occupancy is
+read by a collector when Prometheus scrapes, so neither adds work to
+request handling.
+"""
+import logging
+from typing import Iterator, Optional
+
+from prometheus_client import Counter, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+db_pool_checkouts_total = Counter(
+    "db_pool_checkouts_total",
+    "Connections checked out of the database pool",
+)
+
+db_pool_checkins_total = Counter(
+    "db_pool_checkins_total",
+    "Connections returned to the database pool",
+)
+
+db_pool_created_total = Counter(
+    "db_pool_created_total",
+    "New database connections opened by the pool",
+)
+
+db_pool_invalidations_total = Counter(
+    "db_pool_invalidations_total",
+    "Database connections invalidated (disconnects, pre-ping failures)",
+)
+
+
+class PoolCollector(Collector):
+    """Reports pool occupancy gauges at scrape time."""
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        """
+        Read the pool's current state.
+
+        Returns:
+            Iterator of pool gauges
+        """
+        pool = self.engine.sync_engine.pool
+
+        yield GaugeMetricFamily(
+            "db_pool_size", "Configured database pool size", value=pool.size()
+        )
+        yield GaugeMetricFamily(
+            "db_pool_checked_out",
+            "Database connections currently in use",
+            value=pool.checkedout(),
+        )
+        yield GaugeMetricFamily(
+            "db_pool_checked_in",
+            "Idle database connections in the pool",
+            value=pool.checkedin(),
+        )
+        yield GaugeMetricFamily(
+            "db_pool_overflow",
+            "Database connections open beyond the pool size",
+            value=pool.overflow(),
+        )
+
+
+# Collector registered by setup_pool_metrics()
+_collector: Optional[PoolCollector] = None
+
+
+def setup_pool_metrics(engine: AsyncEngine) -> None:
+    """
+    Attach pool event counters and register the pool collector.
+
+    Args:
+        engine: SQLAlchemy async engine
+    """
+    global _collector
+
+    if _collector is not None:
+        return
+
+    pool = engine.sync_engine.pool
+
+    @event.listens_for(pool, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        """Count checkouts."""
+        db_pool_checkouts_total.inc()
+
+    @event.listens_for(pool, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        """Count checkins."""
+        db_pool_checkins_total.inc()
+
+    @event.listens_for(pool, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        """Count new connections."""
+        db_pool_created_total.inc()
+
+    @event.listens_for(pool, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        """Count invalidated connections."""
+        db_pool_invalidations_total.inc()
+
+    _collector = PoolCollector(engine)
+    REGISTRY.register(_collector)
+
+    logger.info("Database pool metrics configured")
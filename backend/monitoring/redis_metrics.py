@@ -0,0 +1,106 @@
+"""
+Prometheus metrics for the Redis server.
+
+Server stats are read by a collector when Prometheus scrapes, instead of
+by the health check on every probe.
+"""
+import logging
+from typing import Iterator, Optional
+
+import redis
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+from backend.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a scrape's Redis round trip
+REDIS_SCRAPE_TIMEOUT = 1.0
+
+
+class RedisCollector(Collector):
+    """Reports Redis server gauges at scrape time."""
+
+    def __init__(self) -> None:
+        # Collected by the sync /metrics endpoint in FastAPI's threadpool,
+        # so a small blocking client is fine here
+        self.client = redis.Redis.from_url(
+            str(settings.redis_url),
+            decode_responses=True,
+            socket_timeout=REDIS_SCRAPE_TIMEOUT,
+            socket_connect_timeout=REDIS_SCRAPE_TIMEOUT,
+            max_connections=1,
+        )
+
+    def describe(self) -> Iterator[GaugeMetricFamily]:
+        """
+        Describe the gauges without reading Redis.
+
+        The registry calls this on register() instead of collect(), so
+        setting up metrics never blocks on a Redis round trip.
+
+        Returns:
+            Iterator of empty Redis gauge families
+        """
+        yield GaugeMetricFamily("redis_up", "Redis reachable at scrape time")
+        yield GaugeMetricFamily(
+            "redis_server_info", "Redis server version", labels=["version"]
+        )
+        yield GaugeMetricFamily("redis_connected_clients", "Clients connected to Redis")
+        yield GaugeMetricFamily("redis_used_memory_bytes", "Memory used by Redis in bytes")
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        """
+        Read the server, clients and memory INFO sections.
+
+        Returns:
+            Iterator of Redis gauges
+        """
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            pipe.info("server")
+            pipe.info("clients")
+            pipe.info("memory")
+            server_info, clients_info, memory_info = pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Redis metrics scrape failed: {e}")
+            yield GaugeMetricFamily("redis_up", "Redis reachable at scrape time", value=0)
+            return
+
+        yield GaugeMetricFamily("redis_up", "Redis reachable at scrape time", value=1)
+
+        version = GaugeMetricFamily(
+            "redis_server_info", "Redis server version", labels=["version"]
+        )
+        version.add_metric([str(server_info.get("redis_version", "unknown"))], 1)
+        yield version
+
+        yield GaugeMetricFamily(
+            "redis_connected_clients",
+            "Clients connected to Redis",
+            value=clients_info.get("connected_clients", 0),
+        )
+        yield GaugeMetricFamily(
+            "redis_used_memory_bytes",
+            "Memory used by Redis in bytes",
+            value=memory_info.get("used_memory", 0),
+        )
+
+
+# Collector registered by setup_redis_metrics()
+_collector: Optional[RedisCollector] = None
+
+
+def setup_redis_metrics() -> None:
+    """Register the Redis collector."""
+    global _collector
+
+    if _collector is not None:
+        return
+
+    _collector = RedisCollector()
+    REGISTRY.register(_collector)
+
+    logger.info("Redis metrics configured")
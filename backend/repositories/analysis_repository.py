@@ -1,16 +1,164 @@
 """Repository for analysis database operations."""
 import logging
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from sqlalchemy import select, delete, func, desc, and_
+from typing import List, Optional, Dict, Any, Iterable
+from sqlalchemy import (
+    BigInteger,
+    Integer,
+    bindparam,
+    cast,
+    delete,
+    desc,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-
-from backend.models.analysis import ExtractedNoun, ExtractedEntity, ContentAnalysis
+from sqlalchemy.orm import contains_eager, selectinload
+
+from backend.models.analysis import (
+    ExtractedNoun,
+    ExtractedEntity,
+    ContentAnalysis,
+    NounJobAggregate,
+    pack_positions,
+    scale_confidence,
+    unpack_positions,
+)
+from backend.database import utcnow
 from backend.models.website import WebsiteContent
 
 logger = logging.getLogger(__name__)
 
+# Row count above which COPY beats a batched INSERT
+COPY_MIN_ROWS = 100
+
+# Column order and binary COPY types for copy_nouns()
+NOUN_COPY_COLUMNS = (
+    ("website_content_id", "int8"),
+    ("word", "text"),
+    ("lemma", "text"),
+    ("frequency", "int4"),
+    ("tfidf_score", "float8"),
+    ("positions_blob", "bytea"),
+    ("language", "text"),
+    ("extraction_method", "text"),
+    ("phrase_length", "int4"),
+    ("pos_tag", "text"),
+)
+
+# Column order and binary COPY types for copy_entities()
+ENTITY_COPY_COLUMNS = (
+    ("website_content_id", "int8"),
+    ("text", "text"),
+    ("label", "text"),
+    ("start_pos", "int4"),
+    ("end_pos", "int4"),
+    ("confidence_x10000", "int2"),
+    ("frequency", "int4"),
+    ("language", "text"),
+    ("extraction_method", "text"),
+)
+
+# Hot per-request selects, built once; callers bind the parameters
+_select_analysis_by_content = select(ContentAnalysis).where(
+    ContentAnalysis.website_content_id == bindparam("content_id")
+)
+_select_nouns_by_content = (
+    select(ExtractedNoun)
+    .where(ExtractedNoun.website_content_id == bindparam("content_id"))
+    .order_by(desc(ExtractedNoun.tfidf_score))
+)
+
+
+# Per-job noun rollup maintenance. The advisory lock (namespace, job)
+# serializes concurrent refreshes of one job until their transactions
+# end; each later statement then sees the other writer's committed nouns.
+NOUN_JOB_AGG_LOCK_NAMESPACE = 0x6E6A61  # "nja"
+
+_lock_noun_job_agg = select(
+    func.pg_advisory_xact_lock(
+        NOUN_JOB_AGG_LOCK_NAMESPACE, bindparam("job_id", type_=Integer)
+    )
+)
+_delete_noun_job_agg = delete(NounJobAggregate.__table__).where(
+    NounJobAggregate.__table__.c.scraping_job_id == bindparam("job_id")
+)
+# Group per (content, lemma) first so the content count is a plain
+# COUNT(*) rather than COUNT(DISTINCT)
+_job_nouns_per_content = (
+    select(
+        WebsiteContent.scraping_job_id,
+        ExtractedNoun.lemma,
+        func.sum(ExtractedNoun.frequency).label("frequency"),
+        func.sum(ExtractedNoun.tfidf_score).label("tfidf_sum"),
+        func.count().label("noun_count"),
+        func.min(ExtractedNoun.word).label("word"),
+    )
+    .join(WebsiteContent, ExtractedNoun.website_content_id == WebsiteContent.id)
+    .where(WebsiteContent.scraping_job_id == bindparam("job_id"))
+    .group_by(
+        WebsiteContent.scraping_job_id,
+        ExtractedNoun.website_content_id,
+        ExtractedNoun.lemma,
+    )
+    .subquery()
+)
+_insert_noun_job_agg = insert(NounJobAggregate.__table__).from_select(
+    [
+        "scraping_job_id",
+        "lemma",
+        "total_frequency",
+        "avg_tfidf_score",
+        "content_count",
+        "example_word",
+    ],
+    select(
+        _job_nouns_per_content.c.scraping_job_id,
+        _job_nouns_per_content.c.lemma,
+        func.sum(_job_nouns_per_content.c.frequency),
+        func.sum(_job_nouns_per_content.c.tfidf_sum)
+        / func.sum(_job_nouns_per_content.c.noun_count),
+        func.count(),
+        func.min(_job_nouns_per_content.c.word),
+    ).group_by(
+        _job_nouns_per_content.c.scraping_job_id,
+        _job_nouns_per_content.c.lemma,
+    ),
+)
+
+
+def _noun_row(noun_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map a noun dictionary to ExtractedNoun column values.
+
+    Args:
+        noun_data: Noun dictionary (positions as a list of ints)
+
+    Returns:
+        Dictionary keyed by mapped column attributes
+    """
+    row = dict(noun_data)
+    if "positions" in row:
+        row["positions_blob"] = pack_positions(row.pop("positions") or [])
+    return row
+
+
+def _entity_row(entity_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Map an entity dictionary to ExtractedEntity column values.
+
+    Args:
+        entity_data: Entity dictionary (confidence as 0.0-1.0)
+
+    Returns:
+        Dictionary keyed by mapped column attributes
+    """
+    row = dict(entity_data)
+    if "confidence" in row:
+        row["confidence_x10000"] = scale_confidence(row.pop("confidence"))
+    return row
+
 
 class AnalysisRepository:
     """
@@ -59,7 +207,8 @@ class AnalysisRepository:
             max_nouns=max_nouns,
             min_frequency=min_frequency,
             status="pending",
-            started_at=datetime.utcnow(),
+            # Database clock; eager_defaults fetches it back on flush
+            started_at=utcnow(),
         )
 
         self.session.add(analysis)
@@ -80,10 +229,9 @@ class AnalysisRepository:
         Returns:
             ContentAnalysis object or None
         """
-        stmt = select(ContentAnalysis).where(
-            ContentAnalysis.website_content_id == content_id
+        result = await self.session.execute(
+            _select_analysis_by_content, {"content_id": content_id}
         )
-        result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
     async def update_analysis_status(
@@ -109,33 +257,33 @@ class AnalysisRepository:
         Returns:
             Updated ContentAnalysis object or None
         """
-        stmt = select(ContentAnalysis).where(ContentAnalysis.id == analysis_id)
+        changes = {
+            key: value
+            for key, value in (
+                ("error_message", error_message),
+                ("nouns_count", nouns_count),
+                ("entities_count", entities_count),
+                ("processing_duration", processing_duration),
+            )
+            if value is not None
+        }
+        if status == "completed":
+            changes["completed_at"] = utcnow()
+
+        # Single UPDATE ... RETURNING; updated_at is set by onupdate
+        stmt = (
+            update(ContentAnalysis)
+            .where(ContentAnalysis.id == analysis_id)
+            .values(status=status, **changes)
+            .returning(ContentAnalysis)
+            .execution_options(populate_existing=True)
+        )
         result = await self.session.execute(stmt)
         analysis = result.scalar_one_or_none()
 
         if not analysis:
             return None
 
-        analysis.status = status
-        analysis.updated_at = datetime.utcnow()
-
-        if status == "completed":
-            analysis.completed_at = datetime.utcnow()
-
-        if error_message is not None:
-            analysis.error_message = error_message
-
-        if nouns_count is not None:
-            analysis.nouns_count = nouns_count
-
-        if entities_count is not None:
-            analysis.entities_count = entities_count
-
-        if processing_duration is not None:
-            analysis.processing_duration = processing_duration
-
-        await self.session.flush()
-
         logger.debug(
             f"Updated analysis {analysis_id} to status: {status}"
         )
@@ -151,12 +299,28 @@ class AnalysisRepository:
         Returns:
             True if deleted, False if not found
         """
-        # Delete analysis (cascade will delete nouns and entities)
-        stmt = delete(ContentAnalysis).where(
-            ContentAnalysis.website_content_id == content_id
+        # Nouns and entities reference the content, not the analysis, so
+        # no FK cascade covers them. Delete all three in one statement
+        # with data-modifying CTEs.
+        deleted_nouns = (
+            delete(ExtractedNoun)
+            .where(ExtractedNoun.website_content_id == content_id)
+            .returning(ExtractedNoun.id)
+            .cte("deleted_nouns")
+        )
+        deleted_entities = (
+            delete(ExtractedEntity)
+            .where(ExtractedEntity.website_content_id == content_id)
+            .returning(ExtractedEntity.id)
+            .cte("deleted_entities")
+        )
+        stmt = (
+            delete(ContentAnalysis)
+            .where(ContentAnalysis.website_content_id == content_id)
+            .add_cte(deleted_nouns)
+            .add_cte(deleted_entities)
         )
         result = await self.session.execute(stmt)
-        await self.session.flush()
 
         deleted = result.rowcount > 0
         if deleted:
@@ -181,16 +345,130 @@ class AnalysisRepository:
         if not nouns:
             return []
 
-        # Create model instances
-        noun_objects = [ExtractedNoun(**noun_data) for noun_data in nouns]
-
-        # Add all at once
-        self.session.add_all(noun_objects)
-        await self.session.flush()
+        # ORM bulk INSERT: batched via insertmanyvalues, with the PK
+        # sentinel keeping RETURNING rows in parameter order
+        result = await self.session.scalars(
+            insert(ExtractedNoun).returning(
+                ExtractedNoun, sort_by_parameter_order=True
+            ),
+            [_noun_row(noun_data) for noun_data in nouns],
+        )
+        noun_objects = list(result.all())
 
         logger.debug(f"Bulk created {len(noun_objects)} nouns")
         return noun_objects
 
+    async def _copy_rows(
+        self,
+        table_name: str,
+        columns: tuple,
+        rows: Iterable[tuple],
+    ) -> None:
+        """
+        Stream rows into a table with PostgreSQL binary COPY.
+
+        Runs a single COPY FROM STDIN on the session's connection, so
+        the rows are part of the current transaction.
+
+        Args:
+            table_name: Target table
+            columns: (column name, COPY type) pairs in row order
+            rows: Row tuples matching columns
+        """
+        connection = await self.session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        column_list = ", ".join(name for name, _ in columns)
+        types = [type_name for _, type_name in columns]
+
+        async with driver_connection.cursor() as cursor:
+            async with cursor.copy(
+                f"COPY {table_name} ({column_list}) "
+                f"FROM STDIN WITH (FORMAT BINARY)"
+            ) as copy:
+                copy.set_types(types)
+                for row in rows:
+                    await copy.write_row(row)
+
+    async def _insert_rows(self, model: type, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert rows with a Core executemany.
+
+        Skips ORM object construction and RETURNING; SQLAlchemy batches
+        the rows into multi-row INSERTs (insertmanyvalues).
+
+        Args:
+            model: Mapped class whose table receives the rows
+            rows: Column value dictionaries
+        """
+        await self.session.execute(insert(model.__table__), rows)
+
+    async def _use_copy(self, row_count: int) -> bool:
+        """
+        Whether a bulk insert of row_count rows should use COPY.
+
+        Small batches go through the batched INSERT, where COPY's
+        setup cost isn't repaid.
+
+        Args:
+            row_count: Number of rows to insert
+
+        Returns:
+            True for large batches on PostgreSQL
+        """
+        if row_count <= COPY_MIN_ROWS:
+            return False
+        connection = await self.session.connection()
+        return connection.dialect.name == "postgresql"
+
+    async def copy_nouns(self, nouns: List[Dict[str, Any]]) -> int:
+        """
+        Bulk insert nouns with PostgreSQL binary COPY.
+
+        Streams all rows in a single COPY FROM STDIN on the session's
+        connection (same transaction), bypassing the ORM. Use this on
+        write paths that don't need the created objects back. Batches
+        of COPY_MIN_ROWS or fewer use a Core batched INSERT instead.
+
+        Args:
+            nouns: List of noun dictionaries
+
+        Returns:
+            Number of nouns inserted
+        """
+        if not nouns:
+            return 0
+
+        if not await self._use_copy(len(nouns)):
+            await self._insert_rows(
+                ExtractedNoun, [_noun_row(noun_data) for noun_data in nouns]
+            )
+            return len(nouns)
+
+        await self._copy_rows(
+            ExtractedNoun.__tablename__,
+            NOUN_COPY_COLUMNS,
+            (
+                (
+                    noun_data["website_content_id"],
+                    noun_data["word"],
+                    noun_data["lemma"],
+                    noun_data["frequency"],
+                    noun_data["tfidf_score"],
+                    pack_positions(noun_data.get("positions") or []),
+                    noun_data["language"],
+                    noun_data.get("extraction_method", "noun"),
+                    noun_data.get("phrase_length"),
+                    noun_data.get("pos_tag"),
+                )
+                for noun_data in nouns
+            ),
+        )
+
+        logger.debug(f"Copied {len(nouns)} nouns")
+        return len(nouns)
+
     async def get_nouns_by_content_id(
         self, content_id: int, limit: Optional[int] = None
     ) -> List[ExtractedNoun]:
@@ -204,8 +482,38 @@ class AnalysisRepository:
         Returns:
             List of ExtractedNoun objects
         """
+        stmt = _select_nouns_by_content
+        if limit:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt, {"content_id": content_id})
+        return list(result.scalars().all())
+
+    async def get_noun_rows_by_content_id(
+        self, content_id: int, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get nouns for a content as plain dictionaries.
+
+        Read-only counterpart of get_nouns_by_content_id(): selects only
+        the response columns, skipping ORM instances and the identity
+        map.
+
+        Args:
+            content_id: Website content ID
+            limit: Optional limit on results
+
+        Returns:
+            Noun dictionaries ordered by TF-IDF score
+        """
         stmt = (
-            select(ExtractedNoun)
+            select(
+                ExtractedNoun.word,
+                ExtractedNoun.lemma,
+                ExtractedNoun.frequency,
+                ExtractedNoun.tfidf_score,
+                ExtractedNoun.positions_blob,
+            )
             .where(ExtractedNoun.website_content_id == content_id)
             .order_by(desc(ExtractedNoun.tfidf_score))
         )
@@ -214,7 +522,16 @@ class AnalysisRepository:
             stmt = stmt.limit(limit)
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return [
+            {
+                "word": row.word,
+                "lemma": row.lemma,
+                "frequency": row.frequency,
+                "tfidf_score": row.tfidf_score,
+                "positions": unpack_positions(row.positions_blob),
+            }
+            for row in result
+        ]
 
     async def delete_nouns_by_content_id(self, content_id: int) -> int:
         """
@@ -230,7 +547,6 @@ class AnalysisRepository:
             ExtractedNoun.website_content_id == content_id
         )
         result = await self.session.execute(stmt)
-        await self.session.flush()
 
         return result.rowcount
 
@@ -251,18 +567,65 @@ class AnalysisRepository:
         if not entities:
             return []
 
-        # Create model instances
-        entity_objects = [
-            ExtractedEntity(**entity_data) for entity_data in entities
-        ]
-
-        # Add all at once
-        self.session.add_all(entity_objects)
-        await self.session.flush()
+        # ORM bulk INSERT: batched via insertmanyvalues, with the PK
+        # sentinel keeping RETURNING rows in parameter order
+        result = await self.session.scalars(
+            insert(ExtractedEntity).returning(
+                ExtractedEntity, sort_by_parameter_order=True
+            ),
+            [_entity_row(entity_data) for entity_data in entities],
+        )
+        entity_objects = list(result.all())
 
         logger.debug(f"Bulk created {len(entity_objects)} entities")
         return entity_objects
 
+    async def copy_entities(self, entities: List[Dict[str, Any]]) -> int:
+        """
+        Bulk insert entities with PostgreSQL binary COPY.
+
+        Counterpart of copy_nouns() for write paths that don't need the
+        created objects back. Batches of COPY_MIN_ROWS or fewer use a
+        Core batched INSERT instead.
+
+        Args:
+            entities: List of entity dictionaries
+
+        Returns:
+            Number of entities inserted
+        """
+        if not entities:
+            return 0
+
+        if not await self._use_copy(len(entities)):
+            await self._insert_rows(
+                ExtractedEntity,
+                [_entity_row(entity_data) for entity_data in entities],
+            )
+            return len(entities)
+
+        await self._copy_rows(
+            ExtractedEntity.__tablename__,
+            ENTITY_COPY_COLUMNS,
+            (
+                (
+                    entity_data["website_content_id"],
+                    entity_data["text"],
+                    entity_data["label"],
+                    entity_data["start_pos"],
+                    entity_data["end_pos"],
+                    scale_confidence(entity_data.get("confidence", 1.0)),
+                    entity_data.get("frequency", 1),
+                    entity_data["language"],
+                    entity_data.get("extraction_method", "spacy"),
+                )
+                for entity_data in entities
+            ),
+        )
+
+        logger.debug(f"Copied {len(entities)} entities")
+        return len(entities)
+
     async def get_entities_by_content_id(
         self,
         content_id: int,
@@ -295,6 +658,44 @@ class AnalysisRepository:
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_entity_rows_by_content_id(
+        self,
+        content_id: int,
+        label: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get entities for a content as plain dictionaries.
+
+        Read-only counterpart of get_entities_by_content_id().
+
+        Args:
+            content_id: Website content ID
+            label: Optional entity type filter
+            limit: Optional limit on results
+
+        Returns:
+            Entity dictionaries ordered by start position
+        """
+        stmt = select(
+            ExtractedEntity.text,
+            ExtractedEntity.label,
+            ExtractedEntity.start_pos,
+            ExtractedEntity.end_pos,
+            ExtractedEntity.confidence.label("confidence"),
+        ).where(ExtractedEntity.website_content_id == content_id)
+
+        if label:
+            stmt = stmt.where(ExtractedEntity.label == label)
+
+        stmt = stmt.order_by(ExtractedEntity.start_pos)
+
+        if limit:
+            stmt = stmt.limit(limit)
+
+        result = await self.session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
     async def delete_entities_by_content_id(self, content_id: int) -> int:
         """
         Delete all entities for a content.
@@ -309,7 +710,6 @@ class AnalysisRepository:
             ExtractedEntity.website_content_id == content_id
         )
         result = await self.session.execute(stmt)
-        await self.session.flush()
 
         return result.rowcount
 
@@ -321,6 +721,9 @@ class AnalysisRepository:
         """
         Get aggregated noun statistics for a scraping job.
 
+        Reads the noun_job_agg rollup, which every noun write refreshes
+        for its job in the same transaction.
+
         Args:
             job_id: Scraping job ID
             top_n: Number of top nouns to return
@@ -328,24 +731,16 @@ class AnalysisRepository:
         Returns:
             List of dictionaries with aggregated noun data
         """
-        # Join ExtractedNoun with WebsiteContent to filter by job
         stmt = (
             select(
-                ExtractedNoun.lemma,
-                func.sum(ExtractedNoun.frequency).label("total_frequency"),
-                func.avg(ExtractedNoun.tfidf_score).label("avg_tfidf_score"),
-                func.count(ExtractedNoun.website_content_id.distinct()).label(
-                    "content_count"
-                ),
-                func.min(ExtractedNoun.word).label("example_word"),
-            )
-            .join(
-                WebsiteContent,
-                ExtractedNoun.website_content_id == WebsiteContent.id,
+                NounJobAggregate.lemma,
+                NounJobAggregate.total_frequency,
+                NounJobAggregate.avg_tfidf_score,
+                NounJobAggregate.content_count,
+                NounJobAggregate.example_word,
             )
-            .where(WebsiteContent.scraping_job_id == job_id)
-            .group_by(ExtractedNoun.lemma)
-            .order_by(desc("total_frequency"))
+            .where(NounJobAggregate.scraping_job_id == job_id)
+            .order_by(desc(NounJobAggregate.total_frequency))
             .limit(top_n)
         )
 
@@ -363,6 +758,25 @@ class AnalysisRepository:
             for row in rows
         ]
 
+    async def refresh_noun_job_aggregates(
+        self, job_ids: Iterable[Optional[int]]
+    ) -> None:
+        """
+        Recompute the noun_job_agg rollup of the given jobs.
+
+        Call in the transaction that wrote the jobs' nouns, before it
+        commits. Only the given jobs are recomputed; jobs are locked in
+        ID order so concurrent writers can't deadlock.
+
+        Args:
+            job_ids: Scraping job IDs (None entries are ignored)
+        """
+        for job_id in sorted({job_id for job_id in job_ids if job_id is not None}):
+            params = {"job_id": job_id}
+            await self.session.execute(_lock_noun_job_agg, params)
+            await self.session.execute(_delete_noun_job_agg, params)
+            await self.session.execute(_insert_noun_job_agg, params)
+
     async def get_aggregated_entities_for_job(
         self, job_id: int, top_n: int = 50
     ) -> List[Dict[str, Any]]:
@@ -376,22 +790,36 @@ class AnalysisRepository:
         Returns:
             List of dictionaries with aggregated entity data
         """
-        # Join ExtractedEntity with WebsiteContent to filter by job
-        stmt = (
+        # Mentions per (entity, content) first, so the content count is a
+        # plain COUNT(*) instead of a COUNT(DISTINCT) per group
+        per_content = (
             select(
                 ExtractedEntity.text,
                 ExtractedEntity.label,
-                func.count(ExtractedEntity.id).label("frequency"),
-                func.count(
-                    ExtractedEntity.website_content_id.distinct()
-                ).label("content_count"),
+                func.count().label("mentions"),
             )
             .join(
                 WebsiteContent,
                 ExtractedEntity.website_content_id == WebsiteContent.id,
             )
             .where(WebsiteContent.scraping_job_id == job_id)
-            .group_by(ExtractedEntity.text, ExtractedEntity.label)
+            .group_by(
+                ExtractedEntity.text,
+                ExtractedEntity.label,
+                ExtractedEntity.website_content_id,
+            )
+            .subquery()
+        )
+        stmt = (
+            select(
+                per_content.c.text,
+                per_content.c.label,
+                cast(func.sum(per_content.c.mentions), BigInteger).label(
+                    "frequency"
+                ),
+                func.count().label("content_count"),
+            )
+            .group_by(per_content.c.text, per_content.c.label)
             .order_by(desc("frequency"))
             .limit(top_n)
         )
@@ -449,47 +877,26 @@ class AnalysisRepository:
         Returns:
             Dictionary with analysis statistics
         """
-        # Count total contents
-        total_stmt = (
-            select(func.count(WebsiteContent.id))
-            .where(WebsiteContent.scraping_job_id == job_id)
-        )
-        total_result = await self.session.execute(total_stmt)
-        total_contents = total_result.scalar() or 0
-
-        # Count analyzed contents
-        analyzed_stmt = (
-            select(func.count(ContentAnalysis.id))
-            .join(
-                WebsiteContent,
-                ContentAnalysis.website_content_id == WebsiteContent.id,
-            )
-            .where(
-                and_(
-                    WebsiteContent.scraping_job_id == job_id,
-                    ContentAnalysis.status == "completed",
-                )
+        # One pass over the job's contents, counting analyses by status
+        stmt = (
+            select(
+                func.count(WebsiteContent.id).label("total_contents"),
+                func.count(ContentAnalysis.id)
+                .filter(ContentAnalysis.status == "completed")
+                .label("analyzed_contents"),
+                func.count(ContentAnalysis.id)
+                .filter(ContentAnalysis.status == "failed")
+                .label("failed_contents"),
             )
-        )
-        analyzed_result = await self.session.execute(analyzed_stmt)
-        analyzed_contents = analyzed_result.scalar() or 0
-
-        # Count failed analyses
-        failed_stmt = (
-            select(func.count(ContentAnalysis.id))
-            .join(
-                WebsiteContent,
+            .select_from(WebsiteContent)
+            .outerjoin(
+                ContentAnalysis,
                 ContentAnalysis.website_content_id == WebsiteContent.id,
             )
-            .where(
-                and_(
-                    WebsiteContent.scraping_job_id == job_id,
-                    ContentAnalysis.status == "failed",
-                )
-            )
+            .where(WebsiteContent.scraping_job_id == job_id)
         )
-        failed_result = await self.session.execute(failed_stmt)
-        failed_contents = failed_result.scalar() or 0
+        result = await self.session.execute(stmt)
+        total_contents, analyzed_contents, failed_contents = result.one()
 
         return {
             "total_contents": total_contents,
@@ -509,12 +916,19 @@ class AnalysisRepository:
         Returns:
             WebsiteContent with analysis relationships loaded
         """
+        # The one-to-one analysis comes from a LEFT JOIN in the main query;
+        # the large noun/entity collections are loaded by IN queries
+        # rather than joined, which would multiply the rows
         stmt = (
             select(WebsiteContent)
+            .outerjoin(
+                ContentAnalysis,
+                ContentAnalysis.website_content_id == WebsiteContent.id,
+            )
             .options(
+                contains_eager(WebsiteContent.analysis),
                 selectinload(WebsiteContent.extracted_nouns),
                 selectinload(WebsiteContent.extracted_entities),
-                selectinload(WebsiteContent.analysis),
             )
             .where(WebsiteContent.id == content_id)
         )
@@ -1,14 +1,35 @@
 """Repository for network database operations."""
 import logging
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import select, delete, func, desc, and_, or_
+from sqlalchemy import (
+    Integer, bindparam, select, insert, update, delete, func, desc, tuple_, and_, or_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.models.network import NetworkExport
+from backend.models.network import NetworkExport, NetworkExportSession
+from backend.models.search import SearchSession
 
 logger = logging.getLogger(__name__)
 
+# Hot per-request selects, built once; callers bind the parameters
+_select_network_by_id = select(NetworkExport).where(
+    NetworkExport.id == bindparam("network_id")
+)
+_count_user_networks = (
+    select(func.count())
+    .select_from(NetworkExport)
+    .where(NetworkExport.user_id == bindparam("user_id"))
+)
+# Link rows only for sessions that still exist: one may be deleted while
+# the network is being built, and the session_id FK would reject it
+_insert_network_sessions = insert(NetworkExportSession.__table__).from_select(
+    ["network_id", "session_id"],
+    select(bindparam("network_id", type_=Integer), SearchSession.id).where(
+        SearchSession.id.in_(bindparam("session_ids", expanding=True))
+    ),
+)
+
 
 class NetworkRepository:
     """
@@ -82,9 +103,16 @@ class NetworkRepository:
             backboning_statistics=backboning_statistics,
         )
 
+        # eager_defaults: id and the server-side timestamps come back via
+        # RETURNING on flush, no refresh needed
         self.session.add(network)
         await self.session.flush()
-        await self.session.refresh(network)
+
+        if session_ids:
+            await self.session.execute(
+                _insert_network_sessions,
+                {"network_id": network.id, "session_ids": session_ids},
+            )
 
         logger.info(
             f"Created network export: id={network.id}, "
@@ -103,10 +131,44 @@ class NetworkRepository:
         Returns:
             NetworkExport object or None
         """
-        stmt = select(NetworkExport).where(NetworkExport.id == network_id)
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(
+            _select_network_by_id, {"network_id": network_id}
+        )
         return result.scalar_one_or_none()
 
+    @staticmethod
+    def _select_user_networks(
+        user_id: int,
+        network_type: Optional[str] = None,
+        session_id: Optional[int] = None,
+    ):
+        """
+        Select a user's networks with the optional list filters applied.
+
+        Args:
+            user_id: User ID
+            network_type: Optional filter by network type
+            session_id: Optional filter by session ID
+
+        Returns:
+            Select statement for NetworkExport
+        """
+        stmt = select(NetworkExport).where(NetworkExport.user_id == user_id)
+
+        if network_type:
+            stmt = stmt.where(NetworkExport.type == network_type)
+
+        if session_id:
+            stmt = stmt.where(
+                NetworkExport.id.in_(
+                    select(NetworkExportSession.network_id).where(
+                        NetworkExportSession.session_id == session_id
+                    )
+                )
+            )
+
+        return stmt
+
     async def get_by_user(
         self,
         user_id: int,
@@ -128,32 +190,29 @@ class NetworkRepository:
         Returns:
             Tuple of (networks list, total count)
         """
-        # Base query
-        stmt = select(NetworkExport).where(NetworkExport.user_id == user_id)
-
-        # Apply filters
-        if network_type:
-            stmt = stmt.where(NetworkExport.type == network_type)
-
-        if session_id:
-            # PostgreSQL array contains
-            stmt = stmt.where(NetworkExport.session_ids.contains([session_id]))
-
-        # Count total
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        count_result = await self.session.execute(count_stmt)
-        total = count_result.scalar() or 0
+        stmt = self._select_user_networks(user_id, network_type, session_id)
 
-        # Apply ordering and pagination
-        stmt = (
+        # Page rows and the filtered total in one query
+        page_stmt = (
             stmt
-            .order_by(desc(NetworkExport.created_at))
+            .add_columns(func.count().over().label("total"))
+            .order_by(desc(NetworkExport.created_at), desc(NetworkExport.id))
             .offset((page - 1) * per_page)
             .limit(per_page)
         )
 
-        result = await self.session.execute(stmt)
-        networks = list(result.scalars().all())
+        result = await self.session.execute(page_stmt)
+        rows = result.all()
+        networks = [row.NetworkExport for row in rows]
+
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page: no row carries the total
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total = await self.session.scalar(count_stmt) or 0
+        else:
+            total = 0
 
         logger.debug(
             f"Retrieved {len(networks)} networks for user {user_id} "
@@ -162,6 +221,56 @@ class NetworkRepository:
 
         return networks, total
 
+    async def get_by_user_after(
+        self,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        per_page: int = 20,
+        network_type: Optional[str] = None,
+        session_id: Optional[int] = None,
+    ) -> Tuple[List[NetworkExport], Optional[Tuple[datetime, int]]]:
+        """
+        Get networks for a user with keyset pagination.
+
+        Pages newest first. Unlike get_by_user(), the cost of a page
+        doesn't grow with its depth.
+
+        Args:
+            user_id: User ID
+            cursor: (created_at, id) of the last network of the previous
+                page, or None for the first page
+            per_page: Results per page
+            network_type: Optional filter by network type
+            session_id: Optional filter by session ID
+
+        Returns:
+            Tuple of (networks list, cursor for the next page or None)
+        """
+        stmt = self._select_user_networks(user_id, network_type, session_id)
+
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(NetworkExport.created_at, NetworkExport.id) < cursor
+            )
+
+        # One extra row tells whether another page follows, so the last
+        # page never hands out a cursor to an empty one
+        stmt = (
+            stmt
+            .order_by(desc(NetworkExport.created_at), desc(NetworkExport.id))
+            .limit(per_page + 1)
+        )
+
+        result = await self.session.execute(stmt)
+        networks = list(result.scalars().all())
+
+        next_cursor = None
+        if len(networks) > per_page:
+            networks = networks[:per_page]
+            next_cursor = (networks[-1].created_at, networks[-1].id)
+
+        return networks, next_cursor
+
     async def get_by_session(
         self,
         session_id: int,
@@ -177,8 +286,13 @@ class NetworkRepository:
         Returns:
             List of NetworkExport objects
         """
-        stmt = select(NetworkExport).where(
-            NetworkExport.session_ids.contains([session_id])
+        stmt = (
+            select(NetworkExport)
+            .join(
+                NetworkExportSession,
+                NetworkExportSession.network_id == NetworkExport.id,
+            )
+            .where(NetworkExportSession.session_id == session_id)
         )
 
         if user_id:
@@ -201,7 +315,6 @@ class NetworkRepository:
         """
         stmt = delete(NetworkExport).where(NetworkExport.id == network_id)
         result = await self.session.execute(stmt)
-        await self.session.flush()
 
         deleted = result.rowcount > 0
         if deleted:
@@ -228,37 +341,43 @@ class NetworkRepository:
         Returns:
             Updated NetworkExport object or None
         """
-        stmt = select(NetworkExport).where(NetworkExport.id == network_id)
+        # Single UPDATE ... RETURNING; updated_at is set by onupdate
+        stmt = (
+            update(NetworkExport)
+            .where(NetworkExport.id == network_id)
+            .values(
+                node_count=node_count,
+                edge_count=edge_count,
+                file_size=file_size,
+            )
+            .returning(NetworkExport)
+            .execution_options(populate_existing=True)
+        )
         result = await self.session.execute(stmt)
         network = result.scalar_one_or_none()
 
         if not network:
             return None
 
-        network.node_count = node_count
-        network.edge_count = edge_count
-        network.file_size = file_size
-        network.updated_at = datetime.utcnow()
-
-        await self.session.flush()
-        await self.session.refresh(network)
-
         logger.debug(f"Updated network statistics: id={network_id}")
 
         return network
 
-    async def get_old_exports(
+    async def iter_old_exports(
         self,
         days: int = 30,
-    ) -> List[NetworkExport]:
+    ) -> AsyncIterator[NetworkExport]:
         """
-        Get network exports older than specified days.
+        Stream network exports older than specified days.
+
+        Rows are fetched from a server-side cursor in batches, so memory
+        stays constant however many exports match.
 
         Args:
             days: Number of days
 
-        Returns:
-            List of old NetworkExport objects
+        Yields:
+            Old NetworkExport objects, oldest first
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
@@ -266,10 +385,42 @@ class NetworkRepository:
             select(NetworkExport)
             .where(NetworkExport.created_at < cutoff_date)
             .order_by(NetworkExport.created_at)
+            .execution_options(yield_per=500)
+        )
+
+        result = await self.session.stream_scalars(stmt)
+        async for network in result:
+            yield network
+
+    async def delete_old_exports(
+        self,
+        days: int = 30,
+    ) -> List[str]:
+        """
+        Delete network exports older than specified days.
+
+        One DELETE ... RETURNING, without loading the exports.
+
+        Args:
+            days: Number of days
+
+        Returns:
+            File paths of the deleted exports
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days)
+
+        stmt = (
+            delete(NetworkExport)
+            .where(NetworkExport.created_at < cutoff_date)
+            .returning(NetworkExport.file_path)
         )
 
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        file_paths = list(result.scalars().all())
+
+        logger.info(f"Deleted {len(file_paths)} network exports older than {days} days")
+
+        return file_paths
 
     async def get_user_network_count(self, user_id: int) -> int:
         """
@@ -281,13 +432,9 @@ class NetworkRepository:
         Returns:
             Network count
         """
-        stmt = (
-            select(func.count())
-            .select_from(NetworkExport)
-            .where(NetworkExport.user_id == user_id)
+        result = await self.session.execute(
+            _count_user_networks, {"user_id": user_id}
         )
-
-        result = await self.session.execute(stmt)
         return result.scalar() or 0
 
     async def get_network_types_count(
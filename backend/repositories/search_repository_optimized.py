@@ -9,11 +9,125 @@ This file demonstrates best practices for query optimization:
 
 Apply these patterns to all repositories.
 """
-from typing import List, Optional
-from sqlalchemy import select, func, and_
+from typing import AsyncIterator, List, Optional, Tuple
+from sqlalchemy import (
+    Boolean,
+    Integer,
+    Text,
+    and_,
+    bindparam,
+    cast,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import contains_eager, selectinload, raiseload
+from backend.models.analysis import ExtractedNoun
+from backend.models.scraping import ScrapingJob
 from backend.models.search import SearchSession, SearchQuery, SearchResult
+from backend.models.website import WebsiteContent
+
+# Hot per-request statements, built once so each call skips statement
+# construction and its cache key lookup hits SQLAlchemy's compiled cache
+# (DATABASE_QUERY_CACHE_SIZE); callers bind the parameters
+_select_session_with_results = (
+    select(SearchSession)
+    .where(SearchSession.id == bindparam("session_id"))
+    .outerjoin(SearchSession.queries)
+    .outerjoin(SearchQuery.results)
+    .options(
+        # Populate both collections from the joined rows
+        contains_eager(SearchSession.queries).contains_eager(SearchQuery.results)
+    )
+)
+_select_user_sessions_with_results = (
+    select(SearchSession)
+    .where(
+        SearchSession.id.in_(bindparam("session_ids", expanding=True)),
+        SearchSession.user_id == bindparam("user_id"),
+    )
+    .options(
+        # One SELECT IN per level, however many sessions are loaded
+        selectinload(SearchSession.queries).selectinload(SearchQuery.results)
+    )
+)
+_session_query_count = (
+    select(func.count(SearchQuery.id))
+    .where(SearchQuery.session_id == SearchSession.id)
+    .correlate(SearchSession)
+    .scalar_subquery()
+)
+_select_user_sessions_with_query_count = (
+    select(SearchSession, _session_query_count.label("query_count"))
+    .where(SearchSession.user_id == bindparam("user_id"))
+    .order_by(SearchSession.created_at.desc())
+    .limit(bindparam("limit"))
+    .options(raiseload("*"))
+)
+_select_results_with_content = (
+    select(SearchResult, WebsiteContent)
+    .outerjoin(WebsiteContent, SearchResult.url == WebsiteContent.url)
+    .where(SearchResult.query_id == bindparam("query_id"))
+    .order_by(SearchResult.rank)
+    .execution_options(yield_per=500)
+)
+_total_frequency = func.sum(ExtractedNoun.frequency).label("total_frequency")
+_select_session_top_nouns = (
+    select(
+        ExtractedNoun.lemma,
+        _total_frequency,
+        func.avg(ExtractedNoun.tfidf_score).label("avg_tfidf"),
+        func.count().label("occurrence_count"),
+    )
+    .join(WebsiteContent, ExtractedNoun.website_content_id == WebsiteContent.id)
+    .join(ScrapingJob, WebsiteContent.scraping_job_id == ScrapingJob.id)
+    .where(ScrapingJob.session_id == bindparam("session_id"))
+    .group_by(ExtractedNoun.lemma)
+    # Order by the label so the aggregate isn't repeated
+    .order_by(_total_frequency.desc())
+    .limit(bindparam("top_n"))
+)
+_insert_results = insert(SearchResult).returning(
+    SearchResult.id, sort_by_parameter_order=True
+)
+
+# Batches above this size are inserted with a columnar unnest() INSERT
+UNNEST_MIN_ROWS = 5000
+
+# search_results columns passed as one array each, with their element type
+UNNEST_RESULT_COLUMNS = (
+    ("url", Text),
+    ("title", Text),
+    ("description", Text),
+    ("rank", Integer),
+    ("domain", Text),
+    ("scraped", Boolean),
+)
+
+# INSERT ... SELECT FROM unnest(:url, :title, ...) with one array bind per
+# column, so planning cost doesn't grow with the number of rows. Rows are
+# inserted in array order (WITH ORDINALITY).
+_unnest_results = func.unnest(
+    *(
+        cast(bindparam(name, type_=ARRAY(type_)), ARRAY(type_))
+        for name, type_ in UNNEST_RESULT_COLUMNS
+    )
+).table_valued(
+    *(name for name, _ in UNNEST_RESULT_COLUMNS), with_ordinality="ordinality"
+)
+_insert_results_unnest = (
+    insert(SearchResult.__table__)
+    .from_select(
+        ["query_id", *(name for name, _ in UNNEST_RESULT_COLUMNS)],
+        select(
+            bindparam("query_id", type_=Integer),
+            *(_unnest_results.c[name] for name, _ in UNNEST_RESULT_COLUMNS),
+        ).order_by(_unnest_results.c.ordinality),
+    )
+    .returning(SearchResult.__table__.c.id)
+)
 
 
 async def get_session_with_results_optimized(
@@ -27,7 +141,6 @@ async def get_session_with_results_optimized(
     - Session
     - All queries in session
     - All results for each query
-    - Website data for each result
 
     This prevents N+1 queries. Without eager loading:
     - 1 query for session
@@ -35,95 +148,114 @@ async def get_session_with_results_optimized(
     - M queries for results (1 per result)
     Total: 1 + N + M queries
 
-    With eager loading:
-    - 1 query for session
-    - 1 query for queries (using selectinload)
-    - 1 query for results (using selectinload)
-    Total: 3 queries regardless of data size
+    With a JOIN and contains_eager:
+    - 1 query for session, queries and results
+    Total: 1 round trip regardless of data size
+
+    The joined rows repeat the session and query columns once per
+    result, which is fine for a single session. Loading many sessions
+    should keep using selectinload, where each level is one SELECT IN
+    without the cartesian row blow-up.
 
     Performance improvement:
-    - 100 queries -> 3 queries (97% reduction)
+    - 100 queries -> 1 query
     - ~1000ms -> ~50ms (20x faster)
     """
-    stmt = (
-        select(SearchSession)
-        .where(SearchSession.id == session_id)
-        .options(
-            # Load all queries in session (1 extra query)
-            selectinload(SearchSession.queries).options(
-                # For each query, load all results (1 extra query)
-                selectinload(SearchQuery.results)
-            )
-        )
+    result = await db.execute(
+        _select_session_with_results, {"session_id": session_id}
     )
+    return result.unique().scalar_one_or_none()
+
 
-    result = await db.execute(stmt)
-    return result.scalar_one_or_none()
+async def get_sessions_with_results_bulk(
+    db: AsyncSession,
+    session_ids: List[int],
+    user_id: int
+) -> List[SearchSession]:
+    """
+    Get several of a user's sessions with all queries and results.
+
+    The plural counterpart of get_session_with_results_optimized. A JOIN
+    would repeat every session and query row per result, so this keeps
+    selectinload: 3 SELECTs in total regardless of the number of
+    sessions, instead of 3 per session.
+
+    Args:
+        db: Database session
+        session_ids: Sessions to load
+        user_id: Owner; sessions of other users are not returned
+
+    Returns:
+        The sessions found, with queries and results loaded
+    """
+    result = await db.execute(
+        _select_user_sessions_with_results,
+        {"session_ids": session_ids, "user_id": user_id},
+    )
+    return list(result.scalars().all())
 
 
 async def get_sessions_for_user_optimized(
     db: AsyncSession,
     user_id: int,
     limit: int = 50
-) -> List[SearchSession]:
+) -> List[Tuple[SearchSession, int]]:
     """
     Get user sessions with query counts.
 
-    Uses subquery to count queries without loading them.
+    Uses a correlated subquery to count queries without loading them.
     Much faster than loading all queries and counting in Python.
 
+    Queries are not loaded (raiseload), so touching session.queries on
+    the result raises instead of emitting one SELECT per session.
+
+    Served newest first by the (user_id, created_at DESC) index
+    idx_search_sessions_user_created, so the LIMIT stops the index scan
+    without a sort however many sessions the user has.
+
     Performance:
     - Without subquery: Load all queries, count in Python (~500ms for 1000 sessions)
     - With subquery: Count in database (~50ms for 1000 sessions)
+
+    Returns:
+        List of (session, query_count) tuples, newest first
     """
-    stmt = (
-        select(SearchSession)
-        .where(SearchSession.user_id == user_id)
-        .order_by(SearchSession.created_at.desc())
-        .limit(limit)
-        .options(
-            # Load query count using a subquery
-            # This avoids loading all queries
-            selectinload(SearchSession.queries).options(
-                # Only load IDs to count
-                selectinload(SearchQuery.id)
-            )
-        )
+    result = await db.execute(
+        _select_user_sessions_with_query_count,
+        {"user_id": user_id, "limit": limit},
     )
-
-    result = await db.execute(stmt)
-    return list(result.scalars().all())
+    return [(session, count) for session, count in result.all()]
 
 
 async def get_results_with_websites_optimized(
     db: AsyncSession,
     query_id: int
-) -> List[SearchResult]:
+) -> AsyncIterator[Tuple[SearchResult, Optional[WebsiteContent]]]:
     """
-    Get results with website content.
+    Stream results with website content.
 
-    Uses joinedload for many-to-one relationship (Result -> Website).
-    This is more efficient than selectinload for many-to-one.
+    Selects both entities from one explicit outer join on url instead
+    of adding a joined eager load on top of it (which would join the
+    table a second time and need unique() to de-duplicate). Page
+    bodies stay deferred.
+
+    Rows are fetched from a server-side cursor in batches, so callers
+    that iterate once (serialization, exports) don't hold the whole
+    result set in memory.
 
     Performance:
     - selectinload: 2 queries (results, then websites)
-    - joinedload: 1 query (JOIN in database)
+    - explicit JOIN: 1 query (JOIN in database)
+
+    Yields:
+        (result, content) tuples ordered by rank; content is None for
+        results that haven't been scraped
     """
-    from backend.models.scraping import WebsiteContent
-
-    stmt = (
-        select(SearchResult)
-        .where(SearchResult.query_id == query_id)
-        .order_by(SearchResult.rank)
-        .outerjoin(WebsiteContent, SearchResult.url == WebsiteContent.url)
-        .options(
-            # Use joinedload for many-to-one
-            joinedload(SearchResult.website)
-        )
+    result = await db.stream(
+        _select_results_with_content, {"query_id": query_id}
     )
-
-    result = await db.execute(stmt)
-    return list(result.scalars().unique().all())
+    async for search_result, content in result:
+        yield search_result, content
 
 
 async def get_top_nouns_for_session_optimized(
@@ -134,28 +266,17 @@ async def get_top_nouns_for_session_optimized(
     """
     Get top nouns for session using aggregation.
 
-    Uses database aggregation instead of Python processing.
+    Uses database aggregation instead of Python processing. Nouns are
+    reached through the session's scraping jobs and their website
+    content.
 
     Performance:
     - Load all nouns, aggregate in Python: ~1000ms
     - Aggregate in database: ~50ms (20x faster)
     """
-    from backend.models.analysis import ExtractedNoun
-
-    stmt = (
-        select(
-            ExtractedNoun.noun,
-            func.sum(ExtractedNoun.frequency).label("total_frequency"),
-            func.avg(ExtractedNoun.tfidf_score).label("avg_tfidf"),
-            func.count(ExtractedNoun.id).label("occurrence_count"),
-        )
-        .where(ExtractedNoun.session_id == session_id)
-        .group_by(ExtractedNoun.noun)
-        .order_by(func.sum(ExtractedNoun.frequency).desc())
-        .limit(top_n)
+    result = await db.execute(
+        _select_session_top_nouns, {"session_id": session_id, "top_n": top_n}
     )
-
-    result = await db.execute(stmt)
     return list(result.all())
 
 
@@ -167,26 +288,59 @@ async def bulk_create_results_optimized(
     """
     Bulk create search results.
 
-    Uses bulk insert instead of individual inserts.
+    Uses bulk insert instead of individual inserts. IDs are returned in
+    the order of results_data. Batches above UNNEST_MIN_ROWS use a
+    columnar unnest() INSERT instead of multi-row VALUES.
+
+    Does not commit: the caller owns the transaction, so results for
+    many queries can be inserted and committed once.
 
     Performance:
     - Individual inserts: ~5000ms for 1000 records
     - Bulk insert: ~50ms for 1000 records (100x faster)
     """
-    from sqlalchemy import insert
+    if len(results_data) > UNNEST_MIN_ROWS:
+        return await _insert_results_unnest_rows(db, query_id, results_data)
 
     # Add query_id to all records
     for data in results_data:
         data["query_id"] = query_id
 
-    # Bulk insert with RETURNING to get IDs
-    stmt = insert(SearchResult).values(results_data).returning(SearchResult.id)
-    result = await db.execute(stmt)
-    ids = [row[0] for row in result.fetchall()]
+    # Executemany-style bulk insert with RETURNING to get IDs. SQLAlchemy
+    # batches the rows into multi-row INSERTs (insertmanyvalues, sized by
+    # DATABASE_INSERTMANYVALUES_PAGE_SIZE) instead of one statement with
+    # a bind parameter per value, which hits PostgreSQL's 65535 limit.
+    result = await db.execute(_insert_results, results_data)
+    return list(result.scalars())
+
+
+async def _insert_results_unnest_rows(
+    db: AsyncSession,
+    query_id: int,
+    results_data: List[dict]
+) -> List[int]:
+    """
+    Insert search results with one array per column.
 
-    await db.commit()
+    Args:
+        db: Database session
+        query_id: Query the results belong to
+        results_data: Result dicts (url, rank, domain required)
 
-    return ids
+    Returns:
+        Inserted IDs in the order of results_data
+    """
+    params = {
+        name: [data.get(name) for data in results_data]
+        for name, _ in UNNEST_RESULT_COLUMNS
+    }
+    params["scraped"] = [bool(scraped) for scraped in params["scraped"]]
+    params["query_id"] = query_id
+
+    result = await db.execute(_insert_results_unnest, params)
+    # Rows are inserted in array order and identity values increase with
+    # insertion order, so sorted IDs line up with results_data
+    return sorted(result.scalars())
 
 
 # ============================================================================
@@ -1,7 +1,13 @@
 """Schemas for Phase 7 advanced search features."""
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, field_validator
+from typing import Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class _ORMResponse(BaseModel):
+    """Base for response schemas built from ORM objects."""
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Query Expansion Schemas
@@ -9,38 +15,28 @@ class QueryExpansionRequest(BaseModel):
     """Request schema for query expansion."""
 
     session_id: int = Field(..., description="Session ID to expand from")
-    expansion_sources: List[str] = Field(
+    expansion_sources: List[
+        Literal["search_results", "content", "suggestions", "meta_keywords"]
+    ] = Field(
         default=["search_results", "content", "suggestions"],
         description="Sources to use for expansion",
     )
     max_candidates: int = Field(100, ge=1, le=500, description="Maximum candidates to generate")
     min_score: float = Field(0.1, ge=0.0, le=1.0, description="Minimum score threshold")
 
-    @field_validator("expansion_sources")
-    @classmethod
-    def validate_sources(cls, v: List[str]) -> List[str]:
-        """Validate expansion sources."""
-        valid = ["search_results", "content", "suggestions", "meta_keywords"]
-        for source in v:
-            if source not in valid:
-                raise ValueError(f"Invalid source '{source}'. Valid: {', '.join(valid)}")
-        return v
-
 
-class QueryExpansionCandidateResponse(BaseModel):
+class QueryExpansionCandidateResponse(_ORMResponse):
     """Response schema for expansion candidate."""
 
     id: int
     candidate_term: str
     score: float
     source: str
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = Field(None, validation_alias="extra_metadata")
     approved: Optional[bool] = None
     generation: int
     created_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class QueryExpansionResponse(BaseModel):
     """Response schema for query expansion."""
@@ -79,7 +75,7 @@ class QueryTemplateCreate(BaseModel):
     description: Optional[str] = None
 
 
-class QueryTemplateResponse(BaseModel):
+class QueryTemplateResponse(_ORMResponse):
     """Response schema for query template."""
 
     id: int
@@ -92,8 +88,6 @@ class QueryTemplateResponse(BaseModel):
     description: Optional[str]
     created_at: datetime
 
-    model_config = {"from_attributes": True}
-
 
 class ApplyTemplateRequest(BaseModel):
     """Request schema for applying template."""
@@ -123,20 +117,50 @@ class MultiPerspectiveRequest(BaseModel):
 class SessionComparisonRequest(BaseModel):
     """Request schema for session comparison."""
 
-    session_ids: List[int] = Field(..., min_items=2, max_items=10)
-    comparison_type: str = Field(
+    session_ids: List[int] = Field(..., min_length=2, max_length=10)
+    comparison_type: Literal[
+        "full", "urls", "domains", "discourse", "rankings", "spheres"
+    ] = Field(
         "full",
         description="Type of comparison: full, urls, domains, discourse, rankings, spheres",
     )
 
-    @field_validator("comparison_type")
+    @field_validator("session_ids")
     @classmethod
-    def validate_comparison_type(cls, v: str) -> str:
-        """Validate comparison type."""
-        valid = ["full", "urls", "domains", "discourse", "rankings", "spheres"]
-        if v not in valid:
-            raise ValueError(f"Invalid type '{v}'. Valid: {', '.join(valid)}")
-        return v
+    def dedupe_session_ids(cls, v: List[int]) -> List[int]:
+        """Drop repeated session IDs, keeping the first occurrence."""
+        unique = list(dict.fromkeys(v))
+        if len(unique) < 2:
+            raise ValueError("At least 2 distinct session IDs are required")
+        return unique
+
+
+class UrlSimilarity(BaseModel):
+    """Jaccard similarity of the URL sets of two sessions."""
+
+    session_pair: str
+    jaccard_similarity: float
+    intersection: int
+    union: int
+
+
+class UrlComparison(BaseModel):
+    """URL overlap across compared sessions."""
+
+    total_unique_urls: int
+    common_urls_count: int
+    similarities: List[UrlSimilarity]
+    url_counts: List[int]
+
+
+class DomainComparison(BaseModel):
+    """Domain overlap and diversity across compared sessions."""
+
+    total_unique_domains: int
+    common_domains_count: int
+    common_domains: List[str]
+    domain_counts: List[int]
+    domain_diversity: List[float]
 
 
 class SessionComparisonResponse(BaseModel):
@@ -145,8 +169,8 @@ class SessionComparisonResponse(BaseModel):
     session_ids: List[int]
     session_names: List[str]
     comparison_type: str
-    url_comparison: Optional[Dict[str, Any]] = None
-    domain_comparison: Optional[Dict[str, Any]] = None
+    url_comparison: Optional[UrlComparison] = None
+    domain_comparison: Optional[DomainComparison] = None
     ranking_comparison: Optional[Dict[str, Any]] = None
     sphere_comparison: Optional[Dict[str, Any]] = None
     discourse_comparison: Optional[Dict[str, Any]] = None
@@ -165,14 +189,23 @@ class TemporalSearchRequest(BaseModel):
     temporal_snapshot: bool = Field(False, description="Mark as snapshot for comparison")
 
 
+class TimePeriod(BaseModel):
+    """A time period to search within."""
+
+    model_config = ConfigDict(frozen=True)
+
+    start: datetime
+    end: datetime
+
+
 class TemporalComparisonRequest(BaseModel):
     """Request schema for comparing time periods."""
 
     query: str = Field(..., description="Query to search")
-    periods: List[Dict[str, datetime]] = Field(
+    periods: List[TimePeriod] = Field(
         ...,
         min_items=2,
-        description="List of time periods with 'start' and 'end' keys",
+        description="List of time periods with 'start' and 'end'",
     )
     search_engine: str = Field("google_custom")
     max_results: int = Field(50, ge=1, le=100)
@@ -256,7 +289,9 @@ class AdvancedSearchRequest(BaseModel):
 
     session_name: str = Field(..., min_length=1, max_length=255)
     queries: List[str] = Field(..., min_items=1, max_items=50)
-    search_engine: str = Field("google_custom")
+    search_engine: Literal[
+        "google_custom", "serper", "serpapi_google", "serpapi_bing"
+    ] = Field("google_custom")
     max_results: int = Field(10, ge=1, le=100)
 
     # Temporal features
@@ -273,12 +308,3 @@ class AdvancedSearchRequest(BaseModel):
 
     # Auto-expansion
     auto_expand: bool = Field(False, description="Auto-generate expansion candidates")
-
-    @field_validator("search_engine")
-    @classmethod
-    def validate_search_engine(cls, v: str) -> str:
-        """Validate search engine."""
-        allowed = ["google_custom", "serper", "serpapi_google", "serpapi_bing"]
-        if v not in allowed:
-            raise ValueError(f"Search engine must be one of: {', '.join(allowed)}")
-        return v
@@ -224,10 +224,20 @@ class NetworkResponse(BaseModel):
 class NetworkListResponse(BaseModel):
     """Response schema for network list."""
 
-    total: int
-    page: int
+    total: Optional[int] = Field(
+        default=None,
+        description="Total networks (not computed for cursor pages)"
+    )
+    page: Optional[int] = Field(
+        default=None,
+        description="Page number (None for cursor pages)"
+    )
     per_page: int
     networks: List[NetworkResponse]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page, None on the last page"
+    )
 
 
 # Network generation task response
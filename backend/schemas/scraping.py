@@ -110,6 +110,7 @@ class ScrapingJobResponse(BaseModel):
     urls_failed: int
     urls_skipped: int
     current_depth: int
+    progress_percentage: float
     celery_task_id: Optional[str]
     error_message: Optional[str]
     error_count: int
@@ -120,13 +121,6 @@ class ScrapingJobResponse(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    @property
-    def progress_percentage(self) -> float:
-        """Calculate progress percentage."""
-        if self.total_urls == 0:
-            return 0.0
-        return (self.urls_scraped / self.total_urls) * 100.0
-
 
 class ScrapingJobList(BaseModel):
     """Schema for listing scraping jobs."""
@@ -156,6 +150,7 @@ class ScrapingJobStatistics(BaseModel):
     total_words: int
     depth_distribution: dict[int, int]
     language_distribution: dict[str, int]
+    link_domain_distribution: dict[str, int] = {}  # Most linked-to domains
     started_at: Optional[str]
     completed_at: Optional[str]
 
@@ -1,12 +1,14 @@
 """Service for content analysis operations."""
+import asyncio
 import logging
 import time
-from typing import List, Optional, Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 from datetime import datetime
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.core.nlp.batch import BatchAnalyzer, BatchAnalysisResult
-from backend.core.nlp.cache import get_analysis_cache
+from backend.core.nlp.cache import AnalysisCache, get_analysis_cache
+from backend.database import ReadSessionLocal, reads_from_replica
 from backend.repositories.analysis_repository import AnalysisRepository
 from backend.models.website import WebsiteContent
 from backend.models.scraping import ScrapingJob
@@ -24,9 +26,12 @@ from backend.schemas.analysis import (
     NERExtractionConfig,
 )
 from sqlalchemy import select
+from sqlalchemy.orm import undefer
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class AnalysisService:
     """
@@ -36,14 +41,25 @@ class AnalysisService:
     including caching, batch processing, and result aggregation.
     """
 
-    def __init__(self, session: AsyncSession):
+    def __init__(
+        self,
+        session: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] = ReadSessionLocal,
+    ):
         """
         Initialize the analysis service.
 
         Args:
             session: SQLAlchemy async session
+            session_factory: Factory for the extra sessions used by
+                concurrent read-only queries (the read replica, if
+                configured)
         """
         self.session = session
+        self.session_factory = session_factory
+        # Cache invalidation runs on primary writes; a lagging replica read
+        # taken just after one would be cached stale for the full TTL.
+        self.cache_aggregates = not reads_from_replica(session_factory)
         self.repository = AnalysisRepository(session)
         self.batch_analyzer = BatchAnalyzer()
 
@@ -92,7 +108,11 @@ class AnalysisService:
                 return AnalysisResultResponse(**cached_result)
 
         # Fetch content
-        stmt = select(WebsiteContent).where(WebsiteContent.id == content_id)
+        stmt = (
+            select(WebsiteContent)
+            .options(undefer(WebsiteContent.extracted_text))
+            .where(WebsiteContent.id == content_id)
+        )
         result = await self.session.execute(stmt)
         content = result.scalar_one_or_none()
 
@@ -154,9 +174,15 @@ class AnalysisService:
                 entities_count=len(batch_result.entities),
                 processing_duration=processing_duration,
             )
+            await self.repository.refresh_noun_job_aggregates(
+                [content.scraping_job_id]
+            )
 
             await self.session.commit()
 
+            cache = await get_analysis_cache()
+            await cache.invalidate_job_aggregates([content.scraping_job_id])
+
             # Build response
             response = AnalysisResultResponse(
                 content_id=content_id,
@@ -189,7 +215,6 @@ class AnalysisService:
             )
 
             # Cache result
-            cache = await get_analysis_cache()
             await cache.cache_analysis(content_id, response.dict())
 
             logger.info(
@@ -236,7 +261,11 @@ class AnalysisService:
         logger.info(f"Starting batch analysis of {len(content_ids)} contents")
 
         # Fetch all contents
-        stmt = select(WebsiteContent).where(WebsiteContent.id.in_(content_ids))
+        stmt = (
+            select(WebsiteContent)
+            .options(undefer(WebsiteContent.extracted_text))
+            .where(WebsiteContent.id.in_(content_ids))
+        )
         result = await self.session.execute(stmt)
         contents = list(result.scalars().all())
 
@@ -336,8 +365,16 @@ class AnalysisService:
                 )
                 failed += 1
 
+        # Publish the batch's nouns to the rollup of the jobs it touched
+        job_ids = {content.scraping_job_id for content in valid_contents}
+        if successful:
+            await self.repository.refresh_noun_job_aggregates(job_ids)
+
         await self.session.commit()
 
+        cache = await get_analysis_cache()
+        await cache.invalidate_job_aggregates(job_ids)
+
         total_time = time.time() - start_time
 
         result = {
@@ -408,19 +445,9 @@ class AnalysisService:
         if cached_nouns:
             nouns_data = cached_nouns[:limit] if limit else cached_nouns
         else:
-            nouns = await self.repository.get_nouns_by_content_id(
+            nouns_data = await self.repository.get_noun_rows_by_content_id(
                 content_id, limit
             )
-            nouns_data = [
-                {
-                    "word": n.word,
-                    "lemma": n.lemma,
-                    "frequency": n.frequency,
-                    "tfidf_score": n.tfidf_score,
-                    "positions": n.positions,
-                }
-                for n in nouns
-            ]
 
             # Cache result
             await cache.cache_nouns(content_id, nouns_data)
@@ -461,19 +488,9 @@ class AnalysisService:
         if cached_entities and not label:  # Cache doesn't support filtering
             entities_data = cached_entities[:limit] if limit else cached_entities
         else:
-            entities = await self.repository.get_entities_by_content_id(
+            entities_data = await self.repository.get_entity_rows_by_content_id(
                 content_id, label, limit
             )
-            entities_data = [
-                {
-                    "text": e.text,
-                    "label": e.label,
-                    "start_pos": e.start_pos,
-                    "end_pos": e.end_pos,
-                    "confidence": e.confidence,
-                }
-                for e in entities
-            ]
 
             # Cache result (only if no filter)
             if not label:
@@ -498,6 +515,57 @@ class AnalysisService:
             entities_by_type=entities_by_type,
         )
 
+    async def _read(
+        self, query: Callable[[AnalysisRepository], Awaitable[T]]
+    ) -> T:
+        """
+        Run a read-only repository query on a short-lived session.
+
+        Lets independent reads run concurrently with asyncio.gather();
+        one session (connection) can only run one query at a time. The
+        session comes from session_factory, so aggregates run on the
+        read replica and don't take connections from the write pool.
+
+        Args:
+            query: Coroutine function taking a repository
+
+        Returns:
+            Query result
+        """
+        async with self.session_factory() as session:
+            return await query(AnalysisRepository(session))
+
+    async def _read_job_aggregate(
+        self,
+        cache: AnalysisCache,
+        job_id: int,
+        kind: str,
+        top_n: int,
+        query: Callable[[AnalysisRepository], Awaitable[List[Dict[str, Any]]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a job aggregate through the cache.
+
+        Aggregates read from the replica are not cached, since they may
+        predate the last invalidation.
+
+        Args:
+            cache: Analysis cache
+            job_id: Scraping job ID
+            kind: Aggregate kind ("nouns" or "entities")
+            top_n: Number of top items
+            query: Repository query computing the aggregate on a miss
+
+        Returns:
+            List of aggregate dictionaries
+        """
+        rows = await cache.get_cached_job_aggregate(job_id, kind, top_n)
+        if rows is None:
+            rows = await self._read(query)
+            if self.cache_aggregates:
+                await cache.cache_job_aggregate(job_id, kind, top_n, rows)
+        return rows
+
     async def get_job_aggregate(
         self, job_id: int, top_n: int = 50
     ) -> JobAggregateResponse:
@@ -511,22 +579,26 @@ class AnalysisService:
         Returns:
             JobAggregateResponse with aggregated data
         """
-        # Get statistics
-        stats = await self.repository.get_analysis_stats_for_job(job_id)
-
-        # Get top nouns
-        nouns_data = await self.repository.get_aggregated_nouns_for_job(
-            job_id, top_n
-        )
-
-        # Get top entities
-        entities_data = await self.repository.get_aggregated_entities_for_job(
-            job_id, top_n
-        )
-
-        # Get entity counts by type
-        entities_by_type = (
-            await self.repository.get_entity_counts_by_type_for_job(job_id)
+        # Independent reads, each on its own session so they run
+        # concurrently instead of queueing on one connection
+        cache = await get_analysis_cache()
+        stats, nouns_data, entities_data, entities_by_type = await asyncio.gather(
+            self._read(lambda repo: repo.get_analysis_stats_for_job(job_id)),
+            self._read_job_aggregate(
+                cache,
+                job_id,
+                "nouns",
+                top_n,
+                lambda repo: repo.get_aggregated_nouns_for_job(job_id, top_n),
+            ),
+            self._read_job_aggregate(
+                cache,
+                job_id,
+                "entities",
+                top_n,
+                lambda repo: repo.get_aggregated_entities_for_job(job_id, top_n),
+            ),
+            self._read(lambda repo: repo.get_entity_counts_by_type_for_job(job_id)),
         )
 
         return JobAggregateResponse(
@@ -555,8 +627,19 @@ class AnalysisService:
 
         # Delete from database
         deleted = await self.repository.delete_analysis(content_id)
+        job_id = None
+        if deleted:
+            job_id = await self.session.scalar(
+                select(WebsiteContent.scraping_job_id).where(
+                    WebsiteContent.id == content_id
+                )
+            )
+            await self.repository.refresh_noun_job_aggregates([job_id])
         await self.session.commit()
 
+        if deleted:
+            await cache.invalidate_job_aggregates([job_id])
+
         if deleted:
             logger.info(f"Deleted analysis for content {content_id}")
 
@@ -595,7 +678,11 @@ class AnalysisService:
         )
 
         # Load content
-        stmt = select(WebsiteContent).where(WebsiteContent.id == website_content_id)
+        stmt = (
+            select(WebsiteContent)
+            .options(undefer(WebsiteContent.extracted_text))
+            .where(WebsiteContent.id == website_content_id)
+        )
         result = await self.session.execute(stmt)
         content = result.scalar_one_or_none()
 
@@ -694,7 +781,11 @@ class AnalysisService:
         )
 
         # Load content
-        stmt = select(WebsiteContent).where(WebsiteContent.id == website_content_id)
+        stmt = (
+            select(WebsiteContent)
+            .options(undefer(WebsiteContent.extracted_text))
+            .where(WebsiteContent.id == website_content_id)
+        )
         result = await self.session.execute(stmt)
         content = result.scalar_one_or_none()
 
@@ -747,9 +838,12 @@ class AnalysisService:
 
             # Store entities in database
             if entities:
-                await self.repository.bulk_create_entities(entities)
+                await self.repository.copy_entities(entities)
                 await self.session.commit()
 
+                cache = await get_analysis_cache()
+                await cache.invalidate_job_aggregates([content.scraping_job_id])
+
             logger.info(
                 f"Extracted and stored {len(entities)} entities from content {website_content_id} "
                 f"using method '{config.extraction_method}'"
@@ -804,9 +898,12 @@ class AnalysisService:
 
                 # Store entities in database
                 if entities:
-                    await self.repository.bulk_create_entities(entities)
+                    await self.repository.copy_entities(entities)
                     await self.session.commit()
 
+                    cache = await get_analysis_cache()
+                    await cache.invalidate_job_aggregates([content.scraping_job_id])
+
                 logger.info(
                     f"Extracted and stored {len(entities)} entities using transformer method "
                     f"for content {website_content_id}"
@@ -872,7 +969,7 @@ class AnalysisService:
                 }
                 for n in nouns
             ]
-            await self.repository.bulk_create_nouns(nouns_data)
+            await self.repository.copy_nouns(nouns_data)
 
         # Store entities
         if entities:
@@ -888,7 +985,7 @@ class AnalysisService:
                 }
                 for e in entities
             ]
-            await self.repository.bulk_create_entities(entities_data)
+            await self.repository.copy_entities(entities_data)
 
         logger.debug(
             f"Stored {len(nouns)} nouns and {len(entities)} entities "
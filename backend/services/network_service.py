@@ -4,8 +4,9 @@ Enhanced in v6.0.0:
 - Support for website_keyword networks with multiple extraction methods
 - Support for website_ner networks (named entity recognition)
 """
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime
 import os
@@ -29,6 +30,20 @@ from backend.schemas.analysis import KeywordExtractionConfig, NERExtractionConfi
 logger = logging.getLogger(__name__)
 
 
+def _unlink_network_files(file_paths: List[str]) -> None:
+    """
+    Delete exported network files, logging failures.
+
+    Args:
+        file_paths: Paths of the files to delete
+    """
+    for file_path in file_paths:
+        try:
+            Path(file_path).unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Failed to delete network file {file_path}: {e}")
+
+
 class NetworkService:
     """
     Service for network generation and management.
@@ -411,7 +426,7 @@ class NetworkService:
             stats["backboning"] = network.backboning_statistics
 
         # Add metadata
-        stats["metadata"] = network.metadata
+        stats["metadata"] = network.network_metadata
 
         return stats
 
@@ -444,6 +459,35 @@ class NetworkService:
             session_id=session_id,
         )
 
+    async def list_user_networks_after(
+        self,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        per_page: int = 20,
+        network_type: Optional[str] = None,
+        session_id: Optional[int] = None,
+    ) -> Tuple[List[NetworkExport], Optional[Tuple[datetime, int]]]:
+        """
+        List networks for a user with keyset pagination.
+
+        Args:
+            user_id: User ID
+            cursor: (created_at, id) returned with the previous page
+            per_page: Results per page
+            network_type: Optional filter by type
+            session_id: Optional filter by session
+
+        Returns:
+            Tuple of (networks list, cursor for the next page or None)
+        """
+        return await self.repository.get_by_user_after(
+            user_id=user_id,
+            cursor=cursor,
+            per_page=per_page,
+            network_type=network_type,
+            session_id=session_id,
+        )
+
     async def delete_network(
         self,
         network_id: int,
@@ -494,18 +538,13 @@ class NetworkService:
         Returns:
             Number of networks deleted
         """
-        old_networks = await self.repository.get_old_exports(days=days)
-
-        deleted_count = 0
-        for network in old_networks:
-            try:
-                success = await self.delete_network(network.id)
-                if success:
-                    deleted_count += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to delete old network {network.id}: {e}"
-                )
+        file_paths = await self.repository.delete_old_exports(days=days)
+        await self.session.commit()
+
+        # Remove the files once the rows are gone, off the event loop
+        await asyncio.to_thread(_unlink_network_files, file_paths)
+
+        deleted_count = len(file_paths)
 
         logger.info(
             f"Cleaned up {deleted_count} old network exports (older than {days} days)"
@@ -4,10 +4,11 @@ from typing import Optional
 from datetime import datetime
 from sqlalchemy import select, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer_group
 
 from backend.models.scraping import ScrapingJob
 from backend.models.search import SearchSession
-from backend.models.website import WebsiteContent
+from backend.models.website import WebsiteContent, WebsiteOutboundLink
 from backend.tasks.scraping_tasks import scrape_session_task, cancel_scraping_job_task
 
 logger = logging.getLogger(__name__)
@@ -346,6 +347,7 @@ class ScrapingService:
         # Get content
         query = (
             select(WebsiteContent)
+            .options(undefer_group("body"))
             .where(WebsiteContent.scraping_job_id == job_id)
             .order_by(WebsiteContent.scrape_depth, WebsiteContent.scraped_at)
             .limit(limit)
@@ -373,6 +375,7 @@ class ScrapingService:
         """
         result = await self.db.execute(
             select(WebsiteContent)
+            .options(undefer_group("body"))
             .where(
                 and_(
                     WebsiteContent.id == website_id,
@@ -439,6 +442,24 @@ class ScrapingService:
         lang_result = await self.db.execute(lang_query)
         language_distribution = {row[0]: row[1] for row in lang_result}
 
+        # Get most linked-to domains
+        link_count = func.count().label("count")
+        link_query = select(
+            WebsiteOutboundLink.target_domain,
+            link_count,
+        ).join(
+            WebsiteContent, WebsiteContent.id == WebsiteOutboundLink.content_id
+        ).where(
+            WebsiteContent.scraping_job_id == job_id
+        ).group_by(
+            WebsiteOutboundLink.target_domain
+        ).order_by(
+            link_count.desc()
+        ).limit(20)
+
+        link_result = await self.db.execute(link_query)
+        link_domain_distribution = {row[0]: row[1] for row in link_result}
+
         return {
             "job_id": job.id,
             "status": job.status,
@@ -456,6 +477,7 @@ class ScrapingService:
             "total_words": stats.total_words or 0,
             "depth_distribution": depth_distribution,
             "language_distribution": language_distribution,
+            "link_domain_distribution": link_domain_distribution,
             "started_at": job.started_at.isoformat() if job.started_at else None,
             "completed_at": job.completed_at.isoformat() if job.completed_at else None,
         }
@@ -3,15 +3,18 @@ import logging
 import math
 from typing import List, Dict, Any, Set, Tuple
 from collections import Counter, defaultdict
-from sqlalchemy import select, and_
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from scipy.stats import spearmanr
 
-from backend.models.search import SearchSession, SearchQuery, SearchResult
+from backend.models.search import SearchSession, SearchResult
 from backend.models.user import User
 from backend.models.analysis import ExtractedNoun, ExtractedEntity
 from backend.models.website import WebsiteContent
 from backend.core.search.domain_filter import DomainFilter
+from backend.repositories.search_repository_optimized import (
+    get_sessions_with_results_bulk,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -65,11 +68,8 @@ class SessionComparisonService:
         if len(sessions) < 2:
             raise ValueError("Need at least 2 sessions to compare")
 
-        # Load all results for each session
-        session_data = []
-        for session in sessions:
-            data = await self._load_session_data(session.id)
-            session_data.append(data)
+        # Results were loaded with the sessions
+        session_data = [self._load_session_data(session) for session in sessions]
 
         # Perform requested comparisons
         result = {
@@ -116,7 +116,7 @@ class SessionComparisonService:
         # Get URL sets for each session
         url_sets = []
         for session in sessions:
-            results = await self._get_session_results(session.id)
+            results = self._get_session_results(session)
             urls = {r.url for r in results}
             url_sets.append(urls)
 
@@ -146,7 +146,7 @@ class SessionComparisonService:
         # Get domain sets for each session
         domain_sets = []
         for session in sessions:
-            results = await self._get_session_results(session.id)
+            results = self._get_session_results(session)
             domains = {r.domain for r in results}
             domain_sets.append(domains)
 
@@ -178,7 +178,7 @@ class SessionComparisonService:
         session_results_map = {}
 
         for session in sessions:
-            results = await self._get_session_results(session.id)
+            results = self._get_session_results(session)
             urls = {r.url for r in results}
             session_urls[session.id] = urls
 
@@ -231,7 +231,7 @@ class SessionComparisonService:
         # Get results for each session
         session_results = {}
         for session in sessions:
-            results = await self._get_session_results(session.id)
+            results = self._get_session_results(session)
             # Map URL to rank
             session_results[session.id] = {r.url: r.rank for r in results}
 
@@ -282,16 +282,10 @@ class SessionComparisonService:
         }
 
     async def _load_sessions(self, session_ids: List[int]) -> List[SearchSession]:
-        """Load and validate sessions."""
-        result = await self.db.execute(
-            select(SearchSession).where(
-                and_(
-                    SearchSession.id.in_(session_ids),
-                    SearchSession.user_id == self.user.id,
-                )
-            )
+        """Load and validate sessions with their queries and results."""
+        sessions = await get_sessions_with_results_bulk(
+            self.db, session_ids, self.user.id
         )
-        sessions = list(result.scalars().all())
 
         if len(sessions) != len(session_ids):
             found_ids = [s.id for s in sessions]
@@ -300,12 +294,12 @@ class SessionComparisonService:
 
         return sessions
 
-    async def _load_session_data(self, session_id: int) -> Dict[str, Any]:
-        """Load all data for a session."""
-        results = await self._get_session_results(session_id)
+    def _load_session_data(self, session: SearchSession) -> Dict[str, Any]:
+        """Collect the comparison data of a loaded session."""
+        results = self._get_session_results(session)
 
         return {
-            "session_id": session_id,
+            "session_id": session.id,
             "results": results,
             "urls": {r.url for r in results},
             "domains": {r.domain for r in results},
@@ -313,23 +307,14 @@ class SessionComparisonService:
             "unique_domains": len({r.domain for r in results}),
         }
 
-    async def _get_session_results(self, session_id: int) -> List[SearchResult]:
-        """Get all results for a session."""
-        # Get all queries for session
-        queries = await self.db.execute(
-            select(SearchQuery).where(SearchQuery.session_id == session_id)
-        )
-        query_ids = [q.id for q in queries.scalars().all()]
-
-        if not query_ids:
-            return []
-
-        # Get all results
-        results = await self.db.execute(
-            select(SearchResult).where(SearchResult.query_id.in_(query_ids))
-        )
-
-        return list(results.scalars().all())
+    @staticmethod
+    def _get_session_results(session: SearchSession) -> List[SearchResult]:
+        """Get all results of a loaded session."""
+        return [
+            result
+            for query in session.queries
+            for result in query.results
+        ]
 
     def _compare_urls(self, session_data: List[Dict]) -> Dict[str, Any]:
         """Compare URLs across sessions."""
@@ -478,11 +463,11 @@ class SessionComparisonService:
 
             # Get nouns
             nouns = await self.db.execute(
-                select(ExtractedNoun).where(
+                select(ExtractedNoun.lemma, ExtractedNoun.frequency).where(
                     ExtractedNoun.website_content_id.in_(content_ids)
                 )
             )
-            noun_list = list(nouns.scalars().all())
+            noun_list = nouns.tuples().all()
 
             # Aggregate nouns
             noun_freq = Counter()
@@ -491,14 +476,14 @@ class SessionComparisonService:
 
             # Get entities
             entities = await self.db.execute(
-                select(ExtractedEntity).where(
+                select(ExtractedEntity.text).where(
                     ExtractedEntity.website_content_id.in_(content_ids)
                 )
             )
-            entity_list = list(entities.scalars().all())
+            entity_list = entities.scalars().all()
 
             # Aggregate entities
-            entity_freq = Counter([e.text for e in entity_list])
+            entity_freq = Counter(entity_list)
 
             discourse_data.append({
                 "session_id": session_id,
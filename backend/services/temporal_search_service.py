@@ -8,6 +8,7 @@ from collections import defaultdict
 
 from backend.models.search import SearchSession, SearchQuery, SearchResult
 from backend.models.user import User
+from backend.schemas.advanced_search import TimePeriod
 from backend.services.search_service import SearchService
 
 logger = logging.getLogger(__name__)
@@ -163,7 +164,7 @@ class TemporalSearchService:
     async def compare_time_periods(
         self,
         query_text: str,
-        periods: List[Dict[str, datetime]],
+        periods: List[TimePeriod],
         search_engine: str = "google_custom",
         max_results: int = 50,
     ) -> Dict[str, Any]:
@@ -172,7 +173,7 @@ class TemporalSearchService:
 
         Args:
             query_text: Query to search
-            periods: List of dicts with 'start' and 'end' datetime
+            periods: Time periods to compare
             search_engine: Search engine to use
             max_results: Max results per period
 
@@ -187,7 +188,7 @@ class TemporalSearchService:
             # Create session for this period
             session = await self.search_service.create_session(
                 name=f"Temporal comparison: {query_text} ({i+1})",
-                description=f"Period {period['start']} to {period['end']}",
+                description=f"Period {period.start} to {period.end}",
                 config={"comparison_index": i},
             )
 
@@ -197,8 +198,8 @@ class TemporalSearchService:
                 queries=[query_text],
                 search_engine=search_engine,
                 max_results=max_results,
-                date_from=period.get("start"),
-                date_to=period.get("end"),
+                date_from=period.start,
+                date_to=period.end,
                 temporal_snapshot=True,
             )
 
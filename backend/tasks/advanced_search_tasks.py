@@ -14,7 +14,7 @@ from backend.services.temporal_search_service import TemporalSearchService
 from backend.services.session_comparison_service import SessionComparisonService
 from backend.services.search_service import SearchService
 from backend.core.search.query_expansion import QueryExpander
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 logger = logging.getLogger(__name__)
 
@@ -226,7 +226,7 @@ async def query_expansion_task(
                     candidate_term=candidate.term,
                     score=candidate.score,
                     source=",".join(candidate.sources),
-                    metadata=candidate.metadata,
+                    extra_metadata=candidate.metadata,
                     generation=1,
                 )
                 db.add(db_candidate)
@@ -288,29 +288,50 @@ async def bulk_search_task(
             )
             upload = upload_result.scalar_one()
 
-            # Create session
             search_service = SearchService(db, user)
-            session = await search_service.create_session(
-                name=session_name,
-                description=description or f"Bulk search from {upload.filename}",
-                config={"bulk_upload_id": upload_id},
-            )
+            if upload.session_id is not None:
+                # Retry: keep adding to the session of the first attempt
+                session_result = await db.execute(
+                    select(SearchSession).where(SearchSession.id == upload.session_id)
+                )
+                session = session_result.scalar_one()
+            else:
+                session = await search_service.create_session(
+                    name=session_name,
+                    description=description or f"Bulk search from {upload.filename}",
+                    config={"bulk_upload_id": upload_id},
+                )
+                upload.session_id = session.id
+                upload.executed_at = datetime.utcnow()
 
             # Update upload
-            upload.session_id = session.id
             upload.task_id = self.request.id
-            upload.executed_at = datetime.utcnow()
             await db.commit()
 
-            # Get all rows
+            # Rows already finished by a previous attempt
+            counts_result = await db.execute(
+                select(BulkSearchRow.status, func.count())
+                .where(BulkSearchRow.upload_id == upload_id)
+                .group_by(BulkSearchRow.status)
+            )
+            status_counts = dict(counts_result.all())
+
+            # Get rows still to run, in CSV order (a retried task skips
+            # rows finished by the previous attempt)
             rows_result = await db.execute(
-                select(BulkSearchRow).where(BulkSearchRow.upload_id == upload_id)
+                select(BulkSearchRow)
+                .where(
+                    BulkSearchRow.upload_id == upload_id,
+                    BulkSearchRow.status == "pending",
+                )
+                .order_by(BulkSearchRow.row_number)
             )
             rows = list(rows_result.scalars().all())
 
             # Execute each row
-            successful = 0
-            failed = 0
+            total_rows = sum(status_counts.values())
+            successful = status_counts.get("completed", 0)
+            failed = status_counts.get("failed", 0)
 
             for row in rows:
                 try:
@@ -342,12 +363,12 @@ async def bulk_search_task(
                 await db.commit()
 
                 # Update progress
-                progress = ((successful + failed) / len(rows)) * 100
+                progress = ((successful + failed) / total_rows) * 100
                 self.update_state(
                     state="PROGRESS",
                     meta={
                         "current": successful + failed,
-                        "total": len(rows),
+                        "total": total_rows,
                         "percentage": progress,
                     },
                 )
@@ -365,7 +386,7 @@ async def bulk_search_task(
             return {
                 "upload_id": upload_id,
                 "session_id": session.id,
-                "total_rows": len(rows),
+                "total_rows": total_rows,
                 "successful": successful,
                 "failed": failed,
                 "status": "completed",
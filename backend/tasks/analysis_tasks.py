@@ -1,11 +1,13 @@
 """Celery tasks for content analysis operations."""
 import logging
 from typing import Dict, Any, List
+import orjson
 from celery import Task
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from backend.celery_app import celery_app
 from backend.config import settings
+from backend.database import json_serializer, prepare_threshold, server_options
 from backend.services.analysis_service import AnalysisService
 from backend.models.website import WebsiteContent
 from backend.models.scraping import ScrapingJob
@@ -26,6 +28,16 @@ async_engine = create_async_engine(
     pool_size=5,
     max_overflow=10,
     pool_pre_ping=True,
+    pool_recycle=settings.database_pool_recycle,
+    query_cache_size=settings.database_query_cache_size,
+    insertmanyvalues_page_size=settings.database_insertmanyvalues_page_size,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
+    pool_use_lifo=True,
+    connect_args={
+        "options": server_options(),
+        "prepare_threshold": prepare_threshold(),
+    },
 )
 
 AsyncSessionLocal = async_sessionmaker(
@@ -1,23 +1,110 @@
 """Celery tasks for web scraping operations."""
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse
 from celery import chain, group
-from sqlalchemy import select
+from sqlalchemy import insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.celery_app import celery_app
+from backend.config import settings
 from backend.database import AsyncSessionLocal
 from backend.models.scraping import ScrapingJob
 from backend.models.search import SearchSession, SearchResult
-from backend.models.website import Website, WebsiteContent
+from backend.models.website import Website, WebsiteContent, WebsiteOutboundLink
 from backend.core.scrapers.playwright_scraper import PlaywrightScraper
 from backend.utils.content_extraction import filter_same_domain, filter_by_tlds
 
 logger = logging.getLogger(__name__)
 
 
+def outbound_link_rows(content_id: int, links: list[str]) -> list[dict]:
+    """
+    Build website_outbound_links rows for a page's outbound links.
+
+    Args:
+        content_id: WebsiteContent ID the links were found on
+        links: Outbound link URLs in page order
+
+    Returns:
+        Row dicts for a Core insert
+    """
+    return [
+        {
+            "content_id": content_id,
+            "rank": rank,
+            "target_url": link,
+            "target_domain": urlparse(link).netloc[:255],
+        }
+        for rank, link in enumerate(links)
+    ]
+
+
+class JobProgress:
+    """
+    Buffered progress counters for one scraping job.
+
+    Pages are counted in memory and written with a single
+    ``UPDATE ... SET urls_scraped = urls_scraped + :delta`` every
+    ``scraping_progress_flush_pages`` pages or
+    ``scraping_progress_flush_interval`` seconds, instead of rewriting
+    the job row once per page.
+    """
+
+    def __init__(self, job_id: int):
+        self.job_id = job_id
+        self.deltas = {"success": 0, "failed": 0, "skipped": 0}
+        self.last_flush = time.monotonic()
+
+    @property
+    def pending(self) -> int:
+        """Number of pages counted but not yet written."""
+        return sum(self.deltas.values())
+
+    def record(self, status: str) -> None:
+        """
+        Count one page.
+
+        Args:
+            status: Page outcome (success, failed or skipped)
+        """
+        if status in self.deltas:
+            self.deltas[status] += 1
+
+    def due(self) -> bool:
+        """Check whether buffered counts should be written now."""
+        return self.pending >= settings.scraping_progress_flush_pages or (
+            self.pending > 0
+            and time.monotonic() - self.last_flush >= settings.scraping_progress_flush_interval
+        )
+
+    async def flush(self, session: AsyncSession) -> None:
+        """
+        Add buffered counts to the job row.
+
+        The caller commits.
+
+        Args:
+            session: Database session
+        """
+        self.last_flush = time.monotonic()
+        if not self.pending:
+            return
+
+        await session.execute(
+            update(ScrapingJob)
+            .where(ScrapingJob.id == self.job_id)
+            .values(
+                urls_scraped=ScrapingJob.urls_scraped + self.deltas["success"],
+                urls_failed=ScrapingJob.urls_failed + self.deltas["failed"],
+                urls_skipped=ScrapingJob.urls_skipped + self.deltas["skipped"],
+            )
+        )
+        self.deltas = dict.fromkeys(self.deltas, 0)
+
+
 async def get_async_session() -> AsyncSession:
     """
     Get async database session for Celery tasks.
@@ -53,6 +140,8 @@ def scrape_session_task(self, job_id: int) -> dict:
     import asyncio
 
     async def run_scraping():
+        progress = JobProgress(job_id)
+
         async with AsyncSessionLocal() as session:
             try:
                 # Load scraping job
@@ -108,6 +197,7 @@ def scrape_session_task(self, job_id: int) -> dict:
                         depth=1,
                         parent_url=None,
                         session=session,
+                        progress=progress,
                     )
 
                     if result["status"] == "success":
@@ -116,7 +206,7 @@ def scrape_session_task(self, job_id: int) -> dict:
                             next_level_urls.extend(result["outbound_links"])
 
                 # Update progress
-                job.urls_scraped = len(scraped_urls)
+                await progress.flush(session)
                 job.current_depth = 1
                 await session.commit()
 
@@ -143,6 +233,7 @@ def scrape_session_task(self, job_id: int) -> dict:
                             depth=2,
                             parent_url=None,  # Could track parent URL if needed
                             session=session,
+                            progress=progress,
                         )
                         depth2_results.append(result)
 
@@ -153,7 +244,7 @@ def scrape_session_task(self, job_id: int) -> dict:
                                 next_level_urls.extend(result["outbound_links"])
 
                     # Update progress
-                    job.urls_scraped = len(scraped_urls)
+                    await progress.flush(session)
                     job.current_depth = 2
                     await session.commit()
 
@@ -177,12 +268,13 @@ def scrape_session_task(self, job_id: int) -> dict:
                             depth=3,
                             parent_url=None,
                             session=session,
+                            progress=progress,
                         )
 
                         if result["status"] == "success":
                             scraped_urls.add(url)
 
-                    job.urls_scraped = len(scraped_urls)
+                    await progress.flush(session)
                     job.current_depth = 3
                     await session.commit()
 
@@ -211,6 +303,7 @@ def scrape_session_task(self, job_id: int) -> dict:
                     )
                     job = result.scalar_one_or_none()
                     if job:
+                        await progress.flush(session)
                         job.status = "failed"
                         job.completed_at = datetime.utcnow()
                         job.error_message = str(e)
@@ -236,6 +329,7 @@ async def scrape_url_async(
     depth: int,
     parent_url: Optional[str],
     session: AsyncSession,
+    progress: JobProgress,
 ) -> dict:
     """
     Scrape a single URL asynchronously.
@@ -246,6 +340,7 @@ async def scrape_url_async(
         depth: Current depth level
         parent_url: Parent URL that linked to this one
         session: Database session
+        progress: Buffered progress counters for the job
 
     Returns:
         Dict with scraping result
@@ -270,8 +365,7 @@ async def scrape_url_async(
                 excluded = excluded.lower().strip()
                 if domain.lower() == excluded or domain.lower().endswith('.' + excluded):
                     logger.info(f"Skipping URL {url} - domain {domain} is in excluded list")
-                    job.urls_skipped += 1
-                    await session.commit()
+                    progress.record("skipped")
                     return {"status": "skipped", "reason": "excluded_domain"}
 
         # Check if URL already scraped in this job
@@ -284,8 +378,7 @@ async def scrape_url_async(
         )
         if existing.scalar_one_or_none():
             logger.debug(f"URL {url} already scraped in this job")
-            job.urls_skipped += 1
-            await session.commit()
+            progress.record("skipped")
             return {"status": "skipped", "reason": "already_scraped"}
 
         # Create scraper
@@ -307,10 +400,11 @@ async def scrape_url_async(
         # If scraping failed, try to use search result snippet as fallback
         if scrape_result.status == "failed" and depth == 1:
             # Only use fallback for depth 1 (original search results)
+            # The same URL can be returned by several queries
             result = await session.execute(
-                select(SearchResult).where(SearchResult.url == url)
+                select(SearchResult).where(SearchResult.url == url).limit(1)
             )
-            search_result = result.scalar_one_or_none()
+            search_result = result.scalars().first()
 
             if search_result and search_result.description:
                 logger.info(f"Using search snippet as fallback for {url}")
@@ -324,9 +418,9 @@ async def scrape_url_async(
         # Get or create Website record
         domain = urlparse(url).netloc
         website_result = await session.execute(
-            select(Website).where(Website.url == url)
+            select(Website).where(Website.url == url).limit(1)
         )
-        website = website_result.scalar_one_or_none()
+        website = website_result.scalars().first()
 
         if not website:
             website = Website(
@@ -410,19 +504,22 @@ async def scrape_url_async(
                 outbound_links=scrape_result.outbound_links,
                 http_status_code=scrape_result.http_status_code,
                 final_url=scrape_result.final_url,
-                scrape_duration=int(scrape_result.duration * 1000),  # Convert to milliseconds
+                scrape_duration=scrape_result.duration * 1000,  # Convert to milliseconds
             )
             session.add(content)
 
-            # Update job statistics
-            if scrape_result.status == "success":
-                job.urls_scraped += 1
-            elif scrape_result.status == "failed":
-                job.urls_failed += 1
-            elif scrape_result.status == "skipped":
-                job.urls_skipped += 1
+            if scrape_result.outbound_links:
+                # Flush for content.id, then one executemany for the links
+                await session.flush()
+                await session.execute(
+                    insert(WebsiteOutboundLink.__table__),
+                    outbound_link_rows(content.id, scrape_result.outbound_links),
+                )
 
             await session.commit()
+
+            # Update job statistics
+            progress.record(scrape_result.status)
         except Exception as db_error:
             # If database insert still fails, rollback and save minimal record
             logger.error(f"Failed to insert content for {url}: {db_error}")
@@ -447,10 +544,15 @@ async def scrape_url_async(
                 outbound_links=[],
                 http_status_code=scrape_result.http_status_code,
                 final_url=scrape_result.final_url,
-                scrape_duration=int(scrape_result.duration * 1000),
+                scrape_duration=scrape_result.duration * 1000,
             )
             session.add(content)
-            job.urls_failed += 1
+            await session.commit()
+            progress.record("failed")
+
+        # Flushed in its own transaction so a failed page insert can't roll it back
+        if progress.due():
+            await progress.flush(session)
             await session.commit()
 
         logger.info(f"Scraped {url} (depth {depth}): {scrape_result.status}")
@@ -473,7 +575,7 @@ async def scrape_url_async(
             )
             job = result.scalar_one_or_none()
             if job:
-                job.urls_failed += 1
+                progress.record("failed")
                 job.error_count += 1
                 await session.commit()
         except Exception:
@@ -3,7 +3,7 @@ from typing import Annotated, Optional
 
 from fastapi import Depends, HTTPException, status, Request, Cookie
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.database import get_db
@@ -14,6 +14,11 @@ from backend.utils.auth import decode_access_token
 # HTTP Bearer token scheme (auto_error=False to make it optional)
 security = HTTPBearer(auto_error=False)
 
+# Runs on every authenticated request; built once at import
+_select_active_user = select(User).where(
+    User.id == bindparam("user_id"), User.is_active == True
+)
+
 
 async def get_current_user(
     credentials: Annotated[Optional[HTTPAuthorizationCredentials], Depends(security)],
@@ -68,9 +73,7 @@ async def get_current_user(
     token_data = TokenData(username=username, user_id=user_id)
 
     # Fetch user from database
-    result = await db.execute(
-        select(User).where(User.id == token_data.user_id, User.is_active == True)
-    )
+    result = await db.execute(_select_active_user, {"user_id": token_data.user_id})
     user = result.scalar_one_or_none()
 
     if user is None:
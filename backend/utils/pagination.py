@@ -1,5 +1,6 @@
 """Pagination utilities for database queries."""
-from typing import Generic, TypeVar, List, Optional
+from datetime import datetime
+from typing import Generic, TypeVar, List, Optional, Tuple
 from pydantic import BaseModel, Field
 from sqlalchemy import Select, func
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -207,6 +208,37 @@ async def paginate_cursor(
     return items, next_cursor, has_more
 
 
+def encode_keyset_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Encode a (created_at, id) keyset position as an opaque cursor.
+
+    Args:
+        created_at: Creation time of the last row of a page
+        row_id: ID of the last row of a page
+
+    Returns:
+        Cursor string for the next page's request
+    """
+    return f"{created_at.isoformat()}_{row_id}"
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor built by encode_keyset_cursor().
+
+    Args:
+        cursor: Cursor string from a previous page
+
+    Returns:
+        Tuple of (created_at, id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    created_at, _, row_id = cursor.rpartition("_")
+    return datetime.fromisoformat(created_at), int(row_id)
+
+
 class PaginationParams(BaseModel):
     """
     Query parameters for pagination.
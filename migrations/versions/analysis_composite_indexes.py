@@ -0,0 +1,67 @@
+"""Add composite indexes for analysis query patterns.
+
+Revision ID: analysis_composite_indexes
+Revises: v6_0_0_enhancements
+Create Date: 2026-10-16 10:00:00.000000
+
+Per-content and top-N keyword queries filter on several columns at once.
+Composite indexes replace bitmap merges of single-column indexes and
+remove the sort step. The single-column indexes on extracted_nouns.word
+and extracted_nouns.language are never used on their own and are dropped
+to reduce write cost.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'analysis_composite_indexes'
+down_revision: Union[str, None] = 'v6_0_0_enhancements'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create composite indexes and drop redundant single-column ones."""
+
+    # ===== extracted_nouns =====
+
+    op.create_index(
+        'ix_extracted_nouns_content_method',
+        'extracted_nouns',
+        ['website_content_id', 'extraction_method'],
+        postgresql_using='btree',
+    )
+
+    op.create_index(
+        'ix_extracted_nouns_lang_method_score',
+        'extracted_nouns',
+        ['language', 'extraction_method', 'tfidf_score'],
+        postgresql_using='btree',
+    )
+
+    op.drop_index('ix_extracted_nouns_word', table_name='extracted_nouns')
+    op.drop_index('ix_extracted_nouns_language', table_name='extracted_nouns')
+
+    # ===== extracted_entities =====
+
+    op.create_index(
+        'ix_extracted_entities_content_confidence',
+        'extracted_entities',
+        ['website_content_id', 'confidence'],
+        postgresql_using='btree',
+    )
+
+
+def downgrade() -> None:
+    """Restore single-column indexes and drop composite indexes."""
+
+    op.drop_index(
+        'ix_extracted_entities_content_confidence',
+        table_name='extracted_entities',
+    )
+
+    op.create_index('ix_extracted_nouns_language', 'extracted_nouns', ['language'])
+    op.create_index('ix_extracted_nouns_word', 'extracted_nouns', ['word'])
+
+    op.drop_index('ix_extracted_nouns_lang_method_score', table_name='extracted_nouns')
+    op.drop_index('ix_extracted_nouns_content_method', table_name='extracted_nouns')
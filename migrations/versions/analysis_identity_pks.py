@@ -0,0 +1,51 @@
+"""Convert analysis table primary keys from SERIAL to IDENTITY.
+
+Revision ID: analysis_identity_pks
+Revises: analysis_utc_server_defaults
+Create Date: 2026-10-16 12:00:00.000000
+
+The analysis models declare Identity() primary keys, which SQLAlchemy
+uses as the insert sentinel for batched ORM bulk inserts with RETURNING.
+This aligns the existing SERIAL columns with the model definition and
+continues numbering after the current maximum id.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'analysis_identity_pks'
+down_revision: Union[str, None] = 'analysis_utc_server_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ['extracted_nouns', 'extracted_entities', 'content_analysis']
+
+
+def upgrade() -> None:
+    """Replace SERIAL sequences with GENERATED BY DEFAULT AS IDENTITY."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id "
+            f"ADD GENERATED BY DEFAULT AS IDENTITY"
+        )
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        )
+
+
+def downgrade() -> None:
+    """Replace IDENTITY columns with SERIAL sequences."""
+    for table in TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+        op.execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(
+            f"SELECT setval('{table}_id_seq', "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id "
+            f"SET DEFAULT nextval('{table}_id_seq')"
+        )
@@ -0,0 +1,51 @@
+"""Use UTC server-side defaults for analysis timestamps.
+
+Revision ID: analysis_utc_server_defaults
+Revises: extracted_entities_scaled_confidence
+Create Date: 2026-10-16 11:30:00.000000
+
+The analysis models no longer send Python-generated timestamps; the
+database fills created_at/updated_at. CURRENT_TIMESTAMP follows the
+session time zone, so the defaults are pinned to UTC to match the
+naive UTC values stored so far.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'analysis_utc_server_defaults'
+down_revision: Union[str, None] = 'extracted_entities_scaled_confidence'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    ('extracted_nouns', 'created_at'),
+    ('extracted_entities', 'created_at'),
+    ('content_analysis', 'created_at'),
+    ('content_analysis', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+    """Set timezone('UTC', now()) as server default."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        )
+
+
+def downgrade() -> None:
+    """Restore CURRENT_TIMESTAMP server default."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text('CURRENT_TIMESTAMP'),
+        )
@@ -0,0 +1,78 @@
+"""Widen high-volume ids to BIGINT identity columns.
+
+Revision ID: bigint_content_ids
+Revises: drop_unused_indexes
+Create Date: 2026-10-16 20:00:00.000000
+
+search_results, website_content, extracted_nouns and extracted_entities
+grow with every crawl and analysis run and can outrun a 32-bit id.
+Their ids (and every foreign key to website_content.id) become BIGINT;
+search_results and website_content also move from SERIAL to IDENTITY
+like the analysis tables.
+
+Changing a column type rewrites the table and its indexes under an
+ACCESS EXCLUSIVE lock. Run this in a maintenance window on large
+databases.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'bigint_content_ids'
+down_revision: Union[str, None] = 'drop_unused_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs widened to BIGINT, referenced columns first
+BIGINT_COLUMNS = [
+    ('search_results', 'id'),
+    ('website_content', 'id'),
+    ('website_outbound_links', 'content_id'),
+    ('extracted_nouns', 'id'),
+    ('extracted_nouns', 'website_content_id'),
+    ('extracted_entities', 'id'),
+    ('extracted_entities', 'website_content_id'),
+    ('content_analysis', 'website_content_id'),
+]
+
+# Tables still on SERIAL ids
+SERIAL_TABLES = ['search_results', 'website_content']
+
+
+def upgrade() -> None:
+    """Widen the columns and convert SERIAL ids to IDENTITY."""
+    for table, column in BIGINT_COLUMNS:
+        # Identity sequences follow the column type
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE bigint")
+
+    for table in SERIAL_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id "
+            f"ADD GENERATED BY DEFAULT AS IDENTITY"
+        )
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        )
+
+
+def downgrade() -> None:
+    """Restore SERIAL ids and INTEGER columns (fails if ids exceed 2^31)."""
+    for table in SERIAL_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY IF EXISTS")
+
+    for table, column in reversed(BIGINT_COLUMNS):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE integer")
+
+    for table in SERIAL_TABLES:
+        op.execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(
+            f"SELECT setval('{table}_id_seq', "
+            f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id "
+            f"SET DEFAULT nextval('{table}_id_seq')"
+        )
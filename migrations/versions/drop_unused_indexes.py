@@ -0,0 +1,59 @@
+"""Drop single-column indexes that no query uses.
+
+Revision ID: drop_unused_indexes
+Revises: users_citext
+Create Date: 2026-10-16 19:30:00.000000
+
+None of these columns is filtered, joined or sorted on by itself. Each
+index only added write cost to tables filled in bulk by the search,
+expansion and scraping tasks. Check pg_stat_user_indexes.idx_scan before
+applying to a database with custom reporting queries.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'drop_unused_indexes'
+down_revision: Union[str, None] = 'users_citext'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNUSED_INDEXES = [
+    ('ix_query_expansion_candidates_candidate_term', 'query_expansion_candidates', 'candidate_term'),
+    ('ix_query_expansion_candidates_source', 'query_expansion_candidates', 'source'),
+    ('ix_query_expansion_candidates_generation', 'query_expansion_candidates', 'generation'),
+    ('ix_query_expansion_candidates_created_at', 'query_expansion_candidates', 'created_at'),
+    ('ix_search_queries_date_from', 'search_queries', 'date_from'),
+    ('ix_search_queries_date_to', 'search_queries', 'date_to'),
+    ('ix_search_queries_framing_type', 'search_queries', 'framing_type'),
+    ('ix_search_queries_language', 'search_queries', 'language'),
+    ('ix_search_results_domain', 'search_results', 'domain'),
+    ('ix_websites_domain', 'websites', 'domain'),
+    ('ix_scraping_jobs_celery_task_id', 'scraping_jobs', 'celery_task_id'),
+]
+
+
+def upgrade() -> None:
+    """Drop the unused indexes."""
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, _ in UNUSED_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Recreate the dropped indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, column in UNUSED_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
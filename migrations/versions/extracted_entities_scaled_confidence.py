@@ -0,0 +1,73 @@
+"""Store extracted_entities confidence as a scaled SMALLINT.
+
+Revision ID: extracted_entities_scaled_confidence
+Revises: extracted_nouns_packed_positions
+Create Date: 2026-10-16 11:00:00.000000
+
+A 0.0-1.0 probability fits in a SMALLINT scaled by 10000 (2 bytes
+instead of 8), narrowing every entity row. Existing indexes on the
+column are rebuilt by the type change and follow the rename.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'extracted_entities_scaled_confidence'
+down_revision: Union[str, None] = 'extracted_nouns_packed_positions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert confidence to confidence_x10000 SMALLINT."""
+    op.alter_column(
+        'extracted_entities',
+        'confidence',
+        existing_type=sa.Float(),
+        existing_nullable=False,
+        server_default=None,
+    )
+    op.alter_column(
+        'extracted_entities',
+        'confidence',
+        existing_type=sa.Float(),
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using='round(confidence * 10000)::smallint',
+    )
+    op.alter_column(
+        'extracted_entities',
+        'confidence',
+        new_column_name='confidence_x10000',
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        server_default='10000',
+    )
+
+
+def downgrade() -> None:
+    """Convert confidence_x10000 back to a float confidence column."""
+    op.alter_column(
+        'extracted_entities',
+        'confidence_x10000',
+        existing_type=sa.SmallInteger(),
+        existing_nullable=False,
+        server_default=None,
+    )
+    op.alter_column(
+        'extracted_entities',
+        'confidence_x10000',
+        existing_type=sa.SmallInteger(),
+        type_=sa.Float(),
+        existing_nullable=False,
+        postgresql_using='confidence_x10000 / 10000.0',
+    )
+    op.alter_column(
+        'extracted_entities',
+        'confidence_x10000',
+        new_column_name='confidence',
+        existing_type=sa.Float(),
+        existing_nullable=False,
+        server_default='1.0',
+    )
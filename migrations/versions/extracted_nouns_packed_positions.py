@@ -0,0 +1,81 @@
+"""Store extracted_nouns positions as packed uint32 bytes.
+
+Revision ID: extracted_nouns_packed_positions
+Revises: analysis_composite_indexes
+Create Date: 2026-10-16 10:30:00.000000
+
+Replaces the JSON positions column with a bytea of big-endian uint32
+offsets (4 bytes per position instead of up to 7 ASCII characters).
+Existing rows are converted server-side with int4send().
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision: str = 'extracted_nouns_packed_positions'
+down_revision: Union[str, None] = 'analysis_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert JSON positions to packed bytea."""
+    op.add_column(
+        'extracted_nouns',
+        sa.Column(
+            'positions_blob',
+            postgresql.BYTEA(),
+            nullable=False,
+            server_default=sa.text("''::bytea"),
+        )
+    )
+
+    op.execute(
+        """
+        UPDATE extracted_nouns
+        SET positions_blob = COALESCE(
+            (
+                SELECT string_agg(int4send(p.value::int), ''::bytea ORDER BY p.ord)
+                FROM json_array_elements_text(positions) WITH ORDINALITY AS p(value, ord)
+            ),
+            ''::bytea
+        )
+        """
+    )
+
+    op.alter_column('extracted_nouns', 'positions_blob', server_default=None)
+    op.drop_column('extracted_nouns', 'positions')
+
+
+def downgrade() -> None:
+    """Convert packed bytea positions back to JSON."""
+    op.add_column(
+        'extracted_nouns',
+        sa.Column(
+            'positions',
+            postgresql.JSON(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'[]'::json"),
+        )
+    )
+
+    op.execute(
+        """
+        UPDATE extracted_nouns
+        SET positions = COALESCE(
+            (
+                SELECT json_agg(
+                    ('x' || encode(substring(positions_blob FROM i FOR 4), 'hex'))::bit(32)::int
+                    ORDER BY i
+                )
+                FROM generate_series(1, length(positions_blob), 4) AS i
+            ),
+            '[]'::json
+        )
+        """
+    )
+
+    op.alter_column('extracted_nouns', 'positions', server_default=None)
+    op.drop_column('extracted_nouns', 'positions_blob')
@@ -0,0 +1,82 @@
+"""Add covering indexes for the per-job aggregate joins.
+
+Revision ID: job_aggregate_covering_indexes
+Revises: noun_job_agg_view
+Create Date: 2026-10-16 21:00:00.000000
+
+The per-job entity aggregates filter website_content by scraping_job_id
+and join extracted_entities on website_content_id, reading label and
+text. With id included on the job index and text included on the
+(website_content_id, label) index, both sides can be read with
+index-only scans. Each new index supersedes an existing one with the
+same key columns, which is dropped.
+
+Noun aggregates read the noun_job_agg rollup table, so
+extracted_nouns gets no extra index here.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'job_aggregate_covering_indexes'
+down_revision: Union[str, None] = 'noun_job_agg_view'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (new index, table, key columns, included columns, superseded index)
+COVERING_INDEXES = [
+    (
+        'ix_website_content_job_id',
+        'website_content',
+        ['scraping_job_id'],
+        ['id'],
+        'ix_website_content_scraping_job_id',
+    ),
+    (
+        'ix_extracted_entities_content_label_text',
+        'extracted_entities',
+        ['website_content_id', 'label'],
+        ['text'],
+        'ix_extracted_entities_content_label',
+    ),
+]
+
+
+def upgrade() -> None:
+    """Create the covering indexes and drop the ones they supersede."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, include, superseded in COVERING_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                superseded,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Restore the plain indexes and drop the covering ones."""
+    with op.get_context().autocommit_block():
+        for name, table, columns, _, superseded in COVERING_INDEXES:
+            op.create_index(
+                superseded,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,94 @@
+"""Convert JSON columns to JSONB and add GIN indexes.
+
+Revision ID: jsonb_gin_indexes
+Revises: analysis_identity_pks
+Create Date: 2026-10-16 13:00:00.000000
+
+JSON columns cannot be indexed, so any filter on their contents is a
+sequential scan. JSONB columns get GIN (jsonb_path_ops) indexes where
+containment (@>) lookups make sense: small, config-like documents.
+outbound_links (large, write-hot) and validation_errors / allowed_domains
+/ backboning_statistics (not filtered on) are converted but not indexed.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision: str = 'jsonb_gin_indexes'
+down_revision: Union[str, None] = 'analysis_identity_pks'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, nullable)
+JSONB_COLUMNS = [
+    ('bulk_search_uploads', 'validation_errors', True),
+    ('bulk_search_rows', 'query_data', False),
+    ('search_queries', 'allowed_domains', True),
+    ('search_queries', 'domain_whitelist', True),
+    ('search_queries', 'domain_blacklist', True),
+    ('search_queries', 'tld_filter', True),
+    ('search_queries', 'sphere_filter', True),
+    ('website_content', 'outbound_links', True),
+    ('network_exports', 'backboning_statistics', True),
+    ('network_exports', 'network_metadata', False),
+    ('query_expansion_candidates', 'metadata', True),
+]
+
+# (index name, table, column)
+GIN_INDEXES = [
+    ('ix_bulk_search_rows_query_data', 'bulk_search_rows', 'query_data'),
+    ('ix_search_queries_domain_whitelist', 'search_queries', 'domain_whitelist'),
+    ('ix_search_queries_domain_blacklist', 'search_queries', 'domain_blacklist'),
+    ('ix_search_queries_tld_filter', 'search_queries', 'tld_filter'),
+    ('ix_search_queries_sphere_filter', 'search_queries', 'sphere_filter'),
+    ('ix_network_exports_network_metadata', 'network_exports', 'network_metadata'),
+    ('ix_query_expansion_candidates_metadata', 'query_expansion_candidates', 'metadata'),
+]
+
+
+def upgrade() -> None:
+    """Convert columns to JSONB and build GIN indexes concurrently."""
+    for table, column, nullable in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSON(astext_type=sa.Text()),
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for index_name, table, column in GIN_INDEXES:
+            op.create_index(
+                index_name,
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop GIN indexes and convert columns back to JSON."""
+    with op.get_context().autocommit_block():
+        for index_name, table, _ in GIN_INDEXES:
+            op.drop_index(
+                index_name,
+                table_name=table,
+                postgresql_concurrently=True,
+            )
+
+    for table, column, nullable in JSONB_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            type_=postgresql.JSON(astext_type=sa.Text()),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::json',
+        )
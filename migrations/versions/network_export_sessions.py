@@ -0,0 +1,81 @@
+"""Add network_export_sessions join table.
+
+Revision ID: network_export_sessions
+Revises: network_exports_keyset_index
+Create Date: 2026-10-16 22:00:00.000000
+
+Normalizes network_exports.session_ids into one row per (network,
+session) so exports are found by session with a B-tree lookup and can be
+joined to search_sessions. Existing exports are backfilled from the
+array, which stays as the per-export copy returned by the network API.
+The GIN index on the array served only those lookups and is dropped.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'network_export_sessions'
+down_revision: Union[str, None] = 'network_exports_keyset_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create network_export_sessions, backfill it and drop the GIN index."""
+    op.create_table(
+        'network_export_sessions',
+        sa.Column('network_id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['network_id'], ['network_exports.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(
+            ['session_id'], ['search_sessions.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('network_id', 'session_id'),
+    )
+
+    # Backfill before indexing so the index is built once. Ids of
+    # sessions deleted since the export have nothing to reference.
+    op.execute("""
+        INSERT INTO network_export_sessions (network_id, session_id)
+        SELECT DISTINCT ne.id, s.id
+        FROM network_exports ne
+        CROSS JOIN LATERAL unnest(ne.session_ids) AS sid(session_id)
+        JOIN search_sessions s ON s.id = sid.session_id
+    """)
+
+    op.create_index(
+        'ix_network_export_sessions_session_network',
+        'network_export_sessions',
+        ['session_id', 'network_id'],
+    )
+
+    # DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_network_exports_session_ids',
+            table_name='network_exports',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the GIN index and drop network_export_sessions."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_network_exports_session_ids',
+            'network_exports',
+            ['session_ids'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+    op.drop_index(
+        'ix_network_export_sessions_session_network',
+        table_name='network_export_sessions',
+    )
+    op.drop_table('network_export_sessions')
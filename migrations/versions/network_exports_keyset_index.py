@@ -0,0 +1,71 @@
+"""Index network exports for keyset pagination.
+
+Revision ID: network_exports_keyset_index
+Revises: job_aggregate_covering_indexes
+Create Date: 2026-10-16 21:30:00.000000
+
+A user's networks are paged newest first with a (created_at, id)
+cursor. (user_id, created_at DESC, id DESC) serves each page as one
+range scan with a unique sort key. It supersedes
+idx_network_exports_user_created (no id tiebreaker) and the plain
+user_id index, which are dropped.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'network_exports_keyset_index'
+down_revision: Union[str, None] = 'job_aggregate_covering_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the keyset index and drop the superseded ones."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_network_exports_user_created_id',
+            'network_exports',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'idx_network_exports_user_created',
+            table_name='network_exports',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            'ix_network_exports_user_id',
+            table_name='network_exports',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the superseded indexes and drop the keyset index."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_network_exports_user_id',
+            'network_exports',
+            ['user_id'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'idx_network_exports_user_created',
+            'network_exports',
+            ['user_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_network_exports_user_created_id',
+            table_name='network_exports',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
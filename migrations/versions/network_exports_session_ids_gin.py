@@ -0,0 +1,38 @@
+"""Ensure network_exports.session_ids is indexed with GIN.
+
+Revision ID: network_exports_session_ids_gin
+Revises: jsonb_gin_indexes
+Create Date: 2026-10-16 13:30:00.000000
+
+The model declared session_ids with index=True, so databases created via
+Base.metadata.create_all got a B-tree named ix_network_exports_session_ids
+that cannot serve @> / && containment lookups. Rebuild the index as GIN
+(array_ops) regardless of how the database was created.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'network_exports_session_ids_gin'
+down_revision: Union[str, None] = 'jsonb_gin_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rebuild ix_network_exports_session_ids as a GIN index."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_network_exports_session_ids')
+        op.create_index(
+            'ix_network_exports_session_ids',
+            'network_exports',
+            ['session_ids'],
+            postgresql_using='gin',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Nothing to do: the initial migration already created a GIN index."""
+    pass
@@ -0,0 +1,91 @@
+"""Rebuild noun_job_agg without COUNT(DISTINCT).
+
+Revision ID: noun_job_agg_pre_aggregate
+Revises: network_export_sessions
+Create Date: 2026-10-16 22:30:00.000000
+
+COUNT(DISTINCT website_content_id) sorts every (job, lemma) group inside
+the aggregate. The view now groups by (job, content, lemma) first and
+counts the pre-aggregated rows, which gives the same totals, average
+TF-IDF and content counts with plain hash aggregation. Speeds up the
+REFRESH run after each batch analysis.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'noun_job_agg_pre_aggregate'
+down_revision: Union[str, None] = 'network_export_sessions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRE_AGGREGATED_VIEW = """
+    CREATE MATERIALIZED VIEW noun_job_agg AS
+    SELECT
+        scraping_job_id,
+        lemma,
+        SUM(frequency) AS total_frequency,
+        SUM(tfidf_sum) / SUM(noun_count) AS avg_tfidf_score,
+        COUNT(*) AS content_count,
+        MIN(word) AS example_word
+    FROM (
+        SELECT
+            wc.scraping_job_id,
+            en.website_content_id,
+            en.lemma,
+            SUM(en.frequency) AS frequency,
+            SUM(en.tfidf_score) AS tfidf_sum,
+            COUNT(*) AS noun_count,
+            MIN(en.word) AS word
+        FROM extracted_nouns en
+        JOIN website_content wc ON wc.id = en.website_content_id
+        WHERE wc.scraping_job_id IS NOT NULL
+        GROUP BY wc.scraping_job_id, en.website_content_id, en.lemma
+    ) per_content
+    GROUP BY scraping_job_id, lemma
+"""
+
+DISTINCT_VIEW = """
+    CREATE MATERIALIZED VIEW noun_job_agg AS
+    SELECT
+        wc.scraping_job_id,
+        en.lemma,
+        SUM(en.frequency) AS total_frequency,
+        AVG(en.tfidf_score) AS avg_tfidf_score,
+        COUNT(DISTINCT en.website_content_id) AS content_count,
+        MIN(en.word) AS example_word
+    FROM extracted_nouns en
+    JOIN website_content wc ON wc.id = en.website_content_id
+    WHERE wc.scraping_job_id IS NOT NULL
+    GROUP BY wc.scraping_job_id, en.lemma
+"""
+
+
+def _create_view(definition: str) -> None:
+    """Replace noun_job_agg with the given definition and index it."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS noun_job_agg")
+    op.execute(definition)
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ux_noun_job_agg_job_lemma',
+        'noun_job_agg',
+        ['scraping_job_id', 'lemma'],
+        unique=True,
+    )
+    # Top nouns of a job
+    op.create_index(
+        'ix_noun_job_agg_job_frequency',
+        'noun_job_agg',
+        ['scraping_job_id', sa.text('total_frequency DESC')],
+    )
+
+
+def upgrade() -> None:
+    """Rebuild noun_job_agg from per-content pre-aggregates."""
+    _create_view(PRE_AGGREGATED_VIEW)
+
+
+def downgrade() -> None:
+    """Restore the COUNT(DISTINCT) definition."""
+    _create_view(DISTINCT_VIEW)
@@ -0,0 +1,96 @@
+"""Replace the noun_job_agg materialized view with a per-job rollup table.
+
+Revision ID: noun_job_agg_rollup_table
+Revises: noun_job_agg_pre_aggregate
+Create Date: 2026-10-17 10:00:00.000000
+
+The materialized view could only be refreshed as a whole: every batch
+recomputed the aggregates of every job, refreshes queued behind each
+other across workers, and single-content analyses and deletions never
+refreshed it. noun_job_agg is now a regular table keyed by
+(scraping_job_id, lemma) that the application recomputes for one job in
+the same transaction as each write to that job's nouns. Being part of
+the ORM metadata, create_all() builds it as well.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'noun_job_agg_rollup_table'
+down_revision: Union[str, None] = 'noun_job_agg_pre_aggregate'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Per-job aggregates over (job, content, lemma) pre-aggregates; same
+# definition as the view it replaces
+JOB_NOUN_AGGREGATES = """
+    SELECT
+        scraping_job_id,
+        lemma,
+        SUM(frequency) AS total_frequency,
+        SUM(tfidf_sum) / SUM(noun_count) AS avg_tfidf_score,
+        COUNT(*) AS content_count,
+        MIN(word) AS example_word
+    FROM (
+        SELECT
+            wc.scraping_job_id,
+            en.website_content_id,
+            en.lemma,
+            SUM(en.frequency) AS frequency,
+            SUM(en.tfidf_score) AS tfidf_sum,
+            COUNT(*) AS noun_count,
+            MIN(en.word) AS word
+        FROM extracted_nouns en
+        JOIN website_content wc ON wc.id = en.website_content_id
+        WHERE wc.scraping_job_id IS NOT NULL
+        GROUP BY wc.scraping_job_id, en.website_content_id, en.lemma
+    ) per_content
+    GROUP BY scraping_job_id, lemma
+"""
+
+
+def upgrade() -> None:
+    """Drop the view, create the rollup table and backfill it."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS noun_job_agg")
+    op.create_table(
+        'noun_job_agg',
+        sa.Column('scraping_job_id', sa.Integer(), nullable=False),
+        sa.Column('lemma', sa.String(length=255), nullable=False),
+        sa.Column('total_frequency', sa.BigInteger(), nullable=False),
+        sa.Column('avg_tfidf_score', sa.Float(), nullable=False),
+        sa.Column('content_count', sa.BigInteger(), nullable=False),
+        sa.Column('example_word', sa.String(length=255), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['scraping_job_id'], ['scraping_jobs.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('scraping_job_id', 'lemma'),
+    )
+    op.execute(
+        "INSERT INTO noun_job_agg (scraping_job_id, lemma, total_frequency, "
+        "avg_tfidf_score, content_count, example_word)" + JOB_NOUN_AGGREGATES
+    )
+    # Top nouns of a job
+    op.create_index(
+        'ix_noun_job_agg_job_frequency',
+        'noun_job_agg',
+        ['scraping_job_id', sa.text('total_frequency DESC')],
+    )
+
+
+def downgrade() -> None:
+    """Restore the materialized view."""
+    op.drop_table('noun_job_agg')
+    op.execute("CREATE MATERIALIZED VIEW noun_job_agg AS" + JOB_NOUN_AGGREGATES)
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ux_noun_job_agg_job_lemma',
+        'noun_job_agg',
+        ['scraping_job_id', 'lemma'],
+        unique=True,
+    )
+    op.create_index(
+        'ix_noun_job_agg_job_frequency',
+        'noun_job_agg',
+        ['scraping_job_id', sa.text('total_frequency DESC')],
+    )
@@ -0,0 +1,62 @@
+"""Add the noun_job_agg materialized view.
+
+Revision ID: noun_job_agg_view
+Revises: bigint_content_ids
+Create Date: 2026-10-16 20:30:00.000000
+
+Job-level noun aggregates (top lemmas of a scraping job) were a join
+and GROUP BY over every extracted noun of the job on each request.
+noun_job_agg precomputes them per (scraping_job_id, lemma) so the read
+is an index scan on (scraping_job_id, total_frequency DESC). The view is
+refreshed CONCURRENTLY after batch analyses, which needs the unique
+(scraping_job_id, lemma) index.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'noun_job_agg_view'
+down_revision: Union[str, None] = 'bigint_content_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create and populate noun_job_agg with its indexes."""
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS noun_job_agg AS
+        SELECT
+            wc.scraping_job_id,
+            en.lemma,
+            SUM(en.frequency) AS total_frequency,
+            AVG(en.tfidf_score) AS avg_tfidf_score,
+            COUNT(DISTINCT en.website_content_id) AS content_count,
+            MIN(en.word) AS example_word
+        FROM extracted_nouns en
+        JOIN website_content wc ON wc.id = en.website_content_id
+        WHERE wc.scraping_job_id IS NOT NULL
+        GROUP BY wc.scraping_job_id, en.lemma
+        """
+    )
+    # Required by REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ux_noun_job_agg_job_lemma',
+        'noun_job_agg',
+        ['scraping_job_id', 'lemma'],
+        unique=True,
+        if_not_exists=True,
+    )
+    # Top nouns of a job
+    op.create_index(
+        'ix_noun_job_agg_job_frequency',
+        'noun_job_agg',
+        ['scraping_job_id', sa.text('total_frequency DESC')],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop noun_job_agg (its indexes go with it)."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS noun_job_agg")
@@ -0,0 +1,96 @@
+"""Add composite (parent, status, order) indexes for hot list queries.
+
+Revision ID: parent_status_composite_indexes
+Revises: network_exports_session_ids_gin
+Create Date: 2026-10-16 14:00:00.000000
+
+Per-parent list queries filter on the parent FK and status and order by
+a third column. Bitmap-ANDing two single-column indexes and then sorting
+is replaced by one range scan. The single-column FK and status indexes
+are leading-column prefixes of the composites, or are never used on
+their own, so they are dropped to reduce write cost.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'parent_status_composite_indexes'
+down_revision: Union[str, None] = 'network_exports_session_ids_gin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create composite indexes and drop redundant single-column ones."""
+
+    # ===== bulk_search_rows =====
+
+    op.create_index(
+        'ix_bulk_search_rows_upload_status',
+        'bulk_search_rows',
+        ['upload_id', 'status', 'row_number'],
+        postgresql_using='btree',
+    )
+    op.drop_index('ix_bulk_search_rows_upload_id', table_name='bulk_search_rows')
+    op.drop_index('ix_bulk_search_rows_status', table_name='bulk_search_rows')
+
+    # ===== scraping_jobs =====
+
+    op.create_index(
+        'ix_scraping_jobs_session_status_updated',
+        'scraping_jobs',
+        ['session_id', 'status', 'updated_at'],
+        postgresql_using='btree',
+    )
+    op.drop_index('ix_scraping_jobs_session_id', table_name='scraping_jobs')
+    op.drop_index('ix_scraping_jobs_status', table_name='scraping_jobs')
+
+    # ===== search_queries =====
+
+    op.create_index(
+        'ix_search_queries_session_status',
+        'search_queries',
+        ['session_id', 'status'],
+        postgresql_using='btree',
+    )
+    op.drop_index('ix_search_queries_session_id', table_name='search_queries')
+    op.drop_index('ix_search_queries_status', table_name='search_queries')
+
+    # ===== query_expansion_candidates =====
+
+    op.create_index(
+        'ix_query_expansion_candidates_session_score',
+        'query_expansion_candidates',
+        ['session_id', 'score'],
+        postgresql_using='btree',
+    )
+    op.drop_index(
+        'ix_query_expansion_candidates_session_id',
+        table_name='query_expansion_candidates',
+    )
+
+
+def downgrade() -> None:
+    """Restore single-column indexes and drop composite indexes."""
+
+    op.create_index(
+        'ix_query_expansion_candidates_session_id',
+        'query_expansion_candidates',
+        ['session_id'],
+    )
+    op.drop_index(
+        'ix_query_expansion_candidates_session_score',
+        table_name='query_expansion_candidates',
+    )
+
+    op.create_index('ix_search_queries_status', 'search_queries', ['status'])
+    op.create_index('ix_search_queries_session_id', 'search_queries', ['session_id'])
+    op.drop_index('ix_search_queries_session_status', table_name='search_queries')
+
+    op.create_index('ix_scraping_jobs_status', 'scraping_jobs', ['status'])
+    op.create_index('ix_scraping_jobs_session_id', 'scraping_jobs', ['session_id'])
+    op.drop_index('ix_scraping_jobs_session_status_updated', table_name='scraping_jobs')
+
+    op.create_index('ix_bulk_search_rows_status', 'bulk_search_rows', ['status'])
+    op.create_index('ix_bulk_search_rows_upload_id', 'bulk_search_rows', ['upload_id'])
+    op.drop_index('ix_bulk_search_rows_upload_status', table_name='bulk_search_rows')
@@ -0,0 +1,57 @@
+"""Store scraping job progress as a generated column.
+
+Revision ID: scraping_jobs_generated_progress
+Revises: url_hash_indexes
+Create Date: 2026-10-16 18:30:00.000000
+
+progress_percentage was computed in Python on every read. As a STORED
+generated column it is computed once per write by PostgreSQL and can be
+filtered and aggregated in SQL. The progress counters also get a
+non-negative CHECK constraint.
+
+Adding a stored generated column rewrites scraping_jobs under an ACCESS
+EXCLUSIVE lock; the table holds one row per job, so this is brief.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'scraping_jobs_generated_progress'
+down_revision: Union[str, None] = 'url_hash_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the generated progress column and counter constraint."""
+    op.add_column(
+        'scraping_jobs',
+        sa.Column(
+            'progress_percentage',
+            sa.Float(),
+            sa.Computed(
+                "CASE WHEN total_urls = 0 THEN 0 "
+                "ELSE urls_scraped::float / total_urls * 100 END",
+                persisted=True,
+            ),
+        ),
+    )
+
+    # Add NOT VALID first so validation only takes a SHARE UPDATE EXCLUSIVE lock
+    op.execute(
+        'ALTER TABLE scraping_jobs ADD CONSTRAINT ck_scraping_jobs_counters_non_negative '
+        'CHECK (total_urls >= 0 AND urls_scraped >= 0 AND urls_failed >= 0 '
+        'AND urls_skipped >= 0) NOT VALID'
+    )
+    op.execute(
+        'ALTER TABLE scraping_jobs VALIDATE CONSTRAINT ck_scraping_jobs_counters_non_negative'
+    )
+
+
+def downgrade() -> None:
+    """Drop the generated progress column and counter constraint."""
+    op.drop_constraint(
+        'ck_scraping_jobs_counters_non_negative', 'scraping_jobs', type_='check'
+    )
+    op.drop_column('scraping_jobs', 'progress_percentage')
@@ -0,0 +1,57 @@
+"""Index the unindexed ON DELETE SET NULL foreign keys.
+
+Revision ID: set_null_fk_indexes
+Revises: website_content_lz4_compression
+Create Date: 2026-10-16 16:00:00.000000
+
+Deleting a search query or a user makes PostgreSQL find the referencing
+rows to null out. bulk_search_rows.search_query_id and
+query_expansion_candidates.approved_by_user_id had no index, so every
+such delete scanned the whole child table. Partial indexes cover only
+the rows that actually reference a parent.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'set_null_fk_indexes'
+down_revision: Union[str, None] = 'website_content_lz4_compression'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FK_INDEXES = [
+    ('ix_bulk_search_rows_search_query_id', 'bulk_search_rows', 'search_query_id'),
+    (
+        'ix_query_expansion_candidates_approved_by_user_id',
+        'query_expansion_candidates',
+        'approved_by_user_id',
+    ),
+]
+
+
+def upgrade() -> None:
+    """Create partial indexes on the SET NULL foreign keys."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, column in FK_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_where=sa.text(f'{column} IS NOT NULL'),
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Drop the foreign key indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in FK_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
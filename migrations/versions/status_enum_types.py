@@ -0,0 +1,72 @@
+"""Store status columns as PostgreSQL enums.
+
+Revision ID: status_enum_types
+Revises: website_outbound_links
+Create Date: 2026-10-16 17:00:00.000000
+
+The status columns hold a handful of fixed values as varchar(20). Native
+enums store them in 4 bytes, shrink the status indexes and compare as
+integers, while clients keep reading and writing the string values.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'status_enum_types'
+down_revision: Union[str, None] = 'website_outbound_links'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROCESSING_STATUSES = ('pending', 'processing', 'completed', 'failed', 'cancelled')
+SCRAPE_STATUSES = ('success', 'failed', 'skipped')
+
+# (table, enum type, server default). A varchar default can't be cast
+# to the enum automatically, so it is dropped around the type change.
+STATUS_COLUMNS = [
+    ('search_sessions', 'processing_status', 'pending'),
+    ('search_queries', 'processing_status', 'pending'),
+    ('bulk_search_rows', 'processing_status', None),
+    ('scraping_jobs', 'processing_status', 'pending'),
+    ('website_content', 'scrape_status', None),
+]
+
+
+def _enum_values(values) -> str:
+    return ', '.join(f"'{value}'" for value in values)
+
+
+def upgrade() -> None:
+    """Create the enum types and convert the status columns."""
+    op.execute(f'CREATE TYPE processing_status AS ENUM ({_enum_values(PROCESSING_STATUSES)})')
+    op.execute(f'CREATE TYPE scrape_status AS ENUM ({_enum_values(SCRAPE_STATUSES)})')
+
+    for table, type_name, default in STATUS_COLUMNS:
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN status DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN status TYPE {type_name} '
+            f'USING status::{type_name}'
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN status "
+                f"SET DEFAULT '{default}'::{type_name}"
+            )
+
+
+def downgrade() -> None:
+    """Convert the status columns back to varchar and drop the types."""
+    for table, _, default in STATUS_COLUMNS:
+        if default is not None:
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN status DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN status TYPE varchar(20) '
+            f'USING status::text'
+        )
+        if default is not None:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN status SET DEFAULT '{default}'"
+            )
+
+    op.execute('DROP TYPE scrape_status')
+    op.execute('DROP TYPE processing_status')
@@ -0,0 +1,56 @@
+"""Index URL columns with hash indexes.
+
+Revision ID: url_hash_indexes
+Revises: status_enum_types
+Create Date: 2026-10-16 18:00:00.000000
+
+URL columns are only ever compared for equality, yet the existing
+website_content.url index is a B-tree over full URL strings, and
+websites.url / search_results.url (looked up once per scraped page)
+had no index in migrated databases at all. Hash indexes store a 4-byte
+hash per entry, so they stay a fraction of the size of a B-tree on
+100+ byte keys.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'url_hash_indexes'
+down_revision: Union[str, None] = 'status_enum_types'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+URL_INDEXES = [
+    ('ix_websites_url', 'websites'),
+    ('ix_website_content_url', 'website_content'),
+    ('ix_search_results_url', 'search_results'),
+]
+
+
+def upgrade() -> None:
+    """Replace URL B-tree indexes with hash indexes."""
+    # CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table in URL_INDEXES:
+            # Databases built with create_all have B-tree indexes here
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+            op.create_index(
+                name,
+                table,
+                ['url'],
+                postgresql_using='hash',
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Restore the website_content.url B-tree index."""
+    with op.get_context().autocommit_block():
+        for name, _ in URL_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+        op.create_index(
+            'ix_website_content_url',
+            'website_content',
+            ['url'],
+            postgresql_concurrently=True,
+        )
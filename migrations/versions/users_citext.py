@@ -0,0 +1,60 @@
+"""Make username and email case-insensitive with CITEXT.
+
+Revision ID: users_citext
+Revises: scraping_jobs_generated_progress
+Create Date: 2026-10-16 19:00:00.000000
+
+Converting the columns rebuilds ix_users_username and ix_users_email as
+case-insensitive unique indexes. The upgrade fails if two existing
+accounts differ only in case; resolve those first.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# Revision identifiers
+revision: str = 'users_citext'
+down_revision: Union[str, None] = 'scraping_jobs_generated_progress'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert users.username and users.email to CITEXT."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS citext')
+
+    for column in ('username', 'email'):
+        op.alter_column(
+            'users',
+            column,
+            type_=postgresql.CITEXT(),
+            existing_nullable=False,
+        )
+
+    # CITEXT has no length modifier; keep the old VARCHAR limits
+    op.create_check_constraint(
+        'ck_users_username_length', 'users', 'char_length(username) <= 50'
+    )
+    op.create_check_constraint(
+        'ck_users_email_length', 'users', 'char_length(email) <= 255'
+    )
+
+
+def downgrade() -> None:
+    """Convert users.username and users.email back to VARCHAR."""
+    op.drop_constraint('ck_users_email_length', 'users', type_='check')
+    op.drop_constraint('ck_users_username_length', 'users', type_='check')
+
+    op.alter_column(
+        'users',
+        'username',
+        type_=sa.String(length=50),
+        existing_nullable=False,
+    )
+    op.alter_column(
+        'users',
+        'email',
+        type_=sa.String(length=255),
+        existing_nullable=False,
+    )
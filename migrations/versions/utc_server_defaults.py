@@ -0,0 +1,67 @@
+"""Use UTC server-side defaults for the remaining timestamps.
+
+Revision ID: utc_server_defaults
+Revises: website_content_scrape_duration_float
+Create Date: 2026-10-16 15:00:00.000000
+
+Follows analysis_utc_server_defaults for every other model: the
+database fills created_at/updated_at instead of a Python-generated
+bound parameter per row. now() follows the session time zone, so the
+defaults are pinned to UTC to match the naive UTC values stored so far.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'utc_server_defaults'
+down_revision: Union[str, None] = 'website_content_scrape_duration_float'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+    ('search_sessions', 'created_at'),
+    ('search_sessions', 'updated_at'),
+    ('search_queries', 'created_at'),
+    ('search_queries', 'updated_at'),
+    ('search_results', 'created_at'),
+    ('websites', 'created_at'),
+    ('websites', 'updated_at'),
+    ('website_content', 'scraped_at'),
+    ('website_content', 'created_at'),
+    ('scraping_jobs', 'created_at'),
+    ('scraping_jobs', 'updated_at'),
+    ('network_exports', 'created_at'),
+    ('network_exports', 'updated_at'),
+    ('query_templates', 'created_at'),
+    ('query_templates', 'updated_at'),
+    ('queries_from_templates', 'created_at'),
+    ('query_expansion_candidates', 'created_at'),
+    ('bulk_search_uploads', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    """Set timezone('UTC', now()) as server default."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        )
+
+
+def downgrade() -> None:
+    """Restore now() server default."""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            server_default=sa.text('now()'),
+        )
@@ -0,0 +1,38 @@
+"""Compress website_content page bodies with LZ4.
+
+Revision ID: website_content_lz4_compression
+Revises: utc_server_defaults
+Create Date: 2026-10-16 15:30:00.000000
+
+html_content and extracted_text are TOASTed with pglz by default. LZ4
+(PostgreSQL 14+) compresses and decompresses several times faster at a
+similar ratio on HTML, which cuts CPU on scraping writes and on reads of
+the page bodies. Only newly written values use the new method; existing
+rows keep pglz until they are rewritten.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+# Revision identifiers
+revision: str = 'website_content_lz4_compression'
+down_revision: Union[str, None] = 'utc_server_defaults'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BODY_COLUMNS = ['html_content', 'extracted_text']
+
+
+def upgrade() -> None:
+    """Set LZ4 compression on the page body columns."""
+    for column in BODY_COLUMNS:
+        op.execute(
+            f'ALTER TABLE website_content ALTER COLUMN {column} SET COMPRESSION lz4'
+        )
+
+
+def downgrade() -> None:
+    """Restore the default (pglz) compression."""
+    for column in BODY_COLUMNS:
+        op.execute(
+            f'ALTER TABLE website_content ALTER COLUMN {column} SET COMPRESSION default'
+        )
@@ -0,0 +1,43 @@
+"""Store website_content.scrape_duration as double precision.
+
+Revision ID: website_content_scrape_duration_float
+Revises: parent_status_composite_indexes
+Create Date: 2026-10-16 14:30:00.000000
+
+The model maps scrape_duration to a float but the column was an integer,
+truncating sub-millisecond precision on every write and making
+AVG(scrape_duration) and percentile aggregates work on truncated values.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'website_content_scrape_duration_float'
+down_revision: Union[str, None] = 'parent_status_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Change scrape_duration to double precision."""
+    op.alter_column(
+        'website_content',
+        'scrape_duration',
+        type_=sa.Float(),
+        existing_type=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using='scrape_duration::double precision',
+    )
+
+
+def downgrade() -> None:
+    """Change scrape_duration back to integer milliseconds."""
+    op.alter_column(
+        'website_content',
+        'scrape_duration',
+        type_=sa.Integer(),
+        existing_type=sa.Float(),
+        existing_nullable=True,
+        postgresql_using='round(scrape_duration)::integer',
+    )
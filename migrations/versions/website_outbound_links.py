@@ -0,0 +1,64 @@
+"""Add website_outbound_links join table.
+
+Revision ID: website_outbound_links
+Revises: set_null_fk_indexes
+Create Date: 2026-10-16 16:30:00.000000
+
+Normalizes website_content.outbound_links into one row per link so
+link-domain aggregates are indexed SQL instead of unnesting JSON per
+page. Existing pages are backfilled from the JSON column, which stays as
+the per-page copy returned by the content API.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+# Revision identifiers
+revision: str = 'website_outbound_links'
+down_revision: Union[str, None] = 'set_null_fk_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create website_outbound_links and backfill it."""
+    op.create_table(
+        'website_outbound_links',
+        sa.Column('content_id', sa.Integer(), nullable=False),
+        sa.Column('rank', sa.Integer(), nullable=False),
+        sa.Column('target_url', sa.Text(), nullable=False),
+        sa.Column('target_domain', sa.String(255), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['content_id'], ['website_content.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('content_id', 'rank'),
+    )
+
+    # Backfill before indexing so the index is built once
+    op.execute("""
+        INSERT INTO website_outbound_links (content_id, rank, target_url, target_domain)
+        SELECT
+            wc.id,
+            link.ord - 1,
+            link.url,
+            left(coalesce(substring(link.url FROM '^[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)'), ''), 255)
+        FROM website_content wc
+        CROSS JOIN LATERAL jsonb_array_elements_text(wc.outbound_links)
+            WITH ORDINALITY AS link(url, ord)
+        WHERE jsonb_typeof(wc.outbound_links) = 'array'
+    """)
+
+    op.create_index(
+        'ix_website_outbound_links_target_domain',
+        'website_outbound_links',
+        ['target_domain'],
+    )
+
+
+def downgrade() -> None:
+    """Drop website_outbound_links."""
+    op.drop_index(
+        'ix_website_outbound_links_target_domain',
+        table_name='website_outbound_links',
+    )
+    op.drop_table('website_outbound_links')
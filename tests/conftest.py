@@ -1,14 +1,20 @@
 """Pytest configuration and fixtures."""
 import asyncio
-from typing import AsyncGenerator, Generator
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncGenerator, Callable, Generator
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.pool import NullPool
 
+# Fail tests on unplanned relationship lazy loads (N+1 queries). Must be
+# set before backend.config builds the settings.
+os.environ.setdefault("ORM_RAISE_ON_LAZY_LOAD", "true")
+
 from backend.config import settings
-from backend.database import Base, get_db
+from backend.database import Base, get_db, get_read_session_factory
 from backend.main import app
 from backend.models.user import User
 from backend.utils.auth import get_password_hash
@@ -70,7 +76,20 @@ def client(db_session: AsyncSession) -> TestClient:
     async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
         yield db_session
 
+    # Reads the service would run concurrently on separate sessions share
+    # the one test session here, so they take turns on it
+    read_lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def shared_read_session() -> AsyncGenerator[AsyncSession, None]:
+        async with read_lock:
+            yield db_session
+
+    def override_get_read_session_factory() -> Callable[[], AsyncContextManager[AsyncSession]]:
+        return shared_read_session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_session_factory] = override_get_read_session_factory
 
     with TestClient(app) as test_client:
         yield test_client
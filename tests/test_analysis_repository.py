@@ -0,0 +1,107 @@
+"""Tests for the analysis repository's per-job noun rollup."""
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.models.analysis import NounJobAggregate
+from backend.models.scraping import ScrapingJob
+from backend.models.search import SearchSession
+from backend.models.website import Website, WebsiteContent
+from backend.repositories.analysis_repository import AnalysisRepository
+
+
+def _noun(content_id: int, lemma: str, frequency: int, tfidf_score: float) -> dict:
+    """Build a noun dictionary as produced by the NLP pipeline."""
+    return {
+        "website_content_id": content_id,
+        "word": lemma,
+        "lemma": lemma,
+        "frequency": frequency,
+        "tfidf_score": tfidf_score,
+        "language": "en",
+    }
+
+
+async def _rollup(db_session: AsyncSession, job_id: int) -> dict:
+    """Read a job's noun_job_agg rows keyed by lemma."""
+    result = await db_session.execute(
+        select(NounJobAggregate).where(NounJobAggregate.scraping_job_id == job_id)
+    )
+    return {row.lemma: row for row in result.scalars().all()}
+
+
+@pytest.fixture
+async def job_contents(db_session: AsyncSession, test_user):
+    """Create a scraping job with two scraped contents."""
+    session = SearchSession(user_id=test_user.id, name="Test Session", status="completed")
+    db_session.add(session)
+    await db_session.flush()
+
+    job = ScrapingJob(
+        user_id=test_user.id,
+        session_id=session.id,
+        name="Test Scraping Job",
+        status="completed",
+    )
+    website = Website(url="https://example.com", domain="example.com")
+    db_session.add_all([job, website])
+    await db_session.flush()
+
+    contents = [
+        WebsiteContent(
+            website_id=website.id,
+            user_id=test_user.id,
+            scraping_job_id=job.id,
+            url=f"https://example.com/page{i}",
+            scrape_depth=1,
+            status="success",
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(contents)
+    await db_session.commit()
+    return job, contents
+
+
+class TestNounJobAggregates:
+    """Tests for AnalysisRepository.refresh_noun_job_aggregates."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_after_write_and_delete(self, db_session: AsyncSession, job_contents):
+        """Test the rollup follows noun inserts and analysis deletion."""
+        job, (first, second) = job_contents
+        repository = AnalysisRepository(db_session)
+
+        for content in (first, second):
+            await repository.create_analysis(
+                content_id=content.id,
+                extract_nouns=True,
+                extract_entities=False,
+                max_nouns=100,
+                min_frequency=1,
+            )
+        await repository.bulk_create_nouns([
+            _noun(first.id, "climate", 3, 0.5),
+            _noun(first.id, "policy", 1, 0.2),
+            _noun(second.id, "climate", 2, 0.3),
+        ])
+        await repository.refresh_noun_job_aggregates([job.id])
+
+        rollup = await _rollup(db_session, job.id)
+        assert set(rollup) == {"climate", "policy"}
+        assert rollup["climate"].total_frequency == 5
+        assert rollup["climate"].content_count == 2
+        assert rollup["climate"].avg_tfidf_score == pytest.approx(0.4)
+        assert rollup["policy"].total_frequency == 1
+        assert rollup["policy"].content_count == 1
+        assert rollup["policy"].avg_tfidf_score == pytest.approx(0.2)
+
+        assert await repository.delete_analysis(first.id)
+        await repository.refresh_noun_job_aggregates([job.id, None])
+
+        db_session.expire_all()
+        rollup = await _rollup(db_session, job.id)
+        assert set(rollup) == {"climate"}
+        assert rollup["climate"].total_frequency == 2
+        assert rollup["climate"].content_count == 1
+        assert rollup["climate"].avg_tfidf_score == pytest.approx(0.3)
@@ -6,10 +6,29 @@ Tests cover:
 - Metrics collection
 - Component health checks
 """
+import shutil
+import time
+
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, AsyncMock
-from backend.monitoring.health import HealthCheck, HealthStatus
+from prometheus_client import CollectorRegistry
+from backend.config import settings
+from backend.monitoring.health import (
+    HealthCheck,
+    HealthStatus,
+    _health_cache,
+    _total_tasks_processed,
+)
+from backend.monitoring.redis_metrics import RedisCollector
+
+
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    """Start every test without health results cached by an earlier one."""
+    _health_cache.clear()
+    yield
+    _health_cache.clear()
 
 
 @pytest.mark.asyncio
@@ -38,11 +57,37 @@ class TestHealthChecks:
 
     async def test_check_disk_space(self):
         """Test disk space check."""
-        result = await HealthCheck.check_disk_space()
+        sample = (time.monotonic(), shutil.disk_usage("/"))
+        with patch("backend.monitoring.health._disk_sample", sample):
+            result = await HealthCheck.check_disk_space()
         assert "status" in result
         assert "total_gb" in result["details"]
         assert "free_gb" in result["details"]
 
+    async def test_check_disk_space_not_sampled(self):
+        """Test disk space check before the sampler's first sample."""
+        with patch("backend.monitoring.health._disk_sample", None):
+            result = await HealthCheck.check_disk_space()
+        assert result["status"] == HealthStatus.DEGRADED
+        assert "warning" in result["details"]
+        assert "total_gb" not in result["details"]
+
+    @patch("backend.celery_app.celery_app")
+    async def test_check_celery_full_healthy(self, mock_celery_app):
+        """Test full Celery check reports workers and task totals."""
+        inspector = mock_celery_app.control.inspect.return_value
+        inspector.active.return_value = {"celery@worker1": []}
+        inspector.stats.return_value = {
+            "celery@worker1": {"total": {"backend.tasks.scraping_tasks.scrape_url": 3}}
+        }
+        result = await HealthCheck._check_celery_full()
+        assert result["status"] == HealthStatus.HEALTHY
+        assert result["details"]["active_workers"] == 1
+        assert result["details"]["total_tasks_processed"] == 3
+        mock_celery_app.control.inspect.assert_called_with(
+            timeout=settings.health_check_celery_inspect_timeout
+        )
+
     async def test_check_all(self):
         """Test comprehensive health check."""
         result = await HealthCheck.check_all()
@@ -52,6 +97,38 @@ class TestHealthChecks:
         assert "redis" in result["checks"]
 
 
+def test_total_tasks_processed():
+    """Test task totals are summed across workers from inspect().stats()."""
+    stats = {
+        "celery@worker1": {
+            "broker": {"hostname": "redis", "transport": "redis"},
+            "pid": 4211,
+            "pool": {"max-concurrency": 4, "processes": [4212, 4213, 4214, 4215]},
+            "total": {
+                "backend.tasks.search_tasks.execute_search_session": 12,
+                "backend.tasks.scraping_tasks.scrape_url": 340,
+            },
+            "uptime": 8213,
+        },
+        "celery@worker2": {
+            "pid": 4302,
+            "total": {"backend.tasks.analysis_tasks.analyze_content": 7},
+            "uptime": 8199,
+        },
+        "celery@worker3": {"pid": 4390, "total": {}, "uptime": 12},
+    }
+    assert _total_tasks_processed(stats) == 359
+    assert _total_tasks_processed({}) == 0
+
+
+def test_redis_collector_register_skips_redis():
+    """Test registering the Redis collector describes it without querying Redis."""
+    collector = RedisCollector()
+    with patch.object(collector, "client") as mock_client:
+        CollectorRegistry().register(collector)
+    mock_client.pipeline.assert_not_called()
+
+
 def test_health_endpoint(client: TestClient):
     """Test basic health endpoint."""
     response = client.get("/health")
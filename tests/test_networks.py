@@ -0,0 +1,62 @@
+"""Tests for network API endpoints."""
+from datetime import datetime
+
+import pytest
+
+from backend.models.network import NetworkExport
+
+
+@pytest.fixture
+async def networks(db_session, test_user):
+    """Create four networks sharing one created_at, so pages tie-break on id."""
+    created_at = datetime(2026, 1, 1, 12, 0, 0)
+    networks = [
+        NetworkExport(
+            user_id=test_user.id,
+            name=f"Network {i}",
+            type="search_website",
+            session_ids=[],
+            file_path=f"/tmp/network_{i}.gexf",
+            file_size=100,
+            node_count=10,
+            edge_count=20,
+            network_metadata={},
+            created_at=created_at,
+        )
+        for i in range(4)
+    ]
+    db_session.add_all(networks)
+    await db_session.commit()
+    return networks
+
+
+def test_list_networks_cursor_pages(client, auth_headers, networks):
+    """Test following next_cursor visits every network once and stops on the last page."""
+    response = client.get("/api/networks?per_page=2", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert data["next_cursor"] is not None
+    seen = [n["id"] for n in data["networks"]]
+
+    response = client.get(
+        "/api/networks",
+        headers=auth_headers,
+        params={"per_page": 2, "cursor": data["next_cursor"]},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] is None
+    # Exactly at the page boundary: no cursor to an empty page
+    assert data["next_cursor"] is None
+    seen += [n["id"] for n in data["networks"]]
+
+    assert seen == sorted((n.id for n in networks), reverse=True)
+
+
+def test_list_networks_invalid_cursor(client, auth_headers):
+    """Test a malformed cursor is rejected."""
+    response = client.get(
+        "/api/networks", headers=auth_headers, params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
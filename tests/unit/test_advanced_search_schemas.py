@@ -0,0 +1,23 @@
+"""Tests for advanced search request schemas."""
+import pytest
+from pydantic import ValidationError
+
+from backend.schemas.advanced_search import SessionComparisonRequest
+
+
+def test_session_comparison_dedupes_session_ids():
+    """Test repeated session IDs are dropped, keeping the first occurrence."""
+    request = SessionComparisonRequest(session_ids=[1, 1, 2])
+    assert request.session_ids == [1, 2]
+
+
+def test_session_comparison_keeps_order():
+    """Test distinct session IDs keep their order."""
+    request = SessionComparisonRequest(session_ids=[3, 1, 3, 2])
+    assert request.session_ids == [3, 1, 2]
+
+
+def test_session_comparison_rejects_single_distinct_id():
+    """Test a list with fewer than two distinct session IDs is rejected."""
+    with pytest.raises(ValidationError, match="At least 2 distinct session IDs"):
+        SessionComparisonRequest(session_ids=[1, 1])